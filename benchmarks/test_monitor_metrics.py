@@ -0,0 +1,57 @@
+import time
+
+import numpy as np
+import torch
+
+from pytorch_lightning import Callback, Trainer, seed_everything
+from tests.base import EvalModelTemplate
+
+
+class StepTimer(Callback):
+    """Adds ``num_metrics`` tensors to the callback metrics and times each training loop iteration"""
+
+    def __init__(self, num_metrics):
+        self.num_metrics = num_metrics
+        self.step_times = []
+        self._last_start = None
+
+    def on_train_epoch_start(self, trainer, pl_module):
+        trainer.logger_connector.callback_metrics.update(
+            {f'metric_{i}': torch.tensor(float(i)) for i in range(self.num_metrics)}
+        )
+
+    def on_train_batch_start(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+        now = time.perf_counter()
+        if self._last_start is not None:
+            self.step_times.append(now - self._last_start)
+        self._last_start = now
+
+
+def _median_step_time(tmpdir, num_metrics, num_steps):
+    seed_everything(1)
+    timer = StepTimer(num_metrics)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=num_steps,
+        limit_val_batches=0,
+        progress_bar_refresh_rate=0,
+        weights_summary=None,
+        logger=False,
+        checkpoint_callback=False,
+        callbacks=[timer],
+    )
+    trainer.fit(EvalModelTemplate())
+    return np.median(timer.step_times)
+
+
+def test_monitor_metrics_overhead(tmpdir, num_metrics=2000, num_steps=50):
+    """
+    Verify that the per step time of the training loop does not grow with the number of callback metrics,
+    which are only read when a scheduler monitors one of them
+    """
+    few_metrics = _median_step_time(tmpdir, 0, num_steps)
+    many_metrics = _median_step_time(tmpdir, num_metrics, num_steps)
+
+    # copying 2000 tensors every step takes several times the step time of the template model
+    assert many_metrics < 1.5 * few_metrics
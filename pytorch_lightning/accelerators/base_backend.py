@@ -1,9 +1,9 @@
 import torch
-from typing import Any
+from typing import Any, Optional
 from pytorch_lightning.utilities.apply_func import move_data_to_device
 from pytorch_lightning.utilities import AMPType, rank_zero_warn
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
-import math
+from pytorch_lightning.utilities.grads import tensor_norms, total_norm
 
 
 try:
@@ -54,6 +54,10 @@ class Accelerator(object):
     def process_dataloader(self, dataloader):
         return dataloader
 
+    def prefetch_device(self) -> Optional[torch.device]:
+        """The device batches can be moved to before their step, ``None`` keeps prefetched batches on the host."""
+        return None
+
     def backward(self, closure_loss, optimizer, opt_idx):
         model_ref = self.trainer.get_model()
 
@@ -145,20 +149,18 @@ class Accelerator(object):
             parameters = [parameters]
         parameters = list(filter(lambda p: p.grad is not None, parameters))
 
-        if norm_type == math.inf:
-            total_norm = max(p.grad.data.abs().max() for p in parameters)
-        else:
-            device = parameters[0].device
-            out = torch.empty(len(parameters), device=device)
-            for i, p in enumerate(parameters):
-                torch.norm(p.grad.data.to(device), norm_type, out=out[i])
-            total_norm = torch.norm(out, norm_type)
+        if len(parameters) == 0:
+            return
+
+        device = parameters[0].device
+        grads = [p.grad.data for p in parameters]
+        grad_norm = total_norm(tensor_norms(grads, norm_type, device=device), norm_type)
 
         eps = EPSILON_FP16 if self.trainer.precision == 16 else EPSILON
-        clip_coef = torch.tensor(max_norm, device=device) / (total_norm + eps)
+        clip_coef = torch.tensor(max_norm, device=device) / (grad_norm + eps)
         clip_coef = torch.min(clip_coef, torch.ones_like(clip_coef))
-        for p in parameters:
-            p.grad.data.mul_(clip_coef.to(p.grad.data.device))
+        for g in grads:
+            g.mul_(clip_coef.to(g.device))
 
     def on_train_epoch_end(self):
         pass
@@ -257,6 +257,12 @@ class DDPBackend(Accelerator):
         if self.trainer.global_rank == 0 and self.trainer.distributed_backend not in ['ddp_spawn', 'ddp_cpu']:
             return results
 
+    def prefetch_device(self):
+        # the model lives on a single GPU per process
+        if self.trainer.on_gpu:
+            return torch.device('cuda', self.trainer.root_gpu)
+        return None
+
     def training_step(self, args):
         if self.trainer.amp_backend == AMPType.NATIVE:
             with torch.cuda.amp.autocast():
@@ -181,6 +181,12 @@ class DDPSpawnBackend(Accelerator):
         # clean up memory
         torch.cuda.empty_cache()
 
+    def prefetch_device(self):
+        # the model lives on a single GPU per process
+        if self.trainer.on_gpu:
+            return torch.device('cuda', self.trainer.root_gpu)
+        return None
+
     def training_step(self, args):
         if self.trainer.amp_backend == AMPType.NATIVE:
             with torch.cuda.amp.autocast():
@@ -109,14 +109,22 @@ class GPUBackend(Accelerator):
         return output
 
     def to_device(self, batch):
-        gpu_id = 0
-        if isinstance(self.trainer.data_parallel_device_ids, list):
-            gpu_id = self.trainer.data_parallel_device_ids[0]
+        gpu_id = self._gpu_id()
 
         # Don't copy the batch since there is a single gpu that the batch could
         # be referenced from and if there are multiple optimizers the batch will
         # wind up copying it to the same device repeatedly.
-        return self.batch_to_device(batch, gpu_id)
+        with self.trainer.profiler.profile('transfer_batch_to_device'):
+            return self.batch_to_device(batch, gpu_id)
+
+    def prefetch_device(self):
+        return torch.device('cuda', self._gpu_id())
+
+    def _gpu_id(self):
+        gpu_id = 0
+        if isinstance(self.trainer.data_parallel_device_ids, list):
+            gpu_id = self.trainer.data_parallel_device_ids[0]
+        return gpu_id
 
     def _setup_nvidia_apex(self, model: LightningModule):
         model, optimizers = model.configure_apex(amp, model, self.trainer.optimizers, self.trainer.amp_level)
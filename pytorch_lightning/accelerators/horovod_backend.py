@@ -121,7 +121,8 @@ class HorovodBackend(Accelerator):
     def training_step(self, args):
         if self.trainer.on_gpu:
             batch = args[0]
-            batch = self.batch_to_device(batch, hvd.local_rank())
+            with self.trainer.profiler.profile('transfer_batch_to_device'):
+                batch = self.batch_to_device(batch, hvd.local_rank())
             args[0] = batch
 
         if self.trainer.amp_backend == AMPType.NATIVE:
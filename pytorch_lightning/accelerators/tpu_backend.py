@@ -176,7 +176,8 @@ class TPUBackend(Accelerator):
             )
         device = xm.xla_device(self.trainer.tpu_id)
 
-        return self.batch_to_device(batch, device)
+        with self.trainer.profiler.profile('transfer_batch_to_device'):
+            return self.batch_to_device(batch, device)
 
     def __save_end_of_training_weights(self, model: LightningModule, trainer):
         # when training ends on these platforms dump weights to get out of the main process
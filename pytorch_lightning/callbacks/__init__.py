@@ -7,6 +7,7 @@ from pytorch_lightning.callbacks.lr_logger import LearningRateLogger
 from pytorch_lightning.callbacks.lr_monitor import LearningRateMonitor
 from pytorch_lightning.callbacks.model_checkpoint import ModelCheckpoint
 from pytorch_lightning.callbacks.progress import ProgressBar, ProgressBarBase
+from pytorch_lightning.callbacks.step_time_monitor import StepTimeMonitor
 
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     'ModelCheckpoint',
     'ProgressBar',
     'ProgressBarBase',
+    'StepTimeMonitor',
 ]
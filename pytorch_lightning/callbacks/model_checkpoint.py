@@ -22,6 +22,7 @@ Automatically save model checkpoints during training.
 
 import os
 import re
+from concurrent.futures import Future
 from typing import Optional
 
 import numpy as np
@@ -30,7 +31,7 @@ import torch
 from pytorch_lightning import _logger as log
 from pytorch_lightning.callbacks.base import Callback
 from pytorch_lightning.utilities import rank_zero_warn, rank_zero_only
-from pytorch_lightning.utilities.cloud_io import get_filesystem
+from pytorch_lightning.utilities.cloud_io import get_filesystem, link_or_copy
 
 
 class ModelCheckpoint(Callback):
@@ -155,6 +156,10 @@ class ModelCheckpoint(Callback):
         self.best_model_path = ''
         self.save_function = None
         self.warned_result_obj = False
+        # checkpoints being written in the background, {filepath: future}
+        self._pending_saves = {}
+        # replaced top-k checkpoints which are removed once their successor is written, [(future, filepath)]
+        self._pending_deletes = []
 
         torch_inf = torch.tensor(np.Inf)
         mode_dict = {
@@ -197,10 +202,45 @@ class ModelCheckpoint(Callback):
 
         # delegate the saving to the model
         if self.save_function is not None:
-            self.save_function(filepath, self.save_weights_only)
+            saved = self.save_function(filepath, self.save_weights_only)
         else:
             raise ValueError(".save_function() not set")
 
+        if isinstance(saved, Future):
+            self._pending_saves[filepath] = saved
+        return saved
+
+    def _save_models(self, filepaths, trainer, pl_module):
+        """Saves the checkpoint once and makes it available under all other paths without serializing it again."""
+        src = filepaths[0]
+        saved = self._save_model(src, trainer, pl_module)
+
+        for dst in filepaths[1:]:
+            if isinstance(saved, Future) and trainer.checkpoint_writer is not None:
+                # the copy is queued behind the write of the source checkpoint
+                trainer.dev_debugger.track_checkpointing_history(dst)
+                self._pending_saves[dst] = trainer.checkpoint_writer.submit(link_or_copy, src, dst)
+            elif self._fs.exists(src):
+                trainer.dev_debugger.track_checkpointing_history(dst)
+                link_or_copy(src, dst)
+            else:
+                self._save_model(dst, trainer, pl_module)
+        return saved
+
+    def _is_pending(self, filepath):
+        self._pending_saves = {k: f for k, f in self._pending_saves.items() if not f.done()}
+        return filepath in self._pending_saves
+
+    def _flush_pending_deletes(self, wait: bool = False):
+        """Removes replaced checkpoints whose successor is durably written, optionally waiting for the writes."""
+        remaining = []
+        for future, filepath in self._pending_deletes:
+            if not wait and not future.done():
+                remaining.append((future, filepath))
+            elif future.exception() is None:
+                self._del_model(filepath)
+        self._pending_deletes = remaining
+
     def check_monitor_top_k(self, current):
         less_than_k_models = len(self.best_k_models) < self.save_top_k
         if less_than_k_models:
@@ -322,6 +362,8 @@ class ModelCheckpoint(Callback):
         if trainer.running_sanity_check:
             return
 
+        self._flush_pending_deletes()
+
         # TODO: remove when dict results are deprecated
         self.__warn_deprecated_monitor_key()
 
@@ -348,11 +390,16 @@ class ModelCheckpoint(Callback):
         ckpt_name_metrics = trainer.logger_connector.logged_metrics
         filepath = self.format_checkpoint_name(epoch, ckpt_name_metrics)
         version_cnt = 0
-        while self._fs.exists(filepath):
+        while self._fs.exists(filepath) or self._is_pending(filepath):
             filepath = self.format_checkpoint_name(epoch, ckpt_name_metrics, ver=version_cnt)
             # this epoch called before
             version_cnt += 1
 
+        # `last.ckpt` is written together with the monitored checkpoint when both are saved
+        last_filepath = None
+        if self.save_last:
+            last_filepath = os.path.join(self.dirpath, self.prefix + ModelCheckpoint.CHECKPOINT_NAME_LAST)
+
         if self.save_top_k != -1:
             current = metrics.get(self.monitor)
 
@@ -369,7 +416,8 @@ class ModelCheckpoint(Callback):
                     f'Can save best model only with {self.monitor} available, skipping.', RuntimeWarning
                 )
             elif self.check_monitor_top_k(current):
-                self._do_check_save(filepath, current, epoch, trainer, pl_module)
+                self._do_check_save(filepath, current, epoch, trainer, pl_module, last_filepath)
+                last_filepath = None
             elif self.verbose > 0:
                 log.info(f'\nEpoch {epoch:05d}: {self.monitor}  was not in top {self.save_top_k}')
 
@@ -378,13 +426,17 @@ class ModelCheckpoint(Callback):
                 log.info(f'\nEpoch {epoch:05d}: saving model to {filepath}')
 
             assert trainer.global_rank == 0, 'tried to make a checkpoint from non global_rank=0'
-            self._save_model(filepath, trainer, pl_module)
+            self._save_models(self._with_last(filepath, last_filepath), trainer, pl_module)
+            last_filepath = None
 
-        if self.save_last:
-            filepath = os.path.join(self.dirpath, self.prefix + ModelCheckpoint.CHECKPOINT_NAME_LAST)
-            self._save_model(filepath, trainer, pl_module)
+        if last_filepath is not None:
+            self._save_model(last_filepath, trainer, pl_module)
+
+    @staticmethod
+    def _with_last(filepath, last_filepath):
+        return [filepath] if last_filepath is None else [filepath, last_filepath]
 
-    def _do_check_save(self, filepath, current, epoch, trainer, pl_module):
+    def _do_check_save(self, filepath, current, epoch, trainer, pl_module, last_filepath=None):
         # remove kth
 
         del_list = []
@@ -410,12 +462,22 @@ class ModelCheckpoint(Callback):
                 f'\nEpoch {epoch:05d}: {self.monitor} reached'
                 f' {current:0.5f} (best {self.best_model_score:0.5f}), saving model to'
                 f' {filepath} as top {self.save_top_k}')
-        self._save_model(filepath, trainer, pl_module)
+        saved = self._save_models(self._with_last(filepath, last_filepath), trainer, pl_module)
 
         for cur_path in del_list:
-            if cur_path != filepath:
+            if cur_path == filepath:
+                continue
+            if isinstance(saved, Future):
+                # keep the replaced checkpoint until the new one is on disk
+                self._pending_deletes.append((saved, cur_path))
+            else:
                 self._del_model(cur_path)
 
+    @rank_zero_only
+    def on_train_end(self, trainer, pl_module):
+        self._flush_pending_deletes(wait=True)
+        self._pending_saves = {}
+
     def on_save_checkpoint(self, trainer, pl_module):
         return {
             'best_model_score': self.best_model_score,
@@ -0,0 +1,161 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Step Time Monitor
+=================
+
+Breaks the training step time down to tell input bound from compute bound training.
+
+"""
+
+from collections import deque
+from typing import Dict, Optional
+
+from pytorch_lightning.callbacks.base import Callback
+from pytorch_lightning.profiler import StepTimelineProfiler
+from pytorch_lightning.utilities import rank_zero_only, rank_zero_warn
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+
+
+class StepTimeMonitor(Callback):
+    r"""
+    Splits the wall time of every training step into data wait, host to device transfer, forward,
+    backward, optimizer, logging and hook overhead, and logs the percentage of each category over
+    the last ``window`` steps. Steps which spend more than ``data_wait_threshold`` of their time
+    waiting for the next batch are flagged as input bound.
+
+    The callback wraps the trainer's profiler in a
+    :class:`~pytorch_lightning.profiler.StepTimelineProfiler` during training, the configured
+    profiler keeps receiving all actions.
+
+    Args:
+        window: number of steps the logged percentages are computed over. Default: ``50``.
+        logging_interval: log every n training steps, defaults to ``Trainer(row_log_interval)``.
+        data_wait_threshold: fraction of the step time spent waiting for data above which a step
+            is flagged as input bound. Default: ``0.5``.
+        synchronize: set to ``True`` to wait for the GPU at every profiled action, which attributes
+            asynchronous kernels to the right category but slows training down. Default: ``False``.
+
+    Example::
+
+        >>> from pytorch_lightning import Trainer
+        >>> from pytorch_lightning.callbacks import StepTimeMonitor
+        >>> step_time_monitor = StepTimeMonitor()
+        >>> trainer = Trainer(callbacks=[step_time_monitor])
+
+    Logs ``step_time/{category}`` as percentage of the step time, ``step_time/step (ms)`` as the mean step
+    time and ``step_time/input_bound_steps`` as percentage of input bound steps in the window.
+    """
+
+    def __init__(
+            self,
+            window: int = 50,
+            logging_interval: Optional[int] = None,
+            data_wait_threshold: float = 0.5,
+            synchronize: bool = False,
+    ):
+        if window < 1:
+            raise MisconfigurationException(f'`window` must be a positive integer, got {window}.')
+        self.window = window
+        self.logging_interval = logging_interval
+        self.data_wait_threshold = data_wait_threshold
+        self.synchronize = synchronize
+
+        self.steps = deque(maxlen=window)
+        self.num_input_bound_steps = 0
+        self._profiler = None
+        self._wrapped_profiler = False
+        self._warned_input_bound = False
+
+    def on_train_start(self, trainer, pl_module):
+        if not trainer.logger:
+            raise MisconfigurationException(
+                'Cannot use StepTimeMonitor callback with Trainer that has no logger.'
+            )
+
+        self._wrapped_profiler = not isinstance(trainer.profiler, StepTimelineProfiler)
+        if self._wrapped_profiler:
+            trainer.profiler = StepTimelineProfiler(trainer.profiler, synchronize=self.synchronize)
+        self._profiler = trainer.profiler
+
+    def on_train_end(self, trainer, pl_module):
+        if self._wrapped_profiler and trainer.profiler is self._profiler:
+            trainer.profiler = self._profiler.profiler
+        self._profiler = None
+
+    def on_train_epoch_start(self, trainer, pl_module):
+        # the time between epochs is not part of a step
+        self._reset_step()
+
+    def on_validation_end(self, trainer, pl_module):
+        # validation runs between two training steps
+        self._reset_step()
+
+    def on_train_batch_end(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+        if self._profiler is None:
+            return
+
+        step = self._profiler.end_step()
+        self.steps.append(step)
+        if step['total'] > 0 and step['data_wait'] / step['total'] > self.data_wait_threshold:
+            self.num_input_bound_steps += 1
+
+        logging_interval = self.logging_interval or trainer.row_log_interval
+        if (batch_idx + 1) % logging_interval == 0:
+            self._log_breakdown(trainer)
+
+    def breakdown(self) -> Dict[str, float]:
+        """Percentage of the step time spent in each category over the last ``window`` steps."""
+        total = sum(step['total'] for step in self.steps)
+        if total <= 0:
+            return {}
+        return {
+            category: 100 * sum(step[category] for step in self.steps) / total
+            for category in StepTimelineProfiler.CATEGORIES
+        }
+
+    def input_bound_fraction(self) -> float:
+        """Fraction of the last ``window`` steps which were input bound."""
+        if not self.steps:
+            return 0.0
+        input_bound = [
+            step for step in self.steps
+            if step['total'] > 0 and step['data_wait'] / step['total'] > self.data_wait_threshold
+        ]
+        return len(input_bound) / len(self.steps)
+
+    @rank_zero_only
+    def _log_breakdown(self, trainer):
+        breakdown = self.breakdown()
+        if not breakdown:
+            return
+
+        stats = {f'step_time/{category}': value for category, value in breakdown.items()}
+        stats['step_time/step (ms)'] = 1000 * sum(step['total'] for step in self.steps) / len(self.steps)
+        input_bound_fraction = self.input_bound_fraction()
+        stats['step_time/input_bound_steps'] = 100 * input_bound_fraction
+        trainer.logger.log_metrics(stats, step=trainer.global_step)
+
+        if input_bound_fraction > 0.5 and len(self.steps) == self.window and not self._warned_input_bound:
+            self._warned_input_bound = True
+            rank_zero_warn(
+                f'{input_bound_fraction:.0%} of the last {self.window} training steps spent most of their time'
+                f' waiting for data ({breakdown["data_wait"]:.1f}% of the step time). Training is input bound,'
+                ' consider more dataloader workers or `Trainer(prefetch_batches)`.'
+            )
+
+    def _reset_step(self):
+        if self._profiler is not None:
+            self._profiler.reset_step()
@@ -15,42 +15,56 @@
 """
 Module to describe gradients
 """
-from typing import Dict, Union
+from collections import OrderedDict
+from typing import Dict, Optional, Union
 
 import torch
 from torch.nn import Module
 
+from pytorch_lightning.utilities.grads import tensor_norms, total_norm
+
 
 class GradInformation(Module):
 
-    def grad_norm(self, norm_type: Union[float, int, str]) -> Dict[str, float]:
+    def grad_norm(self, norm_type: Union[float, int, str], group_depth: Optional[int] = None) -> Dict[str, float]:
         """Compute each parameter's gradient's norm and their overall norm.
 
         The overall norm is computed over all gradients together, as if they
-        were concatenated into a single vector.
+        were concatenated into a single vector. All norms are computed on the
+        device and copied to the host at once.
 
         Args:
             norm_type: The type of the used p-norm, cast to float if necessary.
                 Can be ``'inf'`` for infinity norm.
+            group_depth: If set, parameters are grouped by the first ``group_depth``
+                components of their name (e.g. ``1`` groups ``layer.0.weight`` and
+                ``layer.1.bias`` into ``layer``) and one norm is reported per group.
 
         Return:
-            norms: The dictionary of p-norms of each parameter's gradient and
-                a special entry for the total p-norm of the gradients viewed
+            norms: The dictionary of p-norms of each parameter's (or group's) gradient
+                and a special entry for the total p-norm of the gradients viewed
                 as a single vector.
         """
         norm_type = float(norm_type)
 
-        norms, all_norms = {}, []
+        names, grads = [], []
         for name, p in self.named_parameters():
             if p.grad is None:
                 continue
+            names.append(name)
+            grads.append(p.grad.data)
 
-            param_norm = float(p.grad.data.norm(norm_type))
-            norms[f'grad_{norm_type}_norm_{name}'] = round(param_norm, 3)
-
-            all_norms.append(param_norm)
+        norms = tensor_norms(grads, norm_type)
+        if group_depth is not None and len(names) > 0:
+            groups = OrderedDict()
+            for i, name in enumerate(names):
+                groups.setdefault('.'.join(name.split('.')[:group_depth]), []).append(i)
+            names = list(groups)
+            norms = torch.stack([total_norm(norms[idx], norm_type) for idx in groups.values()])
 
-        total_norm = float(torch.tensor(all_norms).norm(norm_type))
-        norms[f'grad_{norm_type}_norm_total'] = round(total_norm, 3)
+        # a single device to host transfer for all norms
+        values = torch.cat([norms, total_norm(norms, norm_type).view(1)]).tolist()
 
-        return norms
+        out = {f'grad_{norm_type}_norm_{name}': round(value, 3) for name, value in zip(names, values)}
+        out[f'grad_{norm_type}_norm_total'] = round(values[-1], 3)
+        return out
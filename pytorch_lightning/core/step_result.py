@@ -14,13 +14,41 @@
 
 import numbers
 from copy import copy
+from functools import lru_cache
 from typing import Optional, Dict, Union, Sequence, Callable, MutableMapping, Any, List, Tuple
 
 import torch
 from torch import Tensor
 import os
 
-from pytorch_lightning.metrics.converters import sync_ddp_if_available
+from pytorch_lightning.metrics.converters import DDPSyncCoordinator, SyncHandle
+
+_USING_RESULT_OBJ = False
+
+
+@lru_cache(maxsize=1024)
+def _interned_meta_options(
+    prog_bar: bool,
+    logger: bool,
+    on_step: bool,
+    on_epoch: bool,
+    reduce_fx: Callable,
+    tbptt_reduce_fx: Callable,
+    tbptt_pad_token: int,
+) -> dict:
+    """
+    The meta options of a logged key. All results logging keys with the same options share
+    the returned dict, so it must not be mutated.
+    """
+    return dict(
+        prog_bar=prog_bar,
+        logger=logger,
+        on_step=on_step,
+        on_epoch=on_epoch,
+        reduce_fx=reduce_fx,
+        tbptt_reduce_fx=tbptt_reduce_fx,
+        tbptt_pad_token=tbptt_pad_token,
+    )
 
 
 class Result(Dict):
@@ -35,7 +63,10 @@ class Result(Dict):
         super().__init__()
 
         # temporary until dict results are deprecated
-        os.environ['PL_USING_RESULT_OBJ'] = '1'
+        global _USING_RESULT_OBJ
+        if not _USING_RESULT_OBJ:
+            os.environ['PL_USING_RESULT_OBJ'] = '1'
+            _USING_RESULT_OBJ = True
 
         if early_stop_on is not None:
             self.early_stop_on = early_stop_on
@@ -51,13 +82,21 @@ class Result(Dict):
         if minimize is not None and checkpoint_on is None:
             self.checkpoint_on = minimize.detach()
 
-        self['meta'] = {'_internal': {'_reduce_on_epoch': False, 'batch_sizes': []}}
+        self['meta'] = {'_internal': {'_reduce_on_epoch': False, 'batch_sizes': [], '_version': 0}}
+        # the last logged value per meta key, kept out of the shared meta options
+        self.__dict__['_meta_values'] = {}
 
     def __getitem__(self, key: Union[str, Any]) -> Any:
         try:
-            return super().__getitem__(key)
+            value = super().__getitem__(key)
         except KeyError:
-            return super().__getitem__(f'step_{key}')
+            value = super().__getitem__(f'step_{key}')
+
+        # values logged with sync_dist are only waited for when read
+        if isinstance(value, SyncHandle):
+            self.sync_pending()
+            value = value.wait()
+        return value
 
     def __getattr__(self, key: str) -> Any:
         try:
@@ -122,9 +161,11 @@ class Result(Dict):
         if not enable_graph and isinstance(value, torch.Tensor):
             value = value.detach()
 
-        # sync across ddp
+        # sync across ddp. All values of this result are reduced together on `sync_pending`
         if sync_dist and isinstance(value, (torch.Tensor, numbers.Number)):
-            value = sync_ddp_if_available(value, group=sync_dist_group, reduce_op=sync_dist_op)
+            if '_sync_coordinator' not in self.__dict__:
+                object.__setattr__(self, '_sync_coordinator', DDPSyncCoordinator())
+            value = self._sync_coordinator.enqueue(value, group=sync_dist_group, reduce_op=sync_dist_op)
 
         if 'meta' not in self:
             self.__setitem__('meta', {})
@@ -189,24 +230,52 @@ class Result(Dict):
         tbptt_pad_token: int,
         tbptt_reduce_fx: Callable,
     ):
-        # set the meta for the item
-        meta_value = value
-        meta = dict(
-            prog_bar=prog_bar,
-            logger=logger,
-            on_step=on_step,
-            on_epoch=on_epoch,
-            reduce_fx=reduce_fx,
-            value=meta_value,
-            tbptt_reduce_fx=tbptt_reduce_fx,
-            tbptt_pad_token=tbptt_pad_token,
-        )
+        # the same keys are logged with the same options every step, they share one interned meta
+        options = (prog_bar, logger, on_step, on_epoch, reduce_fx, tbptt_reduce_fx, tbptt_pad_token)
+        try:
+            options = _interned_meta_options(*options)
+        except TypeError:
+            # unhashable reduce functions are not interned
+            options = _interned_meta_options.__wrapped__(*options)
 
-        self['meta'][name] = meta
+        meta = self['meta']
+        _internal = meta['_internal']
+        if meta.get(name) is not options:
+            meta[name] = options
+            _internal['_version'] = _internal.get('_version', 0) + 1
+        self.__dict__.setdefault('_meta_values', {})[name] = value
 
         # track whether any input requires reduction on epoch end
-        _internal = self['meta']['_internal']
-        _internal['_reduce_on_epoch'] = max(_internal['_reduce_on_epoch'], on_epoch)
+        if on_epoch:
+            _internal['_reduce_on_epoch'] = True
+
+    def sync_pending(self, wait: bool = True):
+        """
+        Reduces all values logged with ``sync_dist=True`` across processes.
+        Values sharing dtype, device, group and reduction are reduced by a single collective.
+
+        Args:
+            wait: if ``False``, only starts the asynchronous reductions.
+                The values are then waited for when they are read.
+        """
+        coordinator = self.__dict__.get('_sync_coordinator')
+        if coordinator is None:
+            return
+
+        if not wait:
+            coordinator.flush()
+            return
+
+        coordinator.wait()
+        del self.__dict__['_sync_coordinator']
+
+        for k, v in self.items():
+            if isinstance(v, SyncHandle):
+                super().__setitem__(k, v.wait())
+        meta_values = self.__dict__.get('_meta_values', {})
+        for k, v in meta_values.items():
+            if isinstance(v, SyncHandle):
+                meta_values[k] = v.wait()
 
     def track_batch_size(self, batch_size):
         meta = self['meta']
@@ -221,68 +290,66 @@ class Result(Dict):
 
         return result
 
-    def get_batch_log_metrics(self) -> dict:
+    def _metric_keys(self, view: str) -> List[str]:
         """
-        Gets the metrics to log at the end of the batch step
+        Keys of the metrics in one of the ``batch_log``, ``epoch_log``, ``batch_pbar`` and ``epoch_pbar``
+        views. The views are computed once per meta and cached until a key is logged or renamed.
         """
-        result = {}
-
         meta = self['meta']
-        for k, options in meta.items():
-            if k == '_internal':
-                continue
-            if options['logger'] and options['on_step']:
-                result[k] = self[k]
-        return result
+        # results gathered from other results share their meta, the version tracks changes made through any of them
+        version = meta.get('_internal', {}).get('_version', 0)
+        cached = self.__dict__.get('_metric_views')
+        if cached is None or cached[0] is not meta or cached[1] != version:
+            views = {'batch_log': [], 'epoch_log': [], 'batch_pbar': [], 'epoch_pbar': []}
+            for k, options in meta.items():
+                if k == '_internal':
+                    continue
+                if options['logger']:
+                    if options['on_step']:
+                        views['batch_log'].append(k)
+                    if options['on_epoch']:
+                        views['epoch_log'].append(k)
+                if options['prog_bar']:
+                    if options['on_step']:
+                        views['batch_pbar'].append(k)
+                    if options['on_epoch']:
+                        views['epoch_pbar'].append(k)
+            cached = (meta, version, views)
+            self.__dict__['_metric_views'] = cached
+        return cached[2][view]
 
-    def get_epoch_log_metrics(self) -> dict:
+    def get_batch_log_metrics(self) -> dict:
         """
         Gets the metrics to log at the end of the batch step
         """
-        result = {}
+        return {k: self[k] for k in self._metric_keys('batch_log')}
 
-        meta = self['meta']
-        for k, options in meta.items():
-            if k == '_internal':
-                continue
-            if options['logger'] and options['on_epoch']:
-                result[k] = self[k]
-        return result
+    def get_epoch_log_metrics(self) -> dict:
+        """
+        Gets the metrics to log at the end of the epoch
+        """
+        return {k: self[k] for k in self._metric_keys('epoch_log')}
 
     def get_epoch_pbar_metrics(self):
         """
-        Gets the metrics to log at the end of the batch step
+        Gets the metrics to show in the progress bar at the end of the epoch
         """
-        result = {}
-
-        meta = self['meta']
-        for k, options in meta.items():
-            if k == '_internal':
-                continue
-            if options['prog_bar'] and options['on_epoch']:
-                result[k] = self[k]
-        return result
+        return {k: self[k] for k in self._metric_keys('epoch_pbar')}
 
     def get_batch_pbar_metrics(self):
         """
-        Gets the metrics to log at the end of the batch step
+        Gets the metrics to show in the progress bar at the end of the batch step
         """
-        result = {}
-
-        meta = self['meta']
-        for k, options in meta.items():
-            if k == '_internal':
-                continue
-            if options['prog_bar'] and options['on_step']:
-                result[k] = self[k]
-        return result
+        return {k: self[k] for k in self._metric_keys('batch_pbar')}
 
     def detach(self):
+        self.sync_pending()
         for k, v in self.items():
             if isinstance(v, torch.Tensor):
                 self.__setitem__(k, v.detach())
 
     def __repr__(self):
+        self.sync_pending()
         self_copy = self.copy()
 
         if 'meta' in self_copy:
@@ -291,17 +358,20 @@ class Result(Dict):
         return str(self_copy)
 
     def __str__(self):
+        self.sync_pending()
         copy = self.copy()
         del copy['meta']
 
         return str(copy)
 
     def __copy__(self):
+        self.sync_pending()
         newone = type(self)()
         for k, v in self.items():
             if isinstance(v, torch.Tensor):
                 v = v.detach()
             newone[k] = copy(v)
+        newone.__dict__['_meta_values'] = dict(self.__dict__.get('_meta_values', {}))
         return newone
 
     @classmethod
@@ -343,7 +413,7 @@ class Result(Dict):
 
                 # also update the result
                 if meta and not is_reserved:
-                    meta[name]['value'] = padded
+                    result.__dict__['_meta_values'][name] = padded
         if meta:
             result['meta'] = meta
         return result
@@ -397,6 +467,7 @@ class Result(Dict):
         return result
 
     def dp_reduce(self):
+        self.sync_pending()
         for k, value in self.items():
             if k == 'meta':
                 continue
@@ -428,10 +499,18 @@ class Result(Dict):
             # map meta
             meta[dest] = meta[source]
             del meta[source]
+            meta_values = self.__dict__.get('_meta_values', {})
+            if source in meta_values:
+                meta_values[dest] = meta_values.pop(source)
+        _internal = meta['_internal']
+        _internal['_version'] = _internal.get('_version', 0) + 1
 
 
 def recursive_gather(outputs: Sequence[dict], result: Optional[MutableMapping] = None) -> Optional[MutableMapping]:
     for out in outputs:
+        if isinstance(out, Result):
+            out.sync_pending()
+
         if 'meta' in out:
             del out['meta']
 
@@ -471,6 +550,110 @@ def collate_tensors(items: Union[List, Tuple]) -> Union[Tensor, List, Tuple]:
     return items
 
 
+class EpochResultAccumulator(object):
+    """
+    Collects the step results of one optimizer for the automatic reduction at the end of the epoch.
+
+    The first step defines which keys are reduced on epoch end and how. From then on the value of
+    each key is reduced across the TBPTT splits and written into a growable tensor, allocated once on
+    the value's device, instead of keeping a :class:`Result` per step and split. The epoch end
+    reduction is then a single op per key. Values which do not fit their column (no tensor, changing
+    shape, dtype or device) fall back to a list, reduced like :meth:`Result.reduce_on_epoch_end` does.
+
+    Args:
+        capacity: number of steps the columns are allocated for initially, they double when full.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = max(int(capacity), 1)
+        self.meta = None
+        self.num_steps = 0
+        self._columns = {}
+        self._batch_sizes = []
+
+    def append(self, outputs: Sequence[Result]) -> None:
+        """Adds the results of all TBPTT splits of a training step."""
+        if self.meta is None:
+            # keys, reduction and logging options of the first step hold for the whole epoch
+            meta = outputs[0]['meta']
+            self.meta = {k: options for k, options in meta.items() if k != '_internal' and options['on_epoch']}
+        self._batch_sizes.extend(outputs[0]['meta']['_internal']['batch_sizes'])
+
+        for key, options in self.meta.items():
+            values = [out[key] for out in outputs if key in out]
+            if not values:
+                self._to_list(key)
+                continue
+            self._write(key, _reduce_across_time(values, options['tbptt_reduce_fx']))
+        self.num_steps += 1
+
+    def _write(self, key: str, value: Any) -> None:
+        column = self._columns.get(key)
+        if isinstance(column, list):
+            column.append(value)
+            return
+
+        fits = isinstance(value, Tensor) and (column is None or (
+            value.shape == column.shape[1:] and value.dtype == column.dtype and value.device == column.device
+        ))
+        if not fits:
+            self._to_list(key).append(value)
+            return
+
+        if column is None:
+            column = self._columns[key] = value.new_empty((self.capacity, *value.shape))
+        elif self.num_steps == column.shape[0]:
+            grown = value.new_empty((2 * column.shape[0], *value.shape))
+            grown[:self.num_steps] = column
+            column = self._columns[key] = grown
+        column[self.num_steps] = value
+
+    def _to_list(self, key: str) -> list:
+        column = self._columns.get(key)
+        if not isinstance(column, list):
+            column = self._columns[key] = [] if column is None else list(column[:self.num_steps])
+        return column
+
+    def _gathered(self, key: str) -> Union[Tensor, list]:
+        column = self._columns[key]
+        if isinstance(column, list):
+            return collate_tensors(column)
+        column = column[:self.num_steps]
+        # steps with non scalar values are concatenated, like collate_tensors does
+        return column.flatten(0, 1) if column.ndim > 1 else column
+
+    def reduce(self) -> Tuple[dict, dict]:
+        """
+        Reduces every key with its ``reduce_fx`` over all steps of the epoch.
+
+        Return:
+            the metrics to log and the metrics to show in the progress bar
+        """
+        log_metrics, pbar_metrics = {}, {}
+        if not self.num_steps:
+            return log_metrics, pbar_metrics
+
+        batch_sizes = torch.tensor(self._batch_sizes)
+        for key, options in self.meta.items():
+            values = self._gathered(key)
+            fx = options['reduce_fx']
+            reduced_val = weighted_mean(values, batch_sizes) if fx == torch.mean else fx(values)
+
+            if options['logger']:
+                log_metrics[key] = reduced_val
+            if options['prog_bar']:
+                pbar_metrics[key] = reduced_val
+        return log_metrics, pbar_metrics
+
+
+def _reduce_across_time(values: List[Any], tbptt_reduce_fx: Callable) -> Any:
+    # a single scalar stays the same under the usual reductions, skip stacking it
+    if len(values) == 1 and isinstance(values[0], Tensor) and values[0].ndim == 0 \
+            and tbptt_reduce_fx in (torch.mean, torch.sum, torch.max, torch.min):
+        return values[0]
+    return tbptt_reduce_fx(collate_tensors(values))
+
+
 class TrainResult(Result):
     def __init__(
         self,
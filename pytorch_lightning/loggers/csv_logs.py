@@ -40,16 +40,29 @@ class ExperimentWriter(object):
     Currently supports to log hyperparameters and metrics in YAML and CSV
     format, respectively.
 
+    Metrics are streamed to the CSV file: :meth:`save` only appends the rows recorded since the
+    previous write to an open file handle, so the cost of saving does not grow with the length of the run.
+    The rows are written and flushed once ``flush_logs_every_n_steps`` steps passed since the previous
+    write, and always when the writer is closed.
+    The header is rewritten only when a row introduces a metric name not seen before.
+
     Args:
         log_dir: Directory for the experiment logs
+        flush_logs_every_n_steps: How many steps the recorded rows are kept in memory before
+            they are written to disk.
     """
 
     NAME_HPARAMS_FILE = 'hparams.yaml'
     NAME_METRICS_FILE = 'metrics.csv'
 
-    def __init__(self, log_dir: str) -> None:
+    def __init__(self, log_dir: str, flush_logs_every_n_steps: int = 100) -> None:
         self.hparams = {}
+        # rows recorded but not written to disk yet
         self.metrics = []
+        self.metrics_keys = []
+        self.num_rows = 0
+        self.flush_logs_every_n_steps = flush_logs_every_n_steps
+        self._last_write_step = None
 
         self.log_dir = log_dir
         if os.path.exists(self.log_dir):
@@ -60,10 +73,14 @@ class ExperimentWriter(object):
         os.makedirs(self.log_dir, exist_ok=True)
 
         self.metrics_file_path = os.path.join(self.log_dir, self.NAME_METRICS_FILE)
+        self._hparams_dirty = True
+        self._file = None
+        self.writer = None
 
     def log_hparams(self, params: Dict[str, Any]) -> None:
         """Record hparams"""
         self.hparams.update(params)
+        self._hparams_dirty = True
 
     def log_metrics(self, metrics_dict: Dict[str, float], step: Optional[int] = None) -> None:
         """Record metrics"""
@@ -73,29 +90,85 @@ class ExperimentWriter(object):
             return value
 
         if step is None:
-            step = len(self.metrics)
+            step = self.num_rows + len(self.metrics)
 
         metrics = {k: _handle_value(v) for k, v in metrics_dict.items()}
         metrics['step'] = step
         self.metrics.append(metrics)
 
     def save(self) -> None:
-        """Save recorded hparams and metrics into files"""
-        hparams_file = os.path.join(self.log_dir, self.NAME_HPARAMS_FILE)
-        save_hparams_to_yaml(hparams_file, self.hparams)
+        """Save recorded hparams and append the new metrics rows to the files once the flush interval passed"""
+        if self._hparams_dirty:
+            hparams_file = os.path.join(self.log_dir, self.NAME_HPARAMS_FILE)
+            save_hparams_to_yaml(hparams_file, self.hparams)
+            self._hparams_dirty = False
 
         if not self.metrics:
             return
 
-        last_m = {}
-        for m in self.metrics:
-            last_m.update(m)
-        metrics_keys = list(last_m.keys())
+        step = self.metrics[-1]['step']
+        if self._last_write_step is not None and step - self._last_write_step < self.flush_logs_every_n_steps:
+            return
+        self._write_metrics()
+
+    def _write_metrics(self) -> None:
+        """Append the recorded metrics rows to the metrics file and flush it"""
+        if not self.metrics:
+            return
 
-        with io.open(self.metrics_file_path, 'w', newline='') as f:
-            self.writer = csv.DictWriter(f, fieldnames=metrics_keys)
+        new_keys = []
+        for m in self.metrics:
+            new_keys.extend(k for k in m if k not in self.metrics_keys and k not in new_keys)
+
+        self.metrics_keys.extend(new_keys)
+        if self.num_rows == 0:
+            # first rows of this run, previous contents of the file are dropped
+            if self._file is not None:
+                self._file.close()
+            self._open('w')
             self.writer.writeheader()
-            self.writer.writerows(self.metrics)
+        elif new_keys:
+            self._rewrite_header()
+        elif self._file is None:
+            self._open('a')
+
+        self.writer.writerows(self.metrics)
+        self._file.flush()
+        self.num_rows += len(self.metrics)
+        self._last_write_step = self.metrics[-1]['step']
+        self.metrics = []
+
+    def close(self) -> None:
+        """Write the pending rows and close the metrics file"""
+        self.save()
+        self._write_metrics()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self.writer = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the open file cannot be pickled, it is reopened in append mode on the next save
+        state['_file'] = None
+        state['writer'] = None
+        return state
+
+    def _open(self, mode: str) -> None:
+        self._file = io.open(self.metrics_file_path, mode, newline='')
+        self.writer = csv.DictWriter(self._file, fieldnames=self.metrics_keys, restval='')
+
+    def _rewrite_header(self) -> None:
+        """Rewrite the already written rows under the extended header, this happens only on schema changes"""
+        if self._file is not None:
+            self._file.close()
+        tmp_path = self.metrics_file_path + '.tmp'
+        with io.open(self.metrics_file_path, 'r', newline='') as src, io.open(tmp_path, 'w', newline='') as dst:
+            writer = csv.DictWriter(dst, fieldnames=self.metrics_keys, restval='')
+            writer.writeheader()
+            writer.writerows(csv.DictReader(src))
+        os.replace(tmp_path, self.metrics_file_path)
+        self._open('a')
 
 
 class CSVLogger(LightningLoggerBase):
@@ -114,18 +187,22 @@ class CSVLogger(LightningLoggerBase):
         name: Experiment name. Defaults to ``'default'``.
         version: Experiment version. If version is not specified the logger inspects the save
             directory for existing versions, then automatically assigns the next available version.
+        flush_logs_every_n_steps: How many steps the logged metrics are kept in memory before they are
+            appended to the metrics file. The remaining ones are written when the logger is finalized.
     """
 
     def __init__(self,
                  save_dir: str,
                  name: Optional[str] = "default",
-                 version: Optional[Union[int, str]] = None):
+                 version: Optional[Union[int, str]] = None,
+                 flush_logs_every_n_steps: int = 100):
 
         super().__init__()
         self._save_dir = save_dir
         self._name = name or ''
         self._version = version
         self._experiment = None
+        self._flush_logs_every_n_steps = flush_logs_every_n_steps
 
     @property
     def root_dir(self) -> str:
@@ -170,7 +247,9 @@ class CSVLogger(LightningLoggerBase):
             return self._experiment
 
         os.makedirs(self.root_dir, exist_ok=True)
-        self._experiment = ExperimentWriter(log_dir=self.log_dir)
+        self._experiment = ExperimentWriter(
+            log_dir=self.log_dir, flush_logs_every_n_steps=self._flush_logs_every_n_steps
+        )
         return self._experiment
 
     @rank_zero_only
@@ -189,7 +268,8 @@ class CSVLogger(LightningLoggerBase):
 
     @rank_zero_only
     def finalize(self, status: str) -> None:
-        self.save()
+        super().save()
+        self.experiment.close()
 
     @property
     def name(self) -> str:
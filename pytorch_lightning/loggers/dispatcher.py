@@ -0,0 +1,190 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Dispatches metrics to the loggers on background threads
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import torch
+
+from pytorch_lightning.loggers.base import LightningLoggerBase, LoggerCollection
+
+
+class PackedMetrics(object):
+    """Metrics whose tensors are stacked into one tensor per device and dtype.
+
+    Stacking does not wait for the device, the values are copied to the host with a single
+    transfer per device and dtype when :meth:`to_scalars` is first called.
+
+    Args:
+        metrics: dict of metrics, values can be scalar tensors, numbers or nested dicts of them.
+
+    Example:
+        >>> packed = PackedMetrics({'loss': torch.tensor(0.5), 'nested': {'acc': torch.tensor(1.)}, 'epoch': 2})
+        >>> packed.to_scalars()
+        {'loss': 0.5, 'nested': {'acc': 1.0}, 'epoch': 2}
+    """
+
+    def __init__(self, metrics: Dict[str, Any]):
+        self._metrics = metrics
+        self._lock = threading.Lock()
+        self._values = None
+
+        groups = {}
+        self._collect(metrics, (), groups)
+        self._stacked = [(paths, torch.stack(tensors)) for paths, tensors in groups.values()]
+
+        # the stacking is asynchronous on GPU, the conversion may run on another thread and has to wait for it
+        self._ready = None
+        if any(stacked.is_cuda for _, stacked in self._stacked):
+            self._ready = torch.cuda.Event()
+            self._ready.record()
+
+    def _collect(self, metrics: Dict[str, Any], prefix: Tuple[str, ...], groups: dict):
+        for k, v in metrics.items():
+            if isinstance(v, dict):
+                self._collect(v, prefix + (k,), groups)
+            elif isinstance(v, torch.Tensor):
+                if v.numel() != 1:
+                    raise ValueError(f'only one element tensors can be logged, `{k}` has {v.numel()} elements')
+                paths, tensors = groups.setdefault((v.device, v.dtype), ([], []))
+                paths.append(prefix + (k,))
+                tensors.append(v.detach().reshape(()))
+
+    def to_scalars(self) -> Dict[str, Any]:
+        """Returns a new dict of the metrics with all tensors converted to python scalars."""
+        with self._lock:
+            if self._values is None:
+                if self._ready is not None:
+                    self._ready.synchronize()
+                self._values = {}
+                for paths, stacked in self._stacked:
+                    self._values.update(zip(paths, stacked.tolist()))
+                self._stacked = None
+        return self._rebuild(self._metrics, ())
+
+    def _rebuild(self, metrics: Dict[str, Any], prefix: Tuple[str, ...]) -> Dict[str, Any]:
+        scalars = {}
+        for k, v in metrics.items():
+            if isinstance(v, dict):
+                v = self._rebuild(v, prefix + (k,))
+            elif isinstance(v, torch.Tensor):
+                v = self._values[prefix + (k,)]
+            scalars[k] = v
+        return scalars
+
+
+class AsyncLoggerDispatcher(object):
+    """Calls the loggers on background threads, so training does not wait for them.
+
+    Every logger, including each logger of a :class:`~pytorch_lightning.loggers.base.LoggerCollection`,
+    gets its own thread which processes its calls in order, so a slow remote logger does not hold back
+    the others. At most ``max_pending`` calls are queued per logger, further calls block until the
+    logger has caught up. The error of a failed logger call is raised by the next call to the dispatcher.
+
+    Args:
+        max_pending: maximal number of calls queued or running per logger.
+    """
+
+    def __init__(self, max_pending: int = 16):
+        if max_pending < 1:
+            raise ValueError(f"`max_pending` has to be a positive integer, got {max_pending}.")
+        self.max_pending = max_pending
+        self._lanes = {}
+        self._futures: List[Future] = []
+
+    def log_metrics(self, logger: LightningLoggerBase, metrics: PackedMetrics, step: Optional[int] = None) -> None:
+        """Converts the packed metrics to scalars, passes them to ``agg_and_log_metrics`` of each logger
+        and saves it. The metrics are copied to the host only once for all loggers."""
+        for lg in self._loggers(logger):
+            self._submit(lg, self._log_metrics, lg, metrics, step)
+
+    @staticmethod
+    def _log_metrics(logger: LightningLoggerBase, metrics: PackedMetrics, step: Optional[int]):
+        logger.agg_and_log_metrics(metrics.to_scalars(), step=step)
+        logger.save()
+
+    def save(self, logger: LightningLoggerBase) -> None:
+        """Schedules saving each logger after its pending calls."""
+        for lg in self._loggers(logger):
+            self._submit(lg, lg.save)
+
+    def finalize(self, logger: LightningLoggerBase, status: str) -> None:
+        """Finalizes each logger after its pending calls and waits for all loggers."""
+        for lg in self._loggers(logger):
+            self._submit(lg, lg.finalize, status)
+        self.wait()
+
+    @staticmethod
+    def _loggers(logger: LightningLoggerBase) -> List[LightningLoggerBase]:
+        if isinstance(logger, LoggerCollection):
+            return list(logger._logger_iterable)
+        return [logger]
+
+    def _submit(self, logger: LightningLoggerBase, fn: Callable, *args) -> Future:
+        # a logger which failed is reported on the next call instead of only when finalizing
+        self._raise_failed()
+
+        lane = self._lanes.get(logger)
+        if lane is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="logger_dispatcher")
+            lane = self._lanes[logger] = (executor, threading.BoundedSemaphore(self.max_pending))
+        executor, slots = lane
+
+        # backpressure, wait for the logger to catch up
+        slots.acquire()
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        self._futures = [f for f in self._futures if not f.done() or f.exception() is not None] + [future]
+        return future
+
+    def _raise_failed(self) -> None:
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                self._futures.remove(future)
+                future.result()
+
+    @property
+    def pending(self) -> int:
+        """Number of logger calls which did not finish yet."""
+        return sum(not f.done() for f in self._futures)
+
+    def wait(self) -> None:
+        """Blocks until all scheduled logger calls are done and re-raises the first error."""
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def close(self) -> None:
+        """Waits for all pending calls and stops the logger threads."""
+        try:
+            self.wait()
+        finally:
+            for executor, _ in self._lanes.values():
+                executor.shutdown(wait=True)
+            self._lanes = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # threads and locks cannot be pickled, new threads are started on the next call
+        state["_lanes"] = {}
+        state["_futures"] = []
+        return state
@@ -7,16 +7,33 @@ from pytorch_lightning.metrics.classification import (
     Recall,
     ROC,
     AUROC,
+    BinnedAUROC,
+    BinnedAveragePrecision,
+    BinnedPrecisionRecallCurve,
+    BinnedROC,
     DiceCoefficient,
+    MulticlassAUROC,
     MulticlassPrecisionRecallCurve,
     MulticlassROC,
     Precision,
     PrecisionRecallCurve,
     IoU,
+    StatefulAccuracy,
+    StatefulBalancedAccuracy,
+    StatefulClassificationScores,
+    StatefulCohenKappaScore,
+    StatefulConfusionMatrix,
+    StatefulDCG,
+    StatefulF1,
+    StatefulFBeta,
+    StatefulHamming,
+    StatefulHinge,
+    StatefulPrecision,
+    StatefulRecall,
 )
 from pytorch_lightning.metrics.converters import numpy_metric, tensor_metric
-from pytorch_lightning.metrics.metric import Metric, TensorMetric, NumpyMetric
-from pytorch_lightning.metrics.nlp import BLEUScore
+from pytorch_lightning.metrics.metric import Metric, TensorMetric, NumpyMetric, StatefulMetric
+from pytorch_lightning.metrics.nlp import BLEUScore, StatefulBLEUScore
 from pytorch_lightning.metrics.self_supervised import EmbeddingSimilarity
 from pytorch_lightning.metrics.regression import (
     MAE,
@@ -24,7 +41,18 @@ from pytorch_lightning.metrics.regression import (
     PSNR,
     RMSE,
     RMSLE,
-    SSIM
+    SSIM,
+    StatefulExplainedVariance,
+    StatefulMAE,
+    StatefulMeanGammaDeviance,
+    StatefulMeanPoissonDeviance,
+    StatefulMeanSquaredLogError,
+    StatefulMedianAbsoluteError,
+    StatefulMSE,
+    StatefulPSNR,
+    StatefulR2Score,
+    StatefulRMSE,
+    StatefulRMSLE,
 )
 from pytorch_lightning.metrics.sklearns import (
     AUC,
@@ -36,10 +64,15 @@ __classification_metrics = [
     "AUROC",
     "Accuracy",
     "AveragePrecision",
+    "BinnedAUROC",
+    "BinnedAveragePrecision",
+    "BinnedPrecisionRecallCurve",
+    "BinnedROC",
     "ConfusionMatrix",
     "DiceCoefficient",
     "F1",
     "FBeta",
+    "MulticlassAUROC",
     "MulticlassPrecisionRecallCurve",
     "MulticlassROC",
     "Precision",
@@ -47,6 +80,18 @@ __classification_metrics = [
     "ROC",
     "Recall",
     "IoU",
+    "StatefulAccuracy",
+    "StatefulBalancedAccuracy",
+    "StatefulClassificationScores",
+    "StatefulCohenKappaScore",
+    "StatefulConfusionMatrix",
+    "StatefulDCG",
+    "StatefulF1",
+    "StatefulFBeta",
+    "StatefulHamming",
+    "StatefulHinge",
+    "StatefulPrecision",
+    "StatefulRecall",
 ]
 __regression_metrics = [
     "MAE",
@@ -54,9 +99,20 @@ __regression_metrics = [
     "PSNR",
     "RMSE",
     "RMSLE",
-    "SSIM"
+    "SSIM",
+    "StatefulExplainedVariance",
+    "StatefulMAE",
+    "StatefulMeanGammaDeviance",
+    "StatefulMeanPoissonDeviance",
+    "StatefulMeanSquaredLogError",
+    "StatefulMedianAbsoluteError",
+    "StatefulMSE",
+    "StatefulPSNR",
+    "StatefulR2Score",
+    "StatefulRMSE",
+    "StatefulRMSLE",
 ]
-__sequence_metrics = ["BLEUScore"]
+__sequence_metrics = ["BLEUScore", "StatefulBLEUScore"]
 __selfsuper_metrics = ["EmbeddingSimilarity"]
 
 __all__ = __regression_metrics \
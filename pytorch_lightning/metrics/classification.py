@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Optional, Sequence, Tuple
+import math
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
 
 import torch
+from torch.nn import functional as F
 
 from pytorch_lightning.metrics.functional.classification import (
+    _confusion_matrix_update,
+    _scores_from_confmat,
     accuracy,
     auroc,
     average_precision,
@@ -25,14 +29,19 @@ from pytorch_lightning.metrics.functional.classification import (
     f1_score,
     fbeta_score,
     iou,
+    multiclass_auroc,
     multiclass_precision_recall_curve,
     multiclass_roc,
     precision,
     precision_recall_curve,
     recall,
-    roc
+    roc,
+    to_categorical,
 )
-from pytorch_lightning.metrics.metric import TensorCollectionMetric, TensorMetric
+from pytorch_lightning.metrics.functional.reduction import reduce
+from pytorch_lightning.metrics.metric import StatefulMetric, TensorCollectionMetric, TensorMetric
+
+_BUCKETIZE_AVAILABLE = hasattr(torch, 'bucketize')
 
 
 class Accuracy(TensorMetric):
@@ -420,6 +429,69 @@ class AUROC(TensorMetric):
                      pos_label=self.pos_label)
 
 
+class MulticlassAUROC(TensorMetric):
+    """
+    Computes the area under curve (AUC) of the receiver operator characteristic (ROC) for multiclass scores
+
+    Example:
+
+        >>> pred = torch.tensor([[0.75, 0.05, 0.05, 0.05],
+        ...                      [0.05, 0.75, 0.05, 0.05],
+        ...                      [0.05, 0.05, 0.75, 0.05],
+        ...                      [0.05, 0.05, 0.05, 0.75],
+        ...                      [0.05, 0.75, 0.05, 0.05]])
+        >>> target = torch.tensor([0, 1, 3, 2, 1])
+        >>> metric = MulticlassAUROC()
+        >>> metric(pred, target)
+        tensor(0.6875)
+
+    """
+
+    def __init__(
+            self,
+            num_classes: Optional[int] = None,
+            average: str = 'macro',
+            reduce_group: Any = None,
+            reduce_op: Any = None,
+    ):
+        """
+        Args:
+            num_classes: number of classes
+            average: method to combine the scores of the classes, one of
+                ``'macro'``, ``'weighted'``, ``'micro'`` and ``'none'``
+            reduce_group: the process group to reduce metric results from DDP
+            reduce_op: the operation to perform for ddp reduction
+        """
+        super().__init__(name='multiclass_auroc',
+                         reduce_group=reduce_group,
+                         reduce_op=reduce_op)
+
+        self.num_classes = num_classes
+        self.average = average
+
+    def forward(
+            self,
+            pred: torch.Tensor,
+            target: torch.Tensor,
+            sample_weight: Optional[Sequence] = None
+    ) -> torch.Tensor:
+        """
+        Actual metric computation
+
+        Args:
+            pred: predicted probability for each label
+            target: groundtruth labels
+            sample_weight: the weights per sample
+
+        Return:
+            torch.Tensor: classification score
+        """
+        return multiclass_auroc(pred=pred, target=target,
+                                sample_weight=sample_weight,
+                                num_classes=self.num_classes,
+                                average=self.average)
+
+
 class FBeta(TensorMetric):
     """
     Computes the FBeta Score, which is the weighted harmonic mean of precision and recall.
@@ -827,3 +899,993 @@ class IoU(TensorMetric):
         Actual metric calculation.
         """
         return iou(y_pred, y_true, remove_bg=self.remove_bg, reduction=self.reduction)
+
+
+class _StatScoresMetric(StatefulMetric):
+    """
+    Base class for stateful metrics derived from the per-class number of
+    true positives, false positives, false negatives and the support.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            num_classes: int,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        super().__init__(name=name, reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.num_classes = num_classes
+        self.reduction = reduction
+
+        for state in ('tps', 'fps', 'fns', 'sups'):
+            self.add_state(state, torch.zeros(num_classes, dtype=torch.long))
+
+    def update(self, pred: torch.Tensor, target: torch.Tensor) -> None:
+        """
+        Accumulates the per-class statistics of a batch
+
+        Args:
+            pred: predicted labels or probabilities
+            target: ground truth labels
+        """
+        if pred.ndim == target.ndim + 1:
+            pred = to_categorical(pred)
+
+        # out of range labels are counted in an extra bin which is dropped afterwards
+        pred = pred.view(-1).long().clamp_max(self.num_classes)
+        target = target.view(-1).long().clamp_max(self.num_classes)
+        match = pred == target
+
+        def _count(labels):
+            return torch.bincount(labels, minlength=self.num_classes + 1)[:self.num_classes]
+
+        self.tps += _count(pred[match])
+        self.fps += _count(pred[~match])
+        self.fns += _count(target[~match])
+        self.sups += _count(target)
+
+    def _precision_recall(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        tps, fps, fns = self.tps.float(), self.fps.float(), self.fns.float()
+
+        precision = tps / (tps + fps)
+        recall = tps / (tps + fns)
+
+        precision[precision != precision] = 0
+        recall[recall != recall] = 0
+        return precision, recall
+
+
+class StatefulAccuracy(_StatScoresMetric):
+    """
+    Computes the accuracy classification score over all batches seen since the last reset
+
+    Example:
+
+        >>> metric = StatefulAccuracy(num_classes=4)
+        >>> metric(torch.tensor([0, 1, 2, 3]), torch.tensor([0, 1, 2, 2]))
+        tensor(0.7500)
+        >>> metric(torch.tensor([3, 3]), torch.tensor([3, 2]))
+        tensor(0.5000)
+        >>> metric.compute()
+        tensor(0.6667)
+
+    """
+
+    def __init__(
+            self,
+            num_classes: int,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            num_classes: number of classes
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - none: pass array
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='accuracy', num_classes=num_classes, reduction=reduction,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the classification score.
+        """
+        if self.reduction == 'none':
+            return self.tps.float() / self.sups.float()
+        return self.tps.sum().float() / self.sups.sum().float()
+
+
+class StatefulPrecision(_StatScoresMetric):
+    """
+    Computes the precision score over all batches seen since the last reset
+
+    Example:
+
+        >>> metric = StatefulPrecision(num_classes=4)
+        >>> metric(torch.tensor([0, 1, 2, 3]), torch.tensor([0, 1, 2, 2]))
+        tensor(0.7500)
+
+    """
+
+    def __init__(
+            self,
+            num_classes: int,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            num_classes: number of classes
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - none: pass array
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='precision', num_classes=num_classes, reduction=reduction,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the classification score.
+        """
+        return reduce(self._precision_recall()[0], reduction=self.reduction)
+
+
+class StatefulRecall(_StatScoresMetric):
+    """
+    Computes the recall score over all batches seen since the last reset
+
+    Example:
+
+        >>> metric = StatefulRecall(num_classes=4)
+        >>> metric(torch.tensor([0, 1, 2, 3]), torch.tensor([0, 1, 2, 2]))
+        tensor(0.6250)
+
+    """
+
+    def __init__(
+            self,
+            num_classes: int,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            num_classes: number of classes
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - none: pass array
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='recall', num_classes=num_classes, reduction=reduction,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the classification score.
+        """
+        return reduce(self._precision_recall()[1], reduction=self.reduction)
+
+
+class StatefulFBeta(_StatScoresMetric):
+    """
+    Computes the FBeta Score over all batches seen since the last reset.
+
+    Example:
+
+        >>> metric = StatefulFBeta(0.25, num_classes=4)
+        >>> metric(torch.tensor([0, 1, 2, 3]), torch.tensor([0, 1, 2, 2]))
+        tensor(0.7361)
+    """
+
+    def __init__(
+            self,
+            beta: float,
+            num_classes: int,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            beta: determines the weight of recall in the combined score.
+            num_classes: number of classes
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - none: pass array
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='fbeta', num_classes=num_classes, reduction=reduction,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.beta = beta
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            torch.Tensor: classification score
+        """
+        prec, rec = self._precision_recall()
+
+        fbeta = (1 + self.beta ** 2) * prec * rec / ((self.beta ** 2) * prec + rec)
+        # drop NaN after zero division
+        fbeta[fbeta != fbeta] = 0
+
+        return reduce(fbeta, reduction=self.reduction)
+
+
+class StatefulF1(StatefulFBeta):
+    """
+    Computes the F1 score over all batches seen since the last reset.
+
+    Example:
+
+        >>> metric = StatefulF1(num_classes=4)
+        >>> metric(torch.tensor([0, 1, 2, 3]), torch.tensor([0, 1, 2, 2]))
+        tensor(0.6667)
+    """
+
+    def __init__(
+            self,
+            num_classes: int,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            num_classes: number of classes
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - none: pass array
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(beta=1., num_classes=num_classes, reduction=reduction,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.name = 'f1'
+
+
+class StatefulConfusionMatrix(StatefulMetric):
+    """
+    Computes the confusion matrix over all batches seen since the last reset.
+
+    Example:
+
+        >>> metric = StatefulConfusionMatrix(num_classes=3)
+        >>> _ = metric(torch.tensor([0, 1, 2, 2]), torch.tensor([0, 1, 2, 2]))
+        >>> metric(torch.tensor([1]), torch.tensor([0]))
+        tensor([[0., 1., 0.],
+                [0., 0., 0.],
+                [0., 0., 0.]])
+        >>> metric.compute()
+        tensor([[1., 1., 0.],
+                [0., 1., 0.],
+                [0., 0., 2.]])
+
+    """
+
+    def __init__(
+            self,
+            num_classes: int,
+            normalize: bool = False,
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            num_classes: number of classes
+            normalize: whether to compute a normalized confusion matrix
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the matrix of the current batch
+        """
+        super().__init__(name='confusion_matrix', reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.num_classes = num_classes
+        self.normalize = normalize
+
+        self.add_state('confmat', torch.zeros(num_classes, num_classes, dtype=torch.long))
+
+    def update(self, pred: torch.Tensor, target: torch.Tensor) -> None:
+        """
+        Accumulates the confusion matrix of a batch
+
+        Args:
+            pred: predicted labels
+            target: ground truth labels
+        """
+        confmat = _confusion_matrix_update(pred, target, self.num_classes)
+        self.confmat += confmat[:self.num_classes, :self.num_classes]
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the confusion matrix.
+        """
+        cm = self.confmat.float()
+        if self.normalize:
+            cm = cm / cm.sum(-1, keepdim=True)
+        return cm
+
+
+class StatefulClassificationScores(StatefulMetric):
+    """
+    Computes accuracy, precision, recall, F-beta, IoU and dice score over all batches seen since the
+    last reset. All scores are derived from one accumulated confusion matrix, which every batch
+    updates with a single pass over the data.
+
+    Example:
+
+        >>> metric = StatefulClassificationScores(num_classes=4)
+        >>> scores = metric(torch.tensor([0, 1, 2, 3]), torch.tensor([0, 1, 2, 2]))
+        >>> scores['accuracy'], scores['precision'], scores['recall']
+        (tensor(0.7500), tensor(0.7500), tensor(0.6250))
+        >>> scores['fbeta'], scores['iou'], scores['dice']
+        (tensor(0.6667), tensor(0.6250), tensor(0.6667))
+
+    """
+
+    def __init__(
+            self,
+            num_classes: int,
+            ignore_index: Optional[int] = None,
+            multilabel: bool = False,
+            beta: float = 1.,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            num_classes: number of classes or labels
+            ignore_index: target value of samples which are not counted
+            multilabel: whether predictions and targets hold a binary indicator per label along dimension 1
+            beta: weights recall when combining the F-beta score
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - none: pass array
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the scores of the current batch
+        """
+        super().__init__(name='classification_scores', reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.num_classes = num_classes
+        self.ignore_index = ignore_index
+        self.multilabel = multilabel
+        self.beta = beta
+        self.reduction = reduction
+
+        # multiclass matrices hold an extra class counting the labels out of range
+        shape = (num_classes, 2, 2) if multilabel else (num_classes + 1, num_classes + 1)
+        self.add_state('confmat', torch.zeros(shape, dtype=torch.long))
+
+    def update(self, pred: torch.Tensor, target: torch.Tensor) -> None:
+        """
+        Accumulates the confusion matrix of a batch
+
+        Args:
+            pred: predicted labels or probabilities, for multilabel data binary indicators or probabilities
+            target: ground truth labels, for multilabel data binary indicators
+        """
+        self.confmat += _confusion_matrix_update(pred, target, self.num_classes,
+                                                 ignore_index=self.ignore_index, multilabel=self.multilabel)
+
+    def compute(self) -> Dict[str, torch.Tensor]:
+        """
+        Return:
+            dict with the ``'accuracy'``, ``'precision'``, ``'recall'``, ``'fbeta'``, ``'iou'``
+            and ``'dice'`` scores
+        """
+        return _scores_from_confmat(self.confmat, beta=self.beta, reduction=self.reduction)
+
+
+class _BinnedCurveMetric(StatefulMetric):
+    """
+    Base class for stateful metrics approximating the ROC or precision recall curve at fixed thresholds.
+
+    Instead of keeping all predictions, every batch is counted into a histogram of positive and of
+    negative samples with one bin per interval between two thresholds. The number of true positives,
+    false positives, true negatives and false negatives at each threshold follows from the cumulative
+    sums of these histograms, so memory and compute do not grow with the number of samples and the
+    states of all processes are merged with a single all reduce.
+
+    The curves are meant to be computed over many batches, so ``forward`` only updates the histograms
+    by default. A batch holding a single class has no ROC curve of its own.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            thresholds: Union[int, Sequence[float], torch.Tensor] = 100,
+            pos_label: int = 1,
+            reduce_group: Any = None,
+            compute_on_step: bool = False,
+    ):
+        super().__init__(name=name, reduce_group=reduce_group, compute_on_step=compute_on_step)
+        if isinstance(thresholds, int):
+            if thresholds < 2:
+                raise ValueError(f'at least 2 thresholds are required, got {thresholds}')
+            thresholds = torch.linspace(0, 1, thresholds)
+        thresholds = torch.as_tensor(thresholds, dtype=torch.float).flatten()
+        if thresholds.numel() < 2 or not bool((thresholds[1:] > thresholds[:-1]).all()):
+            raise ValueError('thresholds have to hold at least 2 strictly increasing values')
+        self.pos_label = pos_label
+        self.register_buffer('thresholds', thresholds)
+
+        # bin ``i`` counts the samples scored at or above ``i`` thresholds,
+        # double precision keeps the counts exact far beyond the range of float32
+        num_bins = thresholds.numel() + 1
+        self.add_state('positives', torch.zeros(num_bins, dtype=torch.double))
+        self.add_state('negatives', torch.zeros(num_bins, dtype=torch.double))
+
+    def update(
+            self,
+            pred: torch.Tensor,
+            target: torch.Tensor,
+            sample_weight: Optional[Sequence] = None,
+    ) -> None:
+        """
+        Counts the samples of a batch into the histograms
+
+        Args:
+            pred: estimated probabilities
+            target: ground-truth labels
+            sample_weight: the weights per sample
+        """
+        # remove class dimension if necessary
+        if pred.ndim > target.ndim:
+            pred = pred[:, 0]
+        pred = pred.flatten().to(self.thresholds.dtype)
+        is_positive = target.flatten() == self.pos_label
+
+        if _BUCKETIZE_AVAILABLE:
+            bins = torch.bucketize(pred, self.thresholds, right=True)
+        else:
+            bins = (pred.unsqueeze(-1) >= self.thresholds).sum(-1)
+
+        if sample_weight is None:
+            weight = torch.ones_like(pred, dtype=self.positives.dtype)
+        else:
+            weight = torch.as_tensor(sample_weight, device=pred.device).flatten().to(self.positives.dtype)
+
+        self.positives.scatter_add_(0, bins[is_positive], weight[is_positive])
+        self.negatives.scatter_add_(0, bins[~is_positive], weight[~is_positive])
+
+    def _stat_scores(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Return:
+            true positives, false positives, true negatives and false negatives per threshold,
+            a sample counts as predicted positive if it is scored at or above the threshold
+        """
+        # reversed cumulative sums, element ``i`` counts the samples in bin ``i`` or above
+        above_pos = self.positives.flip(0).cumsum(0).flip(0)
+        above_neg = self.negatives.flip(0).cumsum(0).flip(0)
+
+        tps, fps = above_pos[1:], above_neg[1:]
+        fns, tns = above_pos[0] - tps, above_neg[0] - fps
+        return tps, fps, tns, fns
+
+    def _roc(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        tps, fps, _, _ = self._stat_scores()
+        # start the curve with no positive predictions, for thresholds from high to low
+        fps = F.pad(fps.flip(0), (1, 0))
+        tps = F.pad(tps.flip(0), (1, 0))
+        thresholds = torch.cat([self.thresholds[-1:] + 1, self.thresholds.flip(0)])
+
+        if fps[-1] <= 0:
+            raise ValueError("No negative samples in targets, false positive value should be meaningless")
+        if tps[-1] <= 0:
+            raise ValueError("No positive samples in targets, true positive value should be meaningless")
+        return (fps / fps[-1]).float(), (tps / tps[-1]).float(), thresholds
+
+    def _precision_recall_curve(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        tps, fps, _, fns = self._stat_scores()
+        predicted = tps + fps
+        # thresholds without positive predictions have a precision of 1 by convention
+        precision = torch.where(predicted > 0, tps / predicted.clamp_min(1e-12), torch.ones_like(tps))
+        recall = tps / (tps + fns)
+
+        # the last point has no threshold, a precision of 1 and a recall of 0
+        precision = torch.cat([precision, precision.new_ones(1)]).float()
+        recall = torch.cat([recall, recall.new_zeros(1)]).float()
+        return precision, recall, self.thresholds
+
+
+class BinnedROC(_BinnedCurveMetric):
+    """
+    Computes the receiver operator characteristic (ROC) at fixed thresholds over all batches seen
+    since the last reset, using memory independent of the number of samples.
+
+    Example:
+
+        >>> pred = torch.tensor([0.1, 0.6, 0.35, 0.8])
+        >>> target = torch.tensor([0, 0, 1, 1])
+        >>> metric = BinnedROC(thresholds=5)
+        >>> metric(pred, target)
+        >>> fpr, tpr, thresholds = metric.compute()
+        >>> fpr
+        tensor([0.0000, 0.0000, 0.0000, 0.5000, 0.5000, 1.0000])
+        >>> tpr
+        tensor([0.0000, 0.0000, 0.5000, 0.5000, 1.0000, 1.0000])
+        >>> thresholds
+        tensor([2.0000, 1.0000, 0.7500, 0.5000, 0.2500, 0.0000])
+
+    """
+
+    def __init__(
+            self,
+            thresholds: Union[int, Sequence[float], torch.Tensor] = 100,
+            pos_label: int = 1,
+            reduce_group: Any = None,
+            compute_on_step: bool = False,
+    ):
+        """
+        Args:
+            thresholds: number of thresholds evenly spaced over ``[0, 1]`` or the increasing thresholds
+            pos_label: positive label indicator
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the curve of the current batch,
+                disabled by default
+        """
+        super().__init__(name='roc', thresholds=thresholds, pos_label=pos_label,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def compute(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Return:
+            - false positive rate
+            - true positive rate
+            - thresholds, from high to low
+        """
+        return self._roc()
+
+
+class BinnedAUROC(_BinnedCurveMetric):
+    """
+    Approximates the area under the receiver operator characteristic (ROC) by its value at fixed
+    thresholds, over all batches seen since the last reset
+
+    Example:
+
+        >>> pred = torch.tensor([0.1, 0.6, 0.35, 0.8])
+        >>> target = torch.tensor([0, 0, 1, 1])
+        >>> metric = BinnedAUROC(thresholds=5)
+        >>> metric(pred, target)
+        >>> metric.compute()
+        tensor(0.7500)
+
+    """
+
+    def __init__(
+            self,
+            thresholds: Union[int, Sequence[float], torch.Tensor] = 100,
+            pos_label: int = 1,
+            reduce_group: Any = None,
+            compute_on_step: bool = False,
+    ):
+        """
+        Args:
+            thresholds: number of thresholds evenly spaced over ``[0, 1]`` or the increasing thresholds
+            pos_label: positive label indicator
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch,
+                disabled by default
+        """
+        super().__init__(name='auroc', thresholds=thresholds, pos_label=pos_label,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            torch.Tensor: classification score
+        """
+        fpr, tpr, _ = self._roc()
+        return torch.sum((fpr[1:] - fpr[:-1]) * (tpr[1:] + tpr[:-1]) / 2)
+
+
+class BinnedPrecisionRecallCurve(_BinnedCurveMetric):
+    """
+    Computes the precision recall curve at fixed thresholds over all batches seen since the last
+    reset, using memory independent of the number of samples.
+
+    Example:
+
+        >>> pred = torch.tensor([0.1, 0.6, 0.35, 0.8])
+        >>> target = torch.tensor([0, 0, 1, 1])
+        >>> metric = BinnedPrecisionRecallCurve(thresholds=5)
+        >>> metric(pred, target)
+        >>> precision, recall, thresholds = metric.compute()
+        >>> precision
+        tensor([0.5000, 0.6667, 0.5000, 1.0000, 1.0000, 1.0000])
+        >>> recall
+        tensor([1.0000, 1.0000, 0.5000, 0.5000, 0.0000, 0.0000])
+        >>> thresholds
+        tensor([0.0000, 0.2500, 0.5000, 0.7500, 1.0000])
+
+    """
+
+    def __init__(
+            self,
+            thresholds: Union[int, Sequence[float], torch.Tensor] = 100,
+            pos_label: int = 1,
+            reduce_group: Any = None,
+            compute_on_step: bool = False,
+    ):
+        """
+        Args:
+            thresholds: number of thresholds evenly spaced over ``[0, 1]`` or the increasing thresholds
+            pos_label: positive label indicator
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the curve of the current batch,
+                disabled by default
+        """
+        super().__init__(name='precision_recall_curve', thresholds=thresholds, pos_label=pos_label,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def compute(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Return:
+            - precision values
+            - recall values
+            - thresholds, from low to high
+        """
+        return self._precision_recall_curve()
+
+
+class BinnedAveragePrecision(_BinnedCurveMetric):
+    """
+    Approximates the average precision by the precision recall curve at fixed thresholds, over all
+    batches seen since the last reset
+
+    Example:
+
+        >>> pred = torch.tensor([0.1, 0.6, 0.35, 0.8])
+        >>> target = torch.tensor([0, 0, 1, 1])
+        >>> metric = BinnedAveragePrecision(thresholds=5)
+        >>> metric(pred, target)
+        >>> metric.compute()
+        tensor(0.8333)
+
+    """
+
+    def __init__(
+            self,
+            thresholds: Union[int, Sequence[float], torch.Tensor] = 100,
+            pos_label: int = 1,
+            reduce_group: Any = None,
+            compute_on_step: bool = False,
+    ):
+        """
+        Args:
+            thresholds: number of thresholds evenly spaced over ``[0, 1]`` or the increasing thresholds
+            pos_label: positive label indicator
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch,
+                disabled by default
+        """
+        super().__init__(name='average_precision', thresholds=thresholds, pos_label=pos_label,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            torch.Tensor: classification score
+        """
+        precision, recall, _ = self._precision_recall_curve()
+        # step function integral, the last entry of precision is always 1
+        return -torch.sum((recall[1:] - recall[:-1]) * precision[:-1])
+
+
+class StatefulBalancedAccuracy(_StatScoresMetric):
+    """
+    Computes the balanced accuracy, the average recall of the classes present in the targets,
+    over all batches seen since the last reset
+
+    Example:
+
+        >>> metric = StatefulBalancedAccuracy(num_classes=2)
+        >>> metric(torch.tensor([0, 0, 0, 1]), torch.tensor([0, 0, 1, 1]))
+        tensor(0.7500)
+
+    """
+
+    def __init__(
+            self,
+            num_classes: int,
+            adjusted: bool = False,
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            num_classes: number of classes
+            adjusted: whether to adjust the score for chance, so that random performance scores 0
+                and perfect performance scores 1
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='balanced_accuracy', num_classes=num_classes,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.adjusted = adjusted
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the balanced accuracy.
+        """
+        present = self.sups > 0
+        score = (self.tps[present].float() / self.sups[present].float()).mean()
+        if self.adjusted:
+            chance = 1 / present.sum().float()
+            score = (score - chance) / (1 - chance)
+        return score
+
+
+class StatefulCohenKappaScore(StatefulMetric):
+    """
+    Computes Cohen's kappa, the agreement of two annotators corrected for chance,
+    over all batches seen since the last reset
+
+    Example:
+
+        >>> metric = StatefulCohenKappaScore(num_classes=3)
+        >>> metric(torch.tensor([1, 2, 0, 2]), torch.tensor([2, 2, 2, 1]))
+        tensor(-0.3333)
+
+    """
+
+    def __init__(
+            self,
+            num_classes: int,
+            weights: Optional[str] = None,
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            num_classes: number of classes
+            weights: weighting of the disagreements. ``None`` counts all disagreements equally,
+                ``'linear'`` and ``'quadratic'`` weight them by the (squared) distance of the labels
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        if weights not in (None, 'linear', 'quadratic'):
+            raise ValueError(f'weights {weights} not supported, use one of None, linear or quadratic')
+        super().__init__(name='cohen_kappa_score', reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.num_classes = num_classes
+        self.weights = weights
+
+        self.add_state('confmat', torch.zeros(num_classes, num_classes, dtype=torch.long))
+
+    def update(self, y1: torch.Tensor, y2: torch.Tensor) -> None:
+        """
+        Accumulates the confusion matrix of a batch
+
+        Args:
+            y1: labels assigned by the first annotator
+            y2: labels assigned by the second annotator
+        """
+        confmat = _confusion_matrix_update(y2, y1, self.num_classes)
+        self.confmat += confmat[:self.num_classes, :self.num_classes]
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the kappa score.
+        """
+        confmat = self.confmat.double()
+        expected = torch.ger(confmat.sum(1), confmat.sum(0)) / confmat.sum()
+
+        if self.weights is None:
+            disagreement = 1 - torch.eye(self.num_classes, dtype=confmat.dtype, device=confmat.device)
+        else:
+            labels = torch.arange(self.num_classes, dtype=confmat.dtype, device=confmat.device)
+            disagreement = torch.abs(labels.unsqueeze(1) - labels)
+            if self.weights == 'quadratic':
+                disagreement = disagreement ** 2
+
+        kappa = 1 - torch.sum(disagreement * confmat) / torch.sum(disagreement * expected)
+        return kappa.float()
+
+
+class StatefulHamming(StatefulMetric):
+    """
+    Computes the hamming loss, the fraction of wrongly predicted labels,
+    over all batches seen since the last reset
+
+    Example:
+
+        >>> metric = StatefulHamming()
+        >>> metric(torch.tensor([0, 1, 2, 3]), torch.tensor([1, 1, 2, 3]))
+        tensor(0.2500)
+
+    """
+
+    def __init__(
+            self,
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='hamming_loss', reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.add_state('mismatches', torch.tensor(0, dtype=torch.long))
+        self.add_state('total', torch.tensor(0, dtype=torch.long))
+
+    def update(self, pred: torch.Tensor, target: torch.Tensor) -> None:
+        """
+        Counts the wrong labels of a batch
+
+        Args:
+            pred: predicted labels, or binary indicators for multilabel data
+            target: ground truth labels, or binary indicators for multilabel data
+        """
+        self.mismatches += torch.sum(pred != target)
+        self.total += target.numel()
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the hamming loss.
+        """
+        return self.mismatches.float() / self.total
+
+
+class StatefulHinge(StatefulMetric):
+    """
+    Computes the average hinge loss over all batches seen since the last reset.
+
+    For binary data, ``pred_decision`` holds one decision value per sample and the targets
+    are mapped to ``-1`` (labels ``<= 0``) and ``1``. For multiclass data, ``pred_decision`` holds one
+    value per class and the multiclass margin of Crammer and Singer is used.
+
+    Example:
+
+        >>> metric = StatefulHinge()
+        >>> metric(torch.tensor([-2.17, -0.97, -0.19, -0.43]), torch.tensor([1, 1, 0, 0]))
+        tensor(1.6300)
+
+    """
+
+    def __init__(
+            self,
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='hinge_loss', reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.add_state('sum_loss', torch.tensor(0., dtype=torch.double))
+        self.add_state('total', torch.tensor(0, dtype=torch.long))
+
+    def update(self, pred_decision: torch.Tensor, target: torch.Tensor) -> None:
+        """
+        Accumulates the hinge losses of a batch
+
+        Args:
+            pred_decision: predicted decision values, of shape ``[N]`` or ``[N, num_classes]``
+            target: ground truth labels
+        """
+        if pred_decision.ndim == target.ndim + 1:
+            target = target.long()
+            true_decision = pred_decision.gather(1, target.unsqueeze(1)).squeeze(1)
+            # best score of the other classes
+            others = pred_decision.scatter(1, target.unsqueeze(1), float('-inf'))
+            margin = true_decision - others.max(1)[0]
+        else:
+            margin = torch.where(target > 0, pred_decision, -pred_decision)
+
+        self.sum_loss += torch.clamp(1 - margin, min=0).sum()
+        self.total += margin.numel()
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the hinge loss.
+        """
+        return (self.sum_loss / self.total).float()
+
+
+class StatefulDCG(StatefulMetric):
+    """
+    Computes the discounted cumulative gain, averaged over all samples seen since the last reset
+
+    Example:
+
+        >>> metric = StatefulDCG()
+        >>> metric(torch.tensor([[.1, .2, .3, 4, 70]]), torch.tensor([[10, 0, 0, 1, 5]]))
+        tensor(9.4995)
+
+    """
+
+    def __init__(
+            self,
+            k: Optional[int] = None,
+            log_base: float = 2,
+            ignore_ties: bool = False,
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            k: only consider the highest k scores of each sample
+            log_base: base of the logarithm used for the discount
+            ignore_ties: if ``True``, assume there are no tied scores, which is faster.
+                Otherwise tied scores share the average of their gains
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='dcg_score', reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.k = k
+        self.log_base = log_base
+        self.ignore_ties = ignore_ties
+
+        self.add_state('sum_dcg', torch.tensor(0., dtype=torch.double))
+        self.add_state('total', torch.tensor(0, dtype=torch.long))
+
+    def update(self, y_score: torch.Tensor, y_true: torch.Tensor) -> None:
+        """
+        Accumulates the gains of a batch
+
+        Args:
+            y_score: predicted scores of shape ``[N, num_items]``
+            y_true: true relevance of each item, of the same shape
+        """
+        y_true = y_true.double()
+        num_items = y_true.size(1)
+        positions = torch.arange(num_items, dtype=torch.double, device=y_true.device)
+        discount = math.log(self.log_base) / torch.log(positions + 2)
+        if self.k is not None:
+            discount[self.k:] = 0
+
+        scores, order = torch.sort(y_score, dim=1, descending=True)
+        gains = y_true.gather(1, order)
+
+        if not self.ignore_ties:
+            # tied scores share the mean gain of their group, groups are numbered across all samples
+            new_group = F.pad(scores[:, 1:] != scores[:, :-1], (1, 0), value=True)
+            group = torch.cumsum(new_group.flatten(), 0) - 1
+            # there are at most as many groups as items, sizing by that avoids reading the count
+            group_gain = torch.zeros(group.numel(), dtype=gains.dtype, device=gains.device)
+            group_gain.index_add_(0, group, gains.flatten())
+            group_size = torch.bincount(group, minlength=group.numel()).to(gains.dtype)
+            gains = (group_gain[group] / group_size[group]).view_as(gains)
+
+        self.sum_dcg += torch.sum(gains * discount)
+        self.total += y_true.size(0)
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the average discounted cumulative gain.
+        """
+        return (self.sum_dcg / self.total).float()
@@ -19,7 +19,8 @@ sync tensors between different processes in a DDP scenario, when needed.
 """
 
 import numbers
-from typing import Any, Callable, Optional, Union
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Union
 
 import numpy as np
 import torch
@@ -240,6 +241,140 @@ def _tensor_collection_metric_conversion(func_to_decorate: Callable) -> Callable
     return _tensor_collection_metric_output_conversion(func_convert_inputs)
 
 
+class SyncHandle(object):
+    """
+    Placeholder for a tensor queued in a :class:`DDPSyncCoordinator`.
+    The reduced value is only waited for when it is read with :meth:`wait`.
+    """
+
+    def __init__(self, coordinator: 'DDPSyncCoordinator'):
+        self._coordinator = coordinator
+        self._value = None
+        self.done = False
+
+    def wait(self) -> torch.Tensor:
+        """
+        Return:
+            the reduced value, blocking until the reduction of its bucket finished
+        """
+        if not self.done:
+            self._coordinator.wait()
+        return self._value
+
+    def _resolve(self, value: torch.Tensor):
+        self._value = value
+        self.done = True
+
+
+class DDPSyncCoordinator(object):
+    """
+    Queues tensors to be reduced across ddp processes and reduces them with as few collectives as possible.
+
+    All pending tensors sharing dtype, device, process group and reduction are flattened into
+    one contiguous buffer, which is reduced by a single asynchronous ``all_reduce`` on :meth:`flush`.
+    The results are only waited for when a value is read (see :meth:`SyncHandle.wait`).
+    Outside of ddp, queued tensors are returned as they are.
+
+    Example:
+
+        >>> coordinator = DDPSyncCoordinator()
+        >>> loss = coordinator.enqueue(torch.tensor(1.), reduce_op='mean')
+        >>> acc = coordinator.enqueue(torch.tensor(0.5), reduce_op='mean')
+        >>> coordinator.flush()
+        >>> loss.wait(), acc.wait()
+        (tensor(1.), tensor(0.5000))
+
+    """
+
+    def __init__(self):
+        self._pending = []
+        self._in_flight = []
+
+    def enqueue(self, tensor: Union[torch.Tensor, numbers.Number],
+                group: Optional[Any] = None,
+                reduce_op: Optional[Union[ReduceOp, str]] = None) -> SyncHandle:
+        """
+        Queues a tensor for reduction.
+
+        Args:
+            tensor: the value to sync and reduce (typically tensor or number)
+            group: the process group to gather results from. Defaults to all processes (world)
+            reduce_op: the reduction operation. Defaults to sum.
+                Can also be a string of 'sum', 'max', 'min' or 'avg', 'mean' to calculate the mean.
+
+        Return:
+            a handle to read the reduced value from
+        """
+        handle = SyncHandle(self)
+
+        if not (torch.distributed.is_available() and torch.distributed.is_initialized()):
+            handle._resolve(tensor)
+            return handle
+
+        if not isinstance(tensor, torch.Tensor):
+            tensor = torch.tensor(tensor, dtype=torch.float)
+
+        if group is None:
+            group = torch.distributed.group.WORLD
+
+        divide_by_world_size = isinstance(reduce_op, str) and reduce_op in ('avg', 'mean')
+        reduce_op = _resolve_reduce_op(reduce_op)
+
+        self._pending.append((handle, tensor, group, reduce_op, divide_by_world_size))
+        return handle
+
+    def flush(self):
+        """
+        Issues one asynchronous ``all_reduce`` per bucket of pending tensors.
+        """
+        buckets = []
+        for handle, tensor, group, reduce_op, divide_by_world_size in self._pending:
+            key = (tensor.dtype, tensor.device, group, reduce_op, divide_by_world_size)
+            for bucket_key, entries in buckets:
+                if bucket_key == key:
+                    entries.append((handle, tensor))
+                    break
+            else:
+                buckets.append((key, [(handle, tensor)]))
+        self._pending = []
+
+        for (_, _, group, reduce_op, divide_by_world_size), entries in buckets:
+            flat = torch.cat([tensor.reshape(-1) for _, tensor in entries])
+            work = torch.distributed.all_reduce(flat, op=reduce_op, group=group, async_op=True)
+            world_size = torch.distributed.get_world_size(group) if divide_by_world_size else None
+            self._in_flight.append((work, flat, entries, world_size))
+
+    def wait(self):
+        """
+        Flushes all pending tensors and blocks until all reductions finished.
+        """
+        self.flush()
+
+        for work, flat, entries, world_size in self._in_flight:
+            work.wait()
+            if world_size is not None:
+                flat = flat / world_size
+
+            for (handle, tensor), chunk in zip(entries, flat.split([tensor.numel() for _, tensor in entries])):
+                handle._resolve(chunk.view_as(tensor))
+        self._in_flight = []
+
+
+def _resolve_reduce_op(reduce_op: Optional[Union[ReduceOp, str]]) -> ReduceOp:
+    if reduce_op is None:
+        return torch.distributed.ReduceOp.SUM
+    if isinstance(reduce_op, str):
+        reduce_ops = {
+            'sum': torch.distributed.ReduceOp.SUM,
+            'avg': torch.distributed.ReduceOp.SUM,
+            'mean': torch.distributed.ReduceOp.SUM,
+            'max': torch.distributed.ReduceOp.MAX,
+            'min': torch.distributed.ReduceOp.MIN,
+        }
+        return reduce_ops[reduce_op]
+    return reduce_op
+
+
 def sync_ddp_if_available(result: Union[torch.Tensor],
                           group: Optional[Any] = None,
                           reduce_op: Optional[ReduceOp] = None
@@ -256,28 +391,56 @@ def sync_ddp_if_available(result: Union[torch.Tensor],
     Return:
         reduced value
     """
+    return DDPSyncCoordinator().enqueue(result, group=group, reduce_op=reduce_op).wait()
 
-    if torch.distributed.is_available() and torch.distributed.is_initialized():
-        divide_by_world_size = False
 
-        if group is None:
-            group = torch.distributed.group.WORLD
+def sync_collection_if_available(collection: Any,
+                                 group: Optional[Any] = None,
+                                 reduce_op: Optional[ReduceOp] = None
+                                 ) -> Any:
+    """
+    Function to reduce all tensors of a collection from several ddp processes at once.
+    Tensors sharing dtype and device are reduced by a single collective.
+
+    Args:
+        collection: the collection of tensors to sync and reduce
+        group: the process group to gather results from. Defaults to all processes (world)
+        reduce_op: the reduction operation. Defaults to sum.
+            Can also be a string of 'avg', 'mean' to calculate the mean during reduction.
 
-        if reduce_op is None:
-            reduce_op = torch.distributed.ReduceOp.SUM
-        elif isinstance(reduce_op, str) and reduce_op in ('avg', 'mean'):
-            reduce_op = torch.distributed.ReduceOp.SUM
-            divide_by_world_size = True
+    Return:
+        the collection of reduced tensors
+    """
+    coordinator = DDPSyncCoordinator()
+    handles = apply_to_collection(collection, torch.Tensor, coordinator.enqueue, group, reduce_op)
+    coordinator.wait()
+    return apply_to_collection(handles, SyncHandle, SyncHandle.wait)
 
-        # sync all processes before reduction
-        torch.distributed.barrier(group=group)
-        torch.distributed.all_reduce(result, op=reduce_op, group=group,
-                                     async_op=False)
 
-        if divide_by_world_size:
-            result = result / torch.distributed.get_world_size(group)
+def sync_ddp_states_if_available(states: Dict[str, torch.Tensor],
+                                 reductions: Dict[str, str],
+                                 group: Optional[Any] = None
+                                 ) -> Dict[str, torch.Tensor]:
+    """
+    Function to reduce several state tensors across ddp processes at once.
+    All tensors sharing dtype and reduction are flattened into a single buffer,
+    so only one collective is issued per bucket instead of one per tensor.
 
-    return result
+    Args:
+        states: the tensors to reduce, by name
+        reductions: the reduction per name. One of ``'sum'``, ``'max'`` or ``'min'``.
+        group: the process group to gather results from. Defaults to all processes (world)
+
+    Return:
+        reduced tensors, by name
+    """
+    coordinator = DDPSyncCoordinator()
+    handles = OrderedDict(
+        (name, coordinator.enqueue(tensor, group=group, reduce_op=reductions[name]))
+        for name, tensor in states.items()
+    )
+    coordinator.wait()
+    return OrderedDict((name, handle.wait()) for name, handle in handles.items())
 
 
 def gather_all_tensors_if_available(result: Union[torch.Tensor],
@@ -327,8 +490,7 @@ def sync_ddp(group: Optional[Any] = None,
     """
 
     def decorator_fn(func_to_decorate):
-        return _apply_to_outputs(apply_to_collection, torch.Tensor,
-                                 sync_ddp_if_available, group=group,
+        return _apply_to_outputs(sync_collection_if_available, group=group,
                                  reduce_op=reduce_op)(func_to_decorate)
 
     return decorator_fn
@@ -3,10 +3,12 @@ from pytorch_lightning.metrics.functional.classification import (
     auc,
     auroc,
     average_precision,
+    classification_scores,
     confusion_matrix,
     dice_score,
     f1_score,
     fbeta_score,
+    multiclass_auroc,
     multiclass_precision_recall_curve,
     multiclass_roc,
     precision,
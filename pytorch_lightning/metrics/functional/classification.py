@@ -1,5 +1,5 @@
 from functools import wraps
-from typing import Callable, Optional, Sequence, Tuple
+from typing import Callable, Dict, Optional, Sequence, Tuple
 
 import torch
 from torch.nn import functional as F
@@ -7,6 +7,9 @@ from torch.nn import functional as F
 from pytorch_lightning.metrics.functional.reduction import reduce
 from pytorch_lightning.utilities import FLOAT16_EPSILON, rank_zero_warn
 
+# largest confusion matrix counted with a single bincount, bigger ones are derived from label counts
+_MAX_CONFMAT_BINS = 2 ** 24
+
 
 def to_onehot(
         tensor: torch.Tensor,
@@ -92,6 +95,125 @@ def get_num_classes(
     return num_classes
 
 
+def _confusion_matrix_update(
+        pred: torch.Tensor,
+        target: torch.Tensor,
+        num_classes: int,
+        ignore_index: Optional[int] = None,
+        multilabel: bool = False,
+        argmax_dim: int = 1,
+) -> torch.Tensor:
+    """
+    Counts the samples of every combination of target and predicted label with a single ``bincount``.
+
+    For multiclass data, labels at or above ``num_classes`` are counted in an extra overflow class,
+    so the returned matrix has ``num_classes + 1`` rows (targets) and columns (predictions).
+    For multilabel data, ``pred`` and ``target`` hold a binary indicator per label along ``argmax_dim``
+    and the returned tensor has shape ``[num_classes, 2, 2]``, one binary matrix per label.
+
+    Args:
+        pred: predicted labels, probabilities or (multilabel) binary indicators
+        target: ground truth labels or (multilabel) binary indicators
+        num_classes: number of classes or labels
+        ignore_index: target value of samples which are left out
+        multilabel: whether ``pred`` and ``target`` are multilabel indicators
+        argmax_dim: the class dimension
+
+    Return:
+        confusion matrix as long tensor
+    """
+    if multilabel:
+        if pred.is_floating_point():
+            pred = pred >= 0.5
+        pred = pred.transpose(argmax_dim, -1).reshape(-1, num_classes).long()
+        target = target.transpose(argmax_dim, -1).reshape(-1, num_classes).long()
+        labels = torch.arange(num_classes, device=pred.device).expand_as(pred)
+
+        if ignore_index is not None:
+            keep = target != ignore_index
+            pred, target, labels = pred[keep], target[keep], labels[keep]
+
+        bins = torch.bincount((labels * 4 + target * 2 + pred).flatten(), minlength=num_classes * 4)
+        return bins.view(num_classes, 2, 2)
+
+    if pred.ndim == target.ndim + 1:
+        pred = to_categorical(pred, argmax_dim=argmax_dim)
+    pred = pred.flatten().long()
+    target = target.flatten().long()
+
+    if ignore_index is not None:
+        keep = target != ignore_index
+        pred, target = pred[keep], target[keep]
+
+    pred = pred.clamp_max(num_classes)
+    target = target.clamp_max(num_classes)
+    bins = torch.bincount(target * (num_classes + 1) + pred, minlength=(num_classes + 1) ** 2)
+    return bins.view(num_classes + 1, num_classes + 1)
+
+
+def _stat_scores_from_confmat(
+        confmat: torch.Tensor,
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    Derives the true positives, false positives, true negatives, false negatives and the support
+    of each class from a confusion matrix computed by ``_confusion_matrix_update``.
+    """
+    confmat = confmat.float()
+    if confmat.ndim == 3:
+        # multilabel, one [target, pred] matrix per label
+        tns, fps, fns, tps = confmat.flatten(1).unbind(1)
+        return tps, fps, tns, fns, tps + fns
+
+    num_classes = confmat.size(0) - 1
+    tps = confmat.diagonal()[:num_classes]
+    sups = confmat.sum(1)[:num_classes]
+    fps = confmat.sum(0)[:num_classes] - tps
+    fns = sups - tps
+    tns = confmat.sum() - (tps + fps + fns)
+    return tps, fps, tns, fns, sups
+
+
+def _precision_recall_from_stat_scores(
+        tps: torch.Tensor,
+        fps: torch.Tensor,
+        fns: torch.Tensor,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    precision = tps / (tps + fps)
+    recall = tps / (tps + fns)
+
+    # solution by justus, see https://discuss.pytorch.org/t/how-to-set-nan-in-tensor-to-0/3918/9
+    precision[precision != precision] = 0
+    recall[recall != recall] = 0
+    return precision, recall
+
+
+def _fbeta_from_precision_recall(precision: torch.Tensor, recall: torch.Tensor, beta: float) -> torch.Tensor:
+    fbeta = (1 + beta ** 2) * precision * recall / ((beta ** 2) * precision + recall)
+    # drop NaN after zero division
+    fbeta[fbeta != fbeta] = 0
+    return fbeta
+
+
+def _iou_from_stat_scores(tps: torch.Tensor, fps: torch.Tensor, fns: torch.Tensor) -> torch.Tensor:
+    denom = fps + fns + tps
+    denom[denom == 0] = torch.tensor(FLOAT16_EPSILON).type_as(denom)
+    return tps / denom
+
+
+def _dice_from_stat_scores(
+        tps: torch.Tensor,
+        fps: torch.Tensor,
+        fns: torch.Tensor,
+        sups: torch.Tensor,
+        nan_score: float = 0.0,
+        no_fg_score: float = 0.0,
+) -> torch.Tensor:
+    denom = 2 * tps + fps + fns
+    scores = torch.where(denom > 0, 2 * tps / denom.clamp_min(1), torch.full_like(tps, nan_score))
+    # classes without foreground in the target
+    return torch.where(sups > 0, scores, torch.full_like(tps, no_fg_score))
+
+
 def stat_scores(
         pred: torch.Tensor,
         target: torch.Tensor,
@@ -138,6 +260,7 @@ def stat_scores_multiple_classes(
         num_classes: Optional[int] = None,
         argmax_dim: int = 1,
         reduction: str = 'none',
+        ignore_index: Optional[int] = None,
 ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
     """
     Calculates the number of true positive, false positive, true negative
@@ -156,6 +279,8 @@ def stat_scores_multiple_classes(
             - none: pass array
             - sum: add elements
 
+        ignore_index: target value of samples which are not counted
+
     Return:
         True Positive, False Positive, True Negative, False Negative, Support
 
@@ -176,61 +301,40 @@ def stat_scores_multiple_classes(
         tensor([1., 0., 1., 1.])
 
     """
+    possible_reductions = ('none', 'sum', 'elementwise_mean')
+    if reduction not in possible_reductions:
+        raise ValueError("reduction type %s not supported" % reduction)
+
     if pred.ndim == target.ndim + 1:
         pred = to_categorical(pred, argmax_dim=argmax_dim)
 
     num_classes = get_num_classes(pred=pred, target=target, num_classes=num_classes)
 
-    if pred.dtype != torch.bool:
-        pred = pred.clamp_max(max=num_classes)
-    if target.dtype != torch.bool:
-        target = target.clamp_max(max=num_classes)
-
-    possible_reductions = ('none', 'sum', 'elementwise_mean')
-    if reduction not in possible_reductions:
-        raise ValueError("reduction type %s not supported" % reduction)
-
-    if reduction == 'none':
-        pred = pred.view((-1, )).long()
-        target = target.view((-1, )).long()
-
-        tps = torch.zeros((num_classes + 1,), device=pred.device)
-        fps = torch.zeros((num_classes + 1,), device=pred.device)
-        tns = torch.zeros((num_classes + 1,), device=pred.device)
-        fns = torch.zeros((num_classes + 1,), device=pred.device)
-        sups = torch.zeros((num_classes + 1,), device=pred.device)
-
-        match_true = (pred == target).float()
-        match_false = 1 - match_true
-
-        tps.scatter_add_(0, pred, match_true)
-        fps.scatter_add_(0, pred, match_false)
-        fns.scatter_add_(0, target, match_false)
-        tns = pred.size(0) - (tps + fps + fns)
-        sups.scatter_add_(0, target, torch.ones_like(match_true))
-
-        tps = tps[:num_classes]
-        fps = fps[:num_classes]
-        tns = tns[:num_classes]
-        fns = fns[:num_classes]
-        sups = sups[:num_classes]
-
-    elif reduction == 'sum' or reduction == 'elementwise_mean':
-        count_match_true = (pred == target).sum().float()
-        oob_tp, oob_fp, oob_tn, oob_fn, oob_sup = stat_scores(pred, target, num_classes, argmax_dim)
-
-        tps = count_match_true - oob_tp
-        fps = pred.nelement() - count_match_true - oob_fp
-        fns = pred.nelement() - count_match_true - oob_fn
-        tns = pred.nelement() * (num_classes + 1) - (tps + fps + fns + oob_tn)
-        sups = pred.nelement() - oob_sup.float()
-
-        if reduction == 'elementwise_mean':
-            tps /= num_classes
-            fps /= num_classes
-            fns /= num_classes
-            tns /= num_classes
-            sups /= num_classes
+    if (num_classes + 1) ** 2 <= _MAX_CONFMAT_BINS:
+        confmat = _confusion_matrix_update(pred, target, num_classes, ignore_index=ignore_index)
+        tps, fps, tns, fns, sups = _stat_scores_from_confmat(confmat)
+    else:
+        # the confusion matrix would not fit, count the labels instead
+        pred = pred.flatten().long()
+        target = target.flatten().long()
+        if ignore_index is not None:
+            keep = target != ignore_index
+            pred, target = pred[keep], target[keep]
+        pred = pred.clamp_max(num_classes)
+        target = target.clamp_max(num_classes)
+
+        def _count(labels):
+            return torch.bincount(labels, minlength=num_classes + 1)[:num_classes].float()
+
+        match = pred == target
+        tps = _count(target[match])
+        sups = _count(target)
+        fps = _count(pred) - tps
+        fns = sups - tps
+        tns = target.numel() - (tps + fps + fns)
+
+    if reduction != 'none':
+        tps, fps, tns, fns, sups = (reduce(x, reduction=reduction) for x in (tps, fps, tns, fns, sups))
 
     return tps, fps, tns, fns, sups
 
@@ -279,7 +383,8 @@ def confusion_matrix(
         pred: torch.Tensor,
         target: torch.Tensor,
         normalize: bool = False,
-        num_classes: Optional[int] = None
+        num_classes: Optional[int] = None,
+        ignore_index: Optional[int] = None,
 ) -> torch.Tensor:
     """
     Computes the confusion matrix C where each entry C_{i,j} is the number of observations
@@ -290,6 +395,7 @@ def confusion_matrix(
         target: ground truth labels
         normalize: normalizes confusion matrix
         num_classes: number of classes
+        ignore_index: target value of samples which are not counted
 
     Return:
         Tensor, confusion matrix C [num_classes, num_classes ]
@@ -306,13 +412,12 @@ def confusion_matrix(
     """
     num_classes = get_num_classes(pred, target, num_classes)
 
-    unique_labels = (target.view(-1) * num_classes + pred.view(-1)).to(torch.int)
-
-    bins = torch.bincount(unique_labels, minlength=num_classes ** 2)
-    cm = bins.reshape(num_classes, num_classes).squeeze().float()
+    # drop the overflow class of labels out of range
+    confmat = _confusion_matrix_update(pred, target, num_classes, ignore_index=ignore_index)
+    cm = confmat[:num_classes, :num_classes].squeeze().float()
 
     if normalize:
-        cm = cm / cm.sum(-1)
+        cm = cm / cm.sum(-1, keepdim=True)
 
     return cm
 
@@ -349,17 +454,7 @@ def precision_recall(
 
     """
     tps, fps, tns, fns, sups = stat_scores_multiple_classes(pred=pred, target=target, num_classes=num_classes)
-
-    tps = tps.to(torch.float)
-    fps = fps.to(torch.float)
-    fns = fns.to(torch.float)
-
-    precision = tps / (tps + fps)
-    recall = tps / (tps + fns)
-
-    # solution by justus, see https://discuss.pytorch.org/t/how-to-set-nan-in-tensor-to-0/3918/9
-    precision[precision != precision] = 0
-    recall[recall != recall] = 0
+    precision, recall = _precision_recall_from_stat_scores(tps, fps, fns)
 
     precision = reduce(precision, reduction=reduction)
     recall = reduce(recall, reduction=reduction)
@@ -475,14 +570,7 @@ def fbeta_score(
     prec, rec = precision_recall(pred=pred, target=target,
                                  num_classes=num_classes,
                                  reduction='none')
-
-    nom = (1 + beta ** 2) * prec * rec
-    denom = ((beta ** 2) * prec + rec)
-    fbeta = nom / denom
-
-    # drop NaN after zero division
-    fbeta[fbeta != fbeta] = 0
-
+    fbeta = _fbeta_from_precision_recall(prec, rec, beta)
     return reduce(fbeta, reduction=reduction)
 
 
@@ -565,6 +653,55 @@ def _binary_clf_curve(
     return fps, tps, pred[threshold_idxs]
 
 
+def _multiclass_clf_curve(
+        pred: torch.Tensor,
+        target: torch.Tensor,
+        sample_weight: Optional[Sequence] = None,
+        num_classes: Optional[int] = None,
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    Computes the false and true positive counts of all classes with a single sort of the scores.
+    ``target`` holds either the labels or, with shape ``[N, C]``, the binary targets of each class.
+
+    Return:
+        false positives, true positives and thresholds of shape ``[N, C]``, where column ``c`` holds the
+        counts of class ``c`` with its scores sorted in descending order, and a mask of the same shape
+        which marks the last sample of every distinct threshold, i.e. the points of the curves.
+    """
+    if sample_weight is not None and not isinstance(sample_weight, torch.Tensor):
+        sample_weight = torch.tensor(sample_weight, device=pred.device, dtype=torch.float)
+
+    if target.ndim == 2:
+        pred, order = torch.sort(pred, dim=0, descending=True)
+        target = torch.gather(target, 0, order).to(torch.long)
+    else:
+        num_classes = get_num_classes(pred, target, num_classes)
+        pred, order = torch.sort(pred[:, :num_classes], dim=0, descending=True)
+        classes = torch.arange(num_classes, device=target.device)
+        target = (target[order] == classes).to(torch.long)
+
+    if sample_weight is not None:
+        weight = sample_weight[order]
+        tps = torch.cumsum(target * weight, dim=0)
+        # express fps as a cumsum to ensure fps is increasing even in
+        # the presence of floating point errors
+        fps = torch.cumsum((1 - target) * weight, dim=0)
+    else:
+        tps = torch.cumsum(target, dim=0).to(torch.float)
+        fps = torch.arange(1, pred.size(0) + 1, device=pred.device, dtype=torch.float).unsqueeze(1) - tps
+
+    # pred typically has many tied values, only the last sample of each distinct value is a point of the curve
+    mask = torch.cat([pred[1:] != pred[:-1], torch.ones_like(pred[:1], dtype=torch.bool)])
+    return fps, tps, pred, mask
+
+
+def _split_columns(mask: torch.Tensor, *tensors: torch.Tensor) -> Tuple[Tuple[torch.Tensor, ...], ...]:
+    """Splits the masked entries of each column into one tuple of tensors per column."""
+    lengths = mask.sum(dim=0).tolist()
+    columns = [torch.split(t.t()[mask.t()], lengths) for t in tensors]
+    return tuple(zip(*columns))
+
+
 def roc(
         pred: torch.Tensor,
         target: torch.Tensor,
@@ -651,16 +788,43 @@ def multiclass_roc(
          (tensor([0.0000, 0.3333, 1.0000]), tensor([0., 0., 1.]), tensor([1.8500, 0.8500, 0.0500])),
          (tensor([0.0000, 0.3333, 1.0000]), tensor([0., 0., 1.]), tensor([1.8500, 0.8500, 0.0500])))
     """
-    num_classes = get_num_classes(pred, target, num_classes)
+    fpr, tpr, thresholds, mask = _multiclass_roc(pred=pred, target=target,
+                                                 sample_weight=sample_weight,
+                                                 num_classes=num_classes)
+    return _split_columns(mask, fpr, tpr, thresholds)
+
+
+def _multiclass_roc(
+        pred: torch.Tensor,
+        target: torch.Tensor,
+        sample_weight: Optional[Sequence] = None,
+        num_classes: Optional[int] = None,
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    Computes the ROC curves of all classes as ``[N + 1, C]`` tensors, see :func:`_multiclass_clf_curve`.
+    """
+    fps, tps, thresholds, mask = _multiclass_clf_curve(pred=pred, target=target,
+                                                       sample_weight=sample_weight,
+                                                       num_classes=num_classes)
+
+    # Add an extra threshold position
+    # to make sure that the curves start at (0, 0)
+    tps = torch.cat([torch.zeros_like(tps[:1]), tps])
+    fps = torch.cat([torch.zeros_like(fps[:1]), fps])
+    thresholds = torch.cat([thresholds[:1] + 1, thresholds])
+    mask = torch.cat([torch.ones_like(mask[:1]), mask])
+
+    if (fps[-1] <= 0).any():
+        raise ValueError("No negative samples in targets, false positive value should be meaningless")
+
+    fpr = fps / fps[-1]
 
-    class_roc_vals = []
-    for c in range(num_classes):
-        pred_c = pred[:, c]
+    if (tps[-1] <= 0).any():
+        raise ValueError("No positive samples in targets, true positive value should be meaningless")
 
-        class_roc_vals.append(roc(pred=pred_c, target=target,
-                                  sample_weight=sample_weight, pos_label=c))
+    tpr = tps / tps[-1]
 
-    return tuple(class_roc_vals)
+    return fpr, tpr, thresholds, mask
 
 
 def precision_recall_curve(
@@ -756,18 +920,26 @@ def multiclass_precision_recall_curve(
         >>> thresholds   # doctest: +NORMALIZE_WHITESPACE
         (tensor([0.2500, 0.0000, 1.0000]), tensor([1., 0., 0.]), tensor([0.0500, 0.8500]))
     """
-    num_classes = get_num_classes(pred, target, num_classes)
+    fps, tps, thresholds, mask = _multiclass_clf_curve(pred=pred, target=target,
+                                                       sample_weight=sample_weight,
+                                                       num_classes=num_classes)
+
+    precision = tps / (tps + fps)
+    recall = tps / tps[-1]
 
-    class_pr_vals = []
-    for c in range(num_classes):
-        pred_c = pred[:, c]
+    # stop when full recall attained, which is the first point with all true positives
+    full_recall = torch.cumsum((mask & (tps == tps[-1])).to(torch.long), dim=0)
+    mask = mask & (full_recall <= 1)
 
-        class_pr_vals.append(precision_recall_curve(
-            pred=pred_c,
-            target=target,
-            sample_weight=sample_weight, pos_label=c))
+    # reverse the outputs so recall is decreasing
+    mask = torch.flip(mask, [0])
+    precision = torch.cat([torch.flip(precision, [0]), torch.ones_like(precision[:1])])
+    recall = torch.cat([torch.flip(recall, [0]), torch.zeros_like(recall[:1])])
+    thresholds = torch.flip(thresholds, [0])
 
-    return tuple(class_pr_vals)
+    curves = _split_columns(torch.cat([mask, torch.ones_like(mask[:1])]), precision, recall)
+    class_thresholds = _split_columns(mask, thresholds)
+    return tuple(curve + thr for curve, thr in zip(curves, class_thresholds))
 
 
 def auc(
@@ -872,6 +1044,85 @@ def auroc(
     return _auroc(pred=pred, target=target, sample_weight=sample_weight, pos_label=pos_label)
 
 
+def multiclass_auroc(
+        pred: torch.Tensor,
+        target: torch.Tensor,
+        sample_weight: Optional[Sequence] = None,
+        num_classes: Optional[int] = None,
+        average: str = 'macro',
+) -> torch.Tensor:
+    """
+    Compute Area Under the Receiver Operating Characteristic Curve (ROC AUC) of multiclass scores.
+    The curves of all classes are computed at once, see :func:`multiclass_roc`.
+
+    Args:
+        pred: estimated probabilities with shape [N, C]
+        target: ground-truth labels
+        sample_weight: sample weights
+        num_classes: number of classes (default: None, computes automatically from data)
+        average: method to combine the scores of the classes
+
+            - ``'macro'``: mean of the class scores
+            - ``'weighted'``: mean of the class scores, weighted by the number of samples of each class
+            - ``'micro'``: score of all classes taken as one binary problem
+            - ``'none'``: score of each class
+
+    Return:
+        Tensor containing ROCAUC score
+
+    Example:
+
+        >>> pred = torch.tensor([[0.75, 0.05, 0.05, 0.05],
+        ...                      [0.05, 0.75, 0.05, 0.05],
+        ...                      [0.05, 0.05, 0.75, 0.05],
+        ...                      [0.05, 0.05, 0.05, 0.75],
+        ...                      [0.05, 0.75, 0.05, 0.05]])
+        >>> target = torch.tensor([0, 1, 3, 2, 1])
+        >>> multiclass_auroc(pred, target, average='none')
+        tensor([1.0000, 1.0000, 0.3750, 0.3750])
+        >>> multiclass_auroc(pred, target)
+        tensor(0.6875)
+    """
+    if sample_weight is not None and not isinstance(sample_weight, torch.Tensor):
+        sample_weight = torch.tensor(sample_weight, device=pred.device, dtype=torch.float)
+
+    if average == 'micro':
+        # all classes as one binary problem
+        num_classes = get_num_classes(pred, target, num_classes)
+        if sample_weight is not None:
+            sample_weight = sample_weight.repeat_interleave(num_classes)
+        fpr, tpr, _, mask = _multiclass_roc(pred=pred[:, :num_classes].reshape(-1, 1),
+                                            target=to_onehot(target, num_classes).reshape(-1, 1),
+                                            sample_weight=sample_weight)
+        return _columns_auc(fpr, tpr, mask)[0]
+
+    if average not in ('macro', 'weighted', 'none'):
+        raise ValueError(f"average has to be one of 'macro', 'weighted', 'micro' or 'none', got {average}")
+
+    fpr, tpr, _, mask = _multiclass_roc(pred=pred, target=target,
+                                        sample_weight=sample_weight,
+                                        num_classes=num_classes)
+    class_auroc = _columns_auc(fpr, tpr, mask)
+
+    if average == 'none':
+        return class_auroc
+    if average == 'weighted':
+        support = torch.bincount(target, weights=sample_weight, minlength=mask.size(1))[:mask.size(1)]
+        return torch.sum(class_auroc * support / support.sum())
+    return class_auroc.mean()
+
+
+def _columns_auc(x: torch.Tensor, y: torch.Tensor, mask: torch.Tensor) -> torch.Tensor:
+    """Computes the area under the masked points of each column with the trapezoidal rule."""
+    columns = mask.t().nonzero()[:, 0]
+    x, y = x.t()[mask.t()], y.t()[mask.t()]
+    areas = (x[1:] - x[:-1]) * (y[1:] + y[:-1]) / 2
+    same_column = columns[1:] == columns[:-1]
+    return torch.zeros(mask.size(1), dtype=areas.dtype, device=areas.device).index_add_(
+        0, columns[1:][same_column], areas[same_column]
+    )
+
+
 def average_precision(
         pred: torch.Tensor,
         target: torch.Tensor,
@@ -946,20 +1197,11 @@ def dice_score(
     """
     num_classes = pred.shape[1]
     bg = (1 - int(bool(bg)))
-    scores = torch.zeros(num_classes - bg, device=pred.device, dtype=torch.float32)
-    for i in range(bg, num_classes):
-        if not (target == i).any():
-            # no foreground class
-            scores[i - bg] += no_fg_score
-            continue
-
-        tp, fp, tn, fn, sup = stat_scores(pred=pred, target=target, class_index=i)
-        denom = (2 * tp + fp + fn).to(torch.float)
-        # nan result
-        score_cls = (2 * tp).to(torch.float) / denom if torch.is_nonzero(denom) else nan_score
 
-        scores[i - bg] += score_cls
-    return reduce(scores, reduction=reduction)
+    confmat = _confusion_matrix_update(pred, target, num_classes)
+    tps, fps, tns, fns, sups = _stat_scores_from_confmat(confmat)
+    scores = _dice_from_stat_scores(tps, fps, fns, sups, nan_score=nan_score, no_fg_score=no_fg_score)
+    return reduce(scores[bg:], reduction=reduction)
 
 
 def iou(
@@ -1005,7 +1247,90 @@ def iou(
         tps = tps[1:]
         fps = fps[1:]
         fns = fns[1:]
-    denom = fps + fns + tps
-    denom[denom == 0] = torch.tensor(FLOAT16_EPSILON).type_as(denom)
-    iou = tps / denom
+    iou = _iou_from_stat_scores(tps, fps, fns)
     return reduce(iou, reduction=reduction)
+
+
+def classification_scores(
+        pred: torch.Tensor,
+        target: torch.Tensor,
+        num_classes: Optional[int] = None,
+        ignore_index: Optional[int] = None,
+        multilabel: bool = False,
+        beta: float = 1.,
+        reduction: str = 'elementwise_mean',
+) -> Dict[str, torch.Tensor]:
+    """
+    Computes accuracy, precision, recall, F-beta, IoU and dice score from a single confusion matrix,
+    which is counted with one pass over the data.
+
+    Args:
+        pred: predicted labels or probabilities, for multilabel data binary indicators or probabilities
+        target: ground truth labels, for multilabel data binary indicators
+        num_classes: number of classes, required for multilabel data
+        ignore_index: target value of samples which are not counted
+        multilabel: whether ``pred`` and ``target`` hold a binary indicator per label along dimension 1
+        beta: weights recall when combining the F-beta score
+        reduction: a method to reduce metric score over labels (default: takes the mean)
+            Available reduction methods:
+
+            - elementwise_mean: takes the mean
+            - none: pass array
+            - sum: add elements
+
+    Return:
+        dict with the ``'accuracy'``, ``'precision'``, ``'recall'``, ``'fbeta'``, ``'iou'`` and ``'dice'`` scores.
+        For multilabel data the accuracy is the fraction of correctly predicted label indicators.
+
+    Example:
+
+        >>> x = torch.tensor([0, 1, 2, 3])
+        >>> y = torch.tensor([0, 1, 2, 2])
+        >>> scores = classification_scores(x, y)
+        >>> scores['accuracy'], scores['precision'], scores['recall'], scores['fbeta']
+        (tensor(0.7500), tensor(0.7500), tensor(0.6250), tensor(0.6667))
+        >>> scores['iou'], scores['dice']
+        (tensor(0.6250), tensor(0.6667))
+
+    """
+    if multilabel:
+        if num_classes is None:
+            num_classes = pred.shape[1]
+    else:
+        if pred.ndim == target.ndim + 1:
+            pred = to_categorical(pred)
+        num_classes = get_num_classes(pred=pred, target=target, num_classes=num_classes)
+
+    confmat = _confusion_matrix_update(pred, target, num_classes, ignore_index=ignore_index, multilabel=multilabel)
+    return _scores_from_confmat(confmat, beta=beta, reduction=reduction)
+
+
+def _scores_from_confmat(
+        confmat: torch.Tensor,
+        beta: float = 1.,
+        reduction: str = 'elementwise_mean',
+) -> Dict[str, torch.Tensor]:
+    tps, fps, tns, fns, sups = _stat_scores_from_confmat(confmat)
+    precision, recall = _precision_recall_from_stat_scores(tps, fps, fns)
+
+    if confmat.ndim == 3:
+        # multilabel, the fraction of correct indicators
+        correct, total = tps + tns, tps + fps + tns + fns
+    else:
+        correct, total = tps, sups
+
+    if reduction == 'none':
+        accuracy = correct / total
+    else:
+        accuracy = correct.sum() / total.sum()
+
+    scores = {
+        'accuracy': accuracy,
+        'precision': precision,
+        'recall': recall,
+        'fbeta': _fbeta_from_precision_recall(precision, recall, beta),
+        'iou': _iou_from_stat_scores(tps, fps, fns),
+        'dice': _dice_from_stat_scores(tps, fps, fns, sups),
+    }
+    return {name: score if name == 'accuracy' else reduce(score, reduction=reduction)
+            for name, score in scores.items()}
@@ -3,32 +3,205 @@
 # Authors: torchtext authors and @sluks
 # Date: 2020-07-18
 # Link: https://pytorch.org/text/_modules/torchtext/data/metrics.html#bleu_score
-from collections import Counter
-from typing import List, Sequence
+from typing import Iterator, List, Sequence, Tuple
 
 import torch
 
+# bound on the number of padded token ids of the translations and references converted to tensors at once
+_BLEU_CHUNK_NUMEL = 2 ** 22
 
-def _count_ngram(ngram_input_list: List[str], n_gram: int) -> Counter:
+
+def _ngrams(
+        tokens: torch.Tensor,
+        lengths: torch.Tensor,
+        n: int,
+        group_ids: torch.Tensor,
+) -> torch.Tensor:
     """
-    Counting how many times each word appears in a given text with ngram
+    Extracts all n-grams of a padded batch of token ids
 
     Args:
-        ngram_input_list: A list of translated text or reference texts
-        n_gram: gram value ranged 1 to 4
+        tokens: token ids of shape ``[..., T]``
+        lengths: number of valid tokens of each sequence, of shape ``[...]``
+        n: the n-gram order
+        group_ids: ids prepended to the n-grams of each sequence, of shape ``[..., K]``
 
     Return:
-        ngram_counter: a collections.Counter object of ngram
+        the valid n-grams as rows of ``K`` group ids followed by the ``n`` token ids
+    """
+    if tokens.size(-1) < n:
+        return tokens.new_empty(0, group_ids.size(-1) + n)
+
+    windows = tokens.unfold(-1, n, 1)
+    positions = torch.arange(windows.size(-2), device=tokens.device)
+    valid = positions + n <= lengths.unsqueeze(-1)
+
+    # select the valid windows before attaching the group ids, so no padded n-gram rows are built
+    sequence_index = valid.nonzero()[:, :-1]
+    group_ids = group_ids[tuple(sequence_index.t())]
+    return torch.cat([group_ids, windows[valid]], dim=-1)
+
+
+def _unique_counts(rows: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    if rows.size(0) == 0:
+        empty = rows.new_empty(0)
+        return rows, empty, empty
+    return torch.unique(rows, dim=0, return_inverse=True, return_counts=True)
+
+
+def _bleu_score_update(
+        translate: torch.Tensor,
+        translate_lengths: torch.Tensor,
+        references: torch.Tensor,
+        reference_lengths: torch.Tensor,
+        n_gram: int = 4,
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    Computes the sufficient statistics of the BLEU score of a batch of token ids
+
+    Args:
+        translate: token ids of the translations, of shape ``[B, T]``
+        translate_lengths: number of tokens of each translation, of shape ``[B]``
+        references: token ids of the references, of shape ``[B, R, L]``
+        reference_lengths: number of tokens of each reference, of shape ``[B, R]``.
+            References of length 0 are ignored when choosing the closest reference length.
+        n_gram: the maximal n-gram order
+
+    Return:
+        clipped n-gram matches and n-gram counts per order, total translation and reference length
+    """
+    device = translate.device
+    batch_size, num_refs = reference_lengths.shape
+    sentence_ids = torch.arange(batch_size, device=device)
+    ref_ids = torch.arange(num_refs, device=device)
+    ref_group_ids = torch.stack([sentence_ids.unsqueeze(1).expand(-1, num_refs),
+                                 ref_ids.unsqueeze(0).expand(batch_size, -1)], dim=-1)
+
+    numerator = torch.zeros(n_gram, dtype=torch.long, device=device)
+    denominator = torch.zeros(n_gram, dtype=torch.long, device=device)
+
+    for n in range(1, n_gram + 1):
+        translation_ngrams = _ngrams(translate, translate_lengths, n, sentence_ids.unsqueeze(1))
+        reference_ngrams = _ngrams(references, reference_lengths, n, ref_group_ids)
+
+        # number the repetitions of an n-gram within each reference, the distinct (n-gram, repetition)
+        # pairs over all references of a sentence are the maximal count of the n-gram in any reference
+        _, inverse, counts = _unique_counts(reference_ngrams)
+        sorted_inverse, order = torch.sort(inverse)
+        group_start = torch.cumsum(counts, 0) - counts
+        repetition = torch.empty_like(inverse)
+        repetition[order] = torch.arange(inverse.numel(), device=device) - group_start[sorted_inverse]
+        reference_ngrams = torch.cat([reference_ngrams[:, :1], reference_ngrams[:, 2:], repetition.unsqueeze(1)], 1)
+        reference_ngrams, _, _ = _unique_counts(reference_ngrams)
+        reference_ngrams, _, max_ref_counts = _unique_counts(reference_ngrams[:, :-1])
+
+        translation_ngrams, _, translation_counts = _unique_counts(translation_ngrams)
+
+        # clip the counts of the n-grams found in both
+        _, inverse, _ = _unique_counts(torch.cat([translation_ngrams, reference_ngrams]))
+        num_translation = translation_ngrams.size(0)
+        clipped = torch.zeros(inverse.numel(), dtype=torch.long, device=device)
+        clipped.index_add_(0, inverse[:num_translation], translation_counts)
+        max_counts = torch.zeros_like(clipped)
+        max_counts.index_add_(0, inverse[num_translation:], max_ref_counts)
+
+        numerator[n - 1] = torch.min(clipped, max_counts).sum()
+        denominator[n - 1] = translation_counts.sum()
+
+    # the length of the reference closest to the translation, the first one among ties
+    length_diff = torch.abs(reference_lengths - translate_lengths.unsqueeze(1))
+    length_diff[reference_lengths == 0] = torch.iinfo(length_diff.dtype).max
+    length_diff[(reference_lengths == 0).all(1), 0] = 0
+    closest = torch.argmin(length_diff, dim=1)
+    ref_len = reference_lengths.gather(1, closest.unsqueeze(1)).sum()
+
+    return numerator, denominator, translate_lengths.sum(), ref_len
+
+
+def _bleu_score_compute(
+        numerator: torch.Tensor,
+        denominator: torch.Tensor,
+        trans_len: torch.Tensor,
+        ref_len: torch.Tensor,
+        n_gram: int = 4,
+        smooth: bool = False,
+) -> torch.Tensor:
+    """
+    Computes the BLEU score from the statistics of ``_bleu_score_update``
+    """
+    if min(numerator) == 0.0:
+        return torch.tensor(0.0, device=numerator.device)
+
+    numerator = numerator.double()
+    denominator = denominator.double()
+    if smooth:
+        precision_scores = (numerator + 1) / (denominator + 1)
+    else:
+        precision_scores = numerator / denominator
+
+    log_precision_scores = torch.log(precision_scores) / n_gram
+    geometric_mean = torch.exp(torch.sum(log_precision_scores))
+    brevity_penalty = torch.tensor(1.0) if trans_len > ref_len else torch.exp(1 - ref_len.double() / trans_len)
+    bleu = brevity_penalty * geometric_mean
+
+    return bleu.float()
+
+
+def _tokens_to_ids(
+        translate_corpus: Sequence[Sequence[str]],
+        reference_corpus: Sequence[Sequence[Sequence[str]]],
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
     """
+    Maps tokenized sentences to padded tensors of token ids and their lengths
+    """
+    vocab = {}
+
+    def _ids(sentence):
+        return [vocab.setdefault(token, len(vocab)) for token in sentence]
+
+    translations = [_ids(translation) for translation in translate_corpus]
+    references = [[_ids(ref) for ref in refs] for refs in reference_corpus]
 
-    ngram_counter = Counter()
+    max_len = max([len(t) for t in translations] + [len(r) for refs in references for r in refs] + [0])
+    num_refs = max([len(refs) for refs in references] + [1])
 
-    for i in range(1, n_gram + 1):
-        for j in range(len(ngram_input_list) - i + 1):
-            ngram_key = tuple(ngram_input_list[j:(i + j)])
-            ngram_counter[ngram_key] += 1
+    translate = torch.zeros(len(translations), max_len, dtype=torch.long)
+    translate_lengths = torch.tensor([len(t) for t in translations], dtype=torch.long)
+    ref_tokens = torch.zeros(len(references), num_refs, max_len, dtype=torch.long)
+    reference_lengths = torch.zeros(len(references), num_refs, dtype=torch.long)
+    for i, (translation, refs) in enumerate(zip(translations, references)):
+        translate[i, :len(translation)] = torch.tensor(translation, dtype=torch.long)
+        for j, ref in enumerate(refs):
+            ref_tokens[i, j, :len(ref)] = torch.tensor(ref, dtype=torch.long)
+            reference_lengths[i, j] = len(ref)
 
-    return ngram_counter
+    return translate, translate_lengths, ref_tokens, reference_lengths
+
+
+def _bleu_chunks(
+        translate_corpus: Sequence[Sequence[str]],
+        reference_corpus: Sequence[Sequence[Sequence[str]]],
+        max_numel: int = _BLEU_CHUNK_NUMEL,
+) -> Iterator[List[int]]:
+    """
+    Splits the corpus into chunks of sentence indices whose padded token tensors hold at most ``max_numel``
+    ids, unless a single sentence is larger. Sentences are sorted by length so they are padded little.
+    """
+    widths = [max([len(translation)] + [len(ref) for ref in refs]) for translation, refs in
+              zip(translate_corpus, reference_corpus)]
+    order = sorted(range(len(widths)), key=widths.__getitem__)
+
+    chunk, max_len, num_refs = [], 0, 1
+    for i in order:
+        new_len = max(max_len, widths[i])
+        new_refs = max(num_refs, len(reference_corpus[i]))
+        if chunk and (len(chunk) + 1) * (new_refs + 1) * new_len > max_numel:
+            yield chunk
+            chunk, new_len, new_refs = [], widths[i], max(1, len(reference_corpus[i]))
+        chunk.append(i)
+        max_len, num_refs = new_len, new_refs
+    if chunk:
+        yield chunk
 
 
 def bleu_score(
@@ -59,45 +232,20 @@ def bleu_score(
     """
 
     assert len(translate_corpus) == len(reference_corpus)
-    numerator = torch.zeros(n_gram)
-    denominator = torch.zeros(n_gram)
-    precision_scores = torch.zeros(n_gram)
-    c = 0.0
-    r = 0.0
-
-    for (translation, references) in zip(translate_corpus, reference_corpus):
-        c += len(translation)
-        ref_len_list = [len(ref) for ref in references]
-        ref_len_diff = [abs(len(translation) - x) for x in ref_len_list]
-        r += ref_len_list[ref_len_diff.index(min(ref_len_diff))]
-        translation_counter = _count_ngram(translation, n_gram)
-        reference_counter = Counter()
-
-        for ref in references:
-            reference_counter |= _count_ngram(ref, n_gram)
-
-        ngram_counter_clip = translation_counter & reference_counter
-
-        for counter_clip in ngram_counter_clip:
-            numerator[len(counter_clip) - 1] += ngram_counter_clip[counter_clip]
-
-        for counter in translation_counter:
-            denominator[len(counter) - 1] += translation_counter[counter]
-
-    trans_len = torch.tensor(c)
-    ref_len = torch.tensor(r)
-
-    if min(numerator) == 0.0:
-        return torch.tensor(0.0)
-
-    if smooth:
-        precision_scores = torch.add(numerator, torch.ones(n_gram)) / torch.add(denominator, torch.ones(n_gram))
-    else:
-        precision_scores = numerator / denominator
-
-    log_precision_scores = torch.tensor([1.0 / n_gram] * n_gram) * torch.log(precision_scores)
-    geometric_mean = torch.exp(torch.sum(log_precision_scores))
-    brevity_penalty = torch.tensor(1.0) if c > r else torch.exp(1 - (ref_len / trans_len))
-    bleu = brevity_penalty * geometric_mean
-
-    return bleu
+    numerator = torch.zeros(n_gram, dtype=torch.long)
+    denominator = torch.zeros(n_gram, dtype=torch.long)
+    trans_len = torch.tensor(0)
+    ref_len = torch.tensor(0)
+
+    # the statistics are additive, long sentences do not pad the tensors of the whole corpus
+    for chunk in _bleu_chunks(translate_corpus, reference_corpus, _BLEU_CHUNK_NUMEL):
+        token_ids = _tokens_to_ids([translate_corpus[i] for i in chunk], [reference_corpus[i] for i in chunk])
+        chunk_numerator, chunk_denominator, chunk_trans_len, chunk_ref_len = _bleu_score_update(
+            *token_ids, n_gram=n_gram
+        )
+        numerator += chunk_numerator
+        denominator += chunk_denominator
+        trans_len += chunk_trans_len
+        ref_len += chunk_ref_len
+
+    return _bleu_score_compute(numerator, denominator, trans_len, ref_len, n_gram=n_gram, smooth=smooth)
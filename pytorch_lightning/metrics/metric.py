@@ -13,7 +13,9 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
 import numbers
 
 import torch
@@ -21,8 +23,8 @@ from torch import nn
 import numpy as np
 
 from pytorch_lightning.metrics.converters import (
-    sync_ddp_if_available, gather_all_tensors_if_available,
-    convert_to_tensor, convert_to_numpy)
+    sync_ddp_if_available, gather_all_tensors_if_available, sync_collection_if_available,
+    convert_to_tensor, convert_to_numpy, sync_ddp_states_if_available)
 from pytorch_lightning.utilities.apply_func import apply_to_collection
 from pytorch_lightning.utilities.device_dtype_mixin import DeviceDtypeModuleMixin
 
@@ -189,8 +191,7 @@ class TensorMetric(Metric):
 
     @staticmethod
     def ddp_sync(self, data: Any, output: Any):
-        return apply_to_collection(output, torch.Tensor, sync_ddp_if_available,
-                                   self.reduce_group, self.reduce_op)
+        return sync_collection_if_available(output, self.reduce_group, self.reduce_op)
 
 
 class TensorCollectionMetric(Metric):
@@ -242,8 +243,7 @@ class TensorCollectionMetric(Metric):
 
     @staticmethod
     def ddp_sync(self, data: Any, output: Any):
-        return apply_to_collection(output, torch.Tensor, sync_ddp_if_available,
-                                   self.reduce_group, self.reduce_op)
+        return sync_collection_if_available(output, self.reduce_group, self.reduce_op)
 
 
 class NumpyMetric(Metric):
@@ -285,5 +285,222 @@ class NumpyMetric(Metric):
 
     @staticmethod
     def ddp_sync(self, data: Any, output: Any):
-        return apply_to_collection(output, torch.Tensor, sync_ddp_if_available,
-                                   self.reduce_group, self.reduce_op)
+        return sync_collection_if_available(output, self.reduce_group, self.reduce_op)
+
+
+class StatefulMetric(DeviceDtypeModuleMixin, nn.Module, ABC):
+    """
+    Base class for metrics accumulating sufficient statistics across batches.
+
+    Instead of returning a (synced) value per batch, which has to be stored and
+    reduced at the end of the epoch, a stateful metric keeps a fixed set of
+    accumulator buffers (registered with :meth:`add_state`) whose size does not
+    depend on the number of seen batches.
+
+    Methods to implement
+
+        * update: accumulates the statistics of a batch into the states
+        * compute: calculates the final metric value from the states
+
+    Call order
+
+        (forward | update) -> ... -> sync -> compute -> reset
+
+    Example:
+
+        >>> class SumOfSquares(StatefulMetric):
+        ...     def __init__(self):
+        ...         super().__init__(name='sum_of_squares')
+        ...         self.add_state('total', torch.tensor(0.))
+        ...
+        ...     def update(self, x):
+        ...         self.total += (x ** 2).sum()
+        ...
+        ...     def compute(self):
+        ...         return self.total
+        >>> metric = SumOfSquares()
+        >>> metric(torch.tensor([1., 2.]))
+        tensor(5.)
+        >>> metric(torch.tensor([3.]))
+        tensor(9.)
+        >>> metric.compute()
+        tensor(14.)
+
+    """
+
+    _MERGE_FNS = {
+        'sum': torch.add,
+        'max': torch.max,
+        'min': torch.min,
+    }
+
+    def __init__(self, name: str,
+                 reduce_group: Optional[Any] = None,
+                 compute_on_step: bool = True):
+        """
+        Args:
+            name: the metric's name
+            reduce_group: the process group for DDP reduces (only needed for DDP training).
+                Defaults to all processes (world)
+            compute_on_step: whether ``forward`` should also return the metric value of the current batch.
+                If ``False``, ``forward`` only updates the states and returns ``None``.
+        """
+        super().__init__()
+        self.name = name
+        self.reduce_group = reduce_group
+        self.compute_on_step = compute_on_step
+        self._dtype = torch.get_default_dtype()
+        self._device = torch.device('cpu')
+
+        self._defaults = OrderedDict()
+        self._reductions = OrderedDict()
+        # the states reduced by the last ``sync``, the registered states always stay local to this process
+        self._synced_states = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # wrapped on the class, so every way of calling them keeps the local and the synced states apart
+        if 'update' in cls.__dict__:
+            cls.update = _wrap_update(cls.__dict__['update'])
+        if 'compute' in cls.__dict__:
+            cls.compute = _wrap_compute(cls.__dict__['compute'])
+
+    def add_state(self, name: str, default: torch.Tensor, reduce_op: str = 'sum'):
+        """
+        Registers an accumulator buffer, which will be moved together with the metric,
+        reset by :meth:`reset` and reduced across processes by :meth:`sync`.
+
+        Args:
+            name: the name of the state, accessible as attribute of the metric
+            default: the initial value of the state
+            reduce_op: how the state is reduced across batches and processes.
+                One of ``'sum'``, ``'max'`` or ``'min'``.
+        """
+        if reduce_op not in self._MERGE_FNS:
+            raise ValueError(f'reduce_op {reduce_op} not supported, use one of {list(self._MERGE_FNS)}')
+
+        default = convert_to_tensor(default).detach()
+        self._defaults[name] = default.clone()
+        self._reductions[name] = reduce_op
+        self.register_buffer(name, default.clone())
+
+    @abstractmethod
+    def update(self, *args, **kwargs) -> None:
+        """
+        Accumulates the statistics of a batch into the registered states.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def compute(self) -> Any:
+        """
+        Calculates the metric value from the registered states.
+
+        Returns:
+            metric value
+
+        """
+        raise NotImplementedError
+
+    def reset(self):
+        """
+        Resets all states to their default values.
+        """
+        for name, default in self._defaults.items():
+            current = getattr(self, name)
+            setattr(self, name, default.to(device=current.device, dtype=current.dtype).clone())
+        self._synced_states = None
+
+    def sync(self):
+        """
+        Reduces the states across all processes. :meth:`compute` uses the reduced states until the
+        next update, while the registered states keep only the batches of this process, so later
+        batches are never counted more than once.
+        All states sharing dtype and reduction are flattened into a single buffer,
+        so this issues one collective per bucket instead of one per state.
+        Calling it again before the next update is a no-op.
+        """
+        if self._synced_states is not None:
+            return
+
+        self._synced_states = sync_ddp_states_if_available(
+            self._state_tensors(), self._reductions, group=self.reduce_group
+        )
+
+    def forward(self, *args, **kwargs) -> Any:
+        """
+        Updates the states with the given batch.
+
+        Returns:
+            the metric value computed on this batch only (not synced across processes)
+            or ``None`` if ``compute_on_step`` is disabled
+
+        """
+        args = apply_to_collection(args, (torch.Tensor, np.ndarray, numbers.Number),
+                                   convert_to_tensor, None, self.device)
+        kwargs = apply_to_collection(kwargs, (torch.Tensor, np.ndarray, numbers.Number),
+                                     convert_to_tensor, None, self.device)
+
+        with torch.no_grad():
+            if not self.compute_on_step:
+                self.update(*args, **kwargs)
+                return None
+
+            # compute the batch value on fresh states and merge them into the accumulated ones
+            accumulated = self._state_tensors()
+            merged, synced_states = accumulated, self._synced_states
+            self.reset()
+            try:
+                self.update(*args, **kwargs)
+                batch_value = self.compute()
+                merged = OrderedDict(
+                    (name, self._MERGE_FNS[self._reductions[name]](accumulated[name], value))
+                    for name, value in self._state_tensors().items()
+                )
+                synced_states = None
+            finally:
+                # a failing batch is dropped, the accumulated states are always put back
+                for name, value in merged.items():
+                    setattr(self, name, value)
+                self._synced_states = synced_states
+
+        return batch_value
+
+    def _state_tensors(self) -> Dict[str, torch.Tensor]:
+        return OrderedDict((name, getattr(self, name)) for name in self._defaults)
+
+    def _apply(self, fn):
+        this = super()._apply(fn)
+        # the synced states are no buffers, they have to follow the moves and casts by hand
+        if self._synced_states is not None:
+            self._synced_states = OrderedDict((name, fn(value)) for name, value in self._synced_states.items())
+        return this
+
+
+def _wrap_update(update: Callable) -> Callable:
+    @wraps(update)
+    def wrapped_update(self, *args, **kwargs):
+        # the local states change, so the states reduced by the last sync are outdated
+        self._synced_states = None
+        return update(self, *args, **kwargs)
+
+    return wrapped_update
+
+
+def _wrap_compute(compute: Callable) -> Callable:
+    @wraps(compute)
+    def wrapped_compute(self, *args, **kwargs):
+        if self._synced_states is None:
+            return compute(self, *args, **kwargs)
+
+        # compute on the synced states and put the local ones back afterwards
+        local_states = self._state_tensors()
+        for name, value in self._synced_states.items():
+            setattr(self, name, value)
+        try:
+            return compute(self, *args, **kwargs)
+        finally:
+            for name, value in local_states.items():
+                setattr(self, name, value)
+
+    return wrapped_compute
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any, Optional
+
 import torch
 
-from pytorch_lightning.metrics.functional.nlp import bleu_score
-from pytorch_lightning.metrics.metric import Metric
+from pytorch_lightning.metrics.functional.nlp import _bleu_score_compute, _bleu_score_update, bleu_score
+from pytorch_lightning.metrics.metric import Metric, StatefulMetric
 
 
 class BLEUScore(Metric):
@@ -58,3 +60,95 @@ class BLEUScore(Metric):
             n_gram=self.n_gram,
             smooth=self.smooth,
         ).to(self.device, self.dtype)
+
+
+class StatefulBLEUScore(StatefulMetric):
+    """
+    Computes the corpus BLEU score of token id tensors over all batches seen since the last reset.
+
+    Only the clipped n-gram matches, the n-gram counts and the translation and reference lengths are
+    accumulated, so the score of the whole corpus is exact across batches and processes.
+
+    Example:
+
+        >>> translate = torch.tensor([[0, 1, 2, 3, 0, 4]])
+        >>> references = torch.tensor([[[5, 2, 6, 1, 3, 0, 4], [6, 1, 2, 3, 0, 4, -1]]])
+        >>> metric = StatefulBLEUScore(pad_index=-1)
+        >>> metric(translate, references)
+        tensor(0.7598)
+
+    """
+
+    def __init__(
+            self,
+            n_gram: int = 4,
+            smooth: bool = False,
+            pad_index: Optional[int] = None,
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            n_gram: Gram value ranged from 1 to 4 (Default 4)
+            smooth: Whether or not to apply smoothing – Lin et al. 2004
+            pad_index: token id right padding the sentences, used to infer their lengths
+                when none are passed to ``update``
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` also returns the score of the current batch
+        """
+        super().__init__(name="bleu", reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.n_gram = n_gram
+        self.smooth = smooth
+        self.pad_index = pad_index
+
+        self.add_state('numerator', torch.zeros(n_gram, dtype=torch.long))
+        self.add_state('denominator', torch.zeros(n_gram, dtype=torch.long))
+        self.add_state('trans_len', torch.tensor(0, dtype=torch.long))
+        self.add_state('ref_len', torch.tensor(0, dtype=torch.long))
+
+    def _lengths(self, tokens: torch.Tensor) -> torch.Tensor:
+        if self.pad_index is None:
+            return torch.full(tokens.shape[:-1], tokens.size(-1), dtype=torch.long, device=tokens.device)
+        return (tokens != self.pad_index).sum(-1)
+
+    def update(
+            self,
+            translate: torch.Tensor,
+            references: torch.Tensor,
+            translate_lengths: Optional[torch.Tensor] = None,
+            reference_lengths: Optional[torch.Tensor] = None,
+    ) -> None:
+        """
+        Accumulates the n-gram statistics of a batch
+
+        Args:
+            translate: token ids of the translations, of shape ``[B, T]``
+            references: token ids of the references, of shape ``[B, R, L]``, or ``[B, L]`` for a single reference
+            translate_lengths: number of tokens of each translation, of shape ``[B]``
+            reference_lengths: number of tokens of each reference, of shape ``[B, R]``.
+                Sentences with fewer references are padded with references of length 0.
+        """
+        if references.dim() == 2:
+            references = references.unsqueeze(1)
+            if reference_lengths is not None:
+                reference_lengths = reference_lengths.unsqueeze(1)
+        if translate_lengths is None:
+            translate_lengths = self._lengths(translate)
+        if reference_lengths is None:
+            reference_lengths = self._lengths(references)
+
+        numerator, denominator, trans_len, ref_len = _bleu_score_update(
+            translate.long(), translate_lengths.long(), references.long(), reference_lengths.long(), self.n_gram
+        )
+        self.numerator += numerator
+        self.denominator += denominator
+        self.trans_len += trans_len
+        self.ref_len += ref_len
+
+    def compute(self) -> torch.Tensor:
+        """
+        Computes the BLEU score from the accumulated statistics
+        """
+        return _bleu_score_compute(
+            self.numerator, self.denominator, self.trans_len, self.ref_len, self.n_gram, self.smooth
+        )
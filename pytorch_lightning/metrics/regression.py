@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Sequence
+import math
+from typing import Any, Sequence
 
 import torch
 
@@ -24,7 +25,7 @@ from pytorch_lightning.metrics.functional.regression import (
     rmsle,
     ssim
 )
-from pytorch_lightning.metrics.metric import Metric
+from pytorch_lightning.metrics.metric import Metric, StatefulMetric
 
 
 class MSE(Metric):
@@ -305,3 +306,617 @@ class SSIM(Metric):
             A Tensor with SSIM score.
         """
         return ssim(pred, target, self.kernel_size, self.sigma, self.reduction, self.data_range, self.k1, self.k2)
+
+
+class _MeanErrorMetric(StatefulMetric):
+    """
+    Base class for stateful metrics reducing an elementwise error over all seen elements.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        if reduction not in ('elementwise_mean', 'sum'):
+            raise ValueError(f'reduction {reduction} is not supported by stateful metrics,'
+                             ' use one of elementwise_mean or sum')
+        super().__init__(name=name, reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.reduction = reduction
+
+        self.add_state('sum_error', torch.tensor(0.))
+        self.add_state('total', torch.tensor(0, dtype=torch.long))
+
+    def _error(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        raise NotImplementedError
+
+    def update(self, pred: torch.Tensor, target: torch.Tensor) -> None:
+        """
+        Accumulates the errors of a batch
+
+        Args:
+            pred: predicted labels
+            target: ground truth labels
+        """
+        self.sum_error += self._error(pred, target).sum()
+        self.total += target.numel()
+
+    def _reduced_error(self) -> torch.Tensor:
+        if self.reduction == 'sum':
+            return self.sum_error
+        return self.sum_error / self.total
+
+
+class StatefulMSE(_MeanErrorMetric):
+    """
+    Computes the mean squared loss over all batches seen since the last reset.
+
+    Example:
+
+        >>> metric = StatefulMSE()
+        >>> metric(torch.tensor([0., 1, 2, 3]), torch.tensor([0., 1, 2, 2]))
+        tensor(0.2500)
+        >>> metric(torch.tensor([2., 2]), torch.tensor([0., 2]))
+        tensor(2.)
+        >>> metric.compute()
+        tensor(0.8333)
+
+    """
+
+    def __init__(
+            self,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='mse', reduction=reduction,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def _error(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        return (pred - target) ** 2
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the mse loss.
+        """
+        return self._reduced_error()
+
+
+class StatefulRMSE(StatefulMSE):
+    """
+    Computes the root mean squared loss over all batches seen since the last reset.
+
+    Example:
+
+        >>> metric = StatefulRMSE()
+        >>> metric(torch.tensor([0., 1, 2, 3]), torch.tensor([0., 1, 2, 2]))
+        tensor(0.5000)
+
+    """
+
+    def __init__(
+            self,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(reduction=reduction, reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.name = 'rmse'
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the rmse loss.
+        """
+        return torch.sqrt(self._reduced_error())
+
+
+class StatefulMAE(_MeanErrorMetric):
+    """
+    Computes the mean absolute loss or L1-loss over all batches seen since the last reset.
+
+    Example:
+
+        >>> metric = StatefulMAE()
+        >>> metric(torch.tensor([0., 1, 2, 3]), torch.tensor([0., 1, 2, 2]))
+        tensor(0.2500)
+
+    """
+
+    def __init__(
+            self,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='mae', reduction=reduction,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def _error(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        return torch.abs(pred - target)
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the mae loss.
+        """
+        return self._reduced_error()
+
+
+class StatefulRMSLE(_MeanErrorMetric):
+    """
+    Computes the root mean squared log loss over all batches seen since the last reset.
+
+    Example:
+
+        >>> metric = StatefulRMSLE()
+        >>> metric(torch.tensor([0., 1, 2, 3]), torch.tensor([0., 1, 2, 2]))
+        tensor(0.1438)
+
+    """
+
+    def __init__(
+            self,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='rmsle', reduction=reduction,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def _error(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        return (torch.log(pred + 1) - torch.log(target + 1)) ** 2
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the rmsle loss.
+        """
+        return torch.sqrt(self._reduced_error())
+
+
+class StatefulPSNR(_MeanErrorMetric):
+    """
+    Computes the peak signal-to-noise ratio over all batches seen since the last reset.
+
+    Example:
+
+        >>> metric = StatefulPSNR()
+        >>> metric(torch.tensor([[0.0, 1.0], [2.0, 3.0]]), torch.tensor([[3.0, 2.0], [1.0, 0.0]]))
+        tensor(2.5527)
+
+    """
+
+    def __init__(
+            self,
+            data_range: float = None,
+            base: int = 10,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            data_range: the range of the data. If None, it is determined from the data (max - min)
+            base: a base of a logarithm to use (default: 10)
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='psnr', reduction=reduction,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.data_range = data_range
+        self.base = float(base)
+
+        if data_range is None:
+            for name in ('pred', 'target'):
+                self.add_state(f'{name}_min', torch.tensor(float('inf')), reduce_op='min')
+                self.add_state(f'{name}_max', torch.tensor(float('-inf')), reduce_op='max')
+
+    def _error(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        return (pred - target) ** 2
+
+    def update(self, pred: torch.Tensor, target: torch.Tensor) -> None:
+        """
+        Accumulates the squared errors and value ranges of a batch
+
+        Args:
+            pred: predicted labels
+            target: ground truth labels
+        """
+        super().update(pred, target)
+
+        if self.data_range is None:
+            self.pred_min = torch.min(self.pred_min, pred.min())
+            self.pred_max = torch.max(self.pred_max, pred.max())
+            self.target_min = torch.min(self.target_min, target.min())
+            self.target_max = torch.max(self.target_max, target.max())
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with psnr score.
+        """
+        if self.data_range is None:
+            data_range = torch.max(self.target_max - self.target_min, self.pred_max - self.pred_min)
+        else:
+            data_range = torch.tensor(float(self.data_range))
+
+        psnr_base_e = 2 * torch.log(data_range) - torch.log(self._reduced_error())
+        return psnr_base_e * (10 / torch.log(torch.tensor(self.base)))
+
+
+class StatefulMeanSquaredLogError(_MeanErrorMetric):
+    """
+    Computes the mean squared logarithmic error over all batches seen since the last reset.
+
+    Example:
+
+        >>> metric = StatefulMeanSquaredLogError()
+        >>> metric(torch.tensor([2.5, 5, 4, 8]), torch.tensor([3., 5, 2.5, 7]))
+        tensor(0.0397)
+
+    """
+
+    def __init__(
+            self,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='mean_squared_log_error', reduction=reduction,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def _error(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        return (torch.log1p(pred) - torch.log1p(target)) ** 2
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the mean squared log error.
+        """
+        return self._reduced_error()
+
+
+class StatefulMeanPoissonDeviance(_MeanErrorMetric):
+    """
+    Computes the mean Poisson deviance over all batches seen since the last reset.
+    Predictions have to be positive and targets non-negative.
+
+    Example:
+
+        >>> metric = StatefulMeanPoissonDeviance()
+        >>> metric(torch.tensor([0.5, 0.5, 2., 2.]), torch.tensor([2., 0., 1., 4.]))
+        tensor(1.4260)
+
+    """
+
+    def __init__(
+            self,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='mean_poisson_deviance', reduction=reduction,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def _error(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        # target * log(target / pred) tends to 0 for a target of 0
+        log_ratio = torch.where(target > 0, target * torch.log(target / pred), torch.zeros_like(target))
+        return 2 * (log_ratio - target + pred)
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the mean Poisson deviance.
+        """
+        return self._reduced_error()
+
+
+class StatefulMeanGammaDeviance(_MeanErrorMetric):
+    """
+    Computes the mean Gamma deviance over all batches seen since the last reset.
+    Predictions and targets have to be positive.
+
+    Example:
+
+        >>> metric = StatefulMeanGammaDeviance()
+        >>> metric(torch.tensor([0.5, 0.5, 2., 2.]), torch.tensor([2., 0.5, 1., 4.]))
+        tensor(1.0569)
+
+    """
+
+    def __init__(
+            self,
+            reduction: str = 'elementwise_mean',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            reduction: a method to reduce metric score over labels (default: takes the mean)
+                Available reduction methods:
+                - elementwise_mean: takes the mean
+                - sum: add elements
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='mean_gamma_deviance', reduction=reduction,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def _error(self, pred: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+        return 2 * (torch.log(pred / target) + target / pred - 1)
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the mean Gamma deviance.
+        """
+        return self._reduced_error()
+
+
+class _VarianceScoreMetric(StatefulMetric):
+    """
+    Base class for stateful metrics comparing the residual variance with the variance of the targets.
+    Keeps the count and the sums and sums of squares of targets and residuals for each output, in
+    double precision to avoid cancellation when the variances are computed from them.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            num_outputs: int = 1,
+            multioutput: str = 'uniform_average',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        if multioutput not in ('raw_values', 'uniform_average', 'variance_weighted'):
+            raise ValueError(f'multioutput {multioutput} is not supported, use one of'
+                             ' raw_values, uniform_average or variance_weighted')
+        super().__init__(name=name, reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.num_outputs = num_outputs
+        self.multioutput = multioutput
+
+        self.add_state('total', torch.tensor(0, dtype=torch.long))
+        for state in ('sum_target', 'sum_squared_target', 'sum_residual', 'sum_squared_residual'):
+            self.add_state(state, torch.zeros(num_outputs, dtype=torch.double))
+
+    def update(self, pred: torch.Tensor, target: torch.Tensor) -> None:
+        """
+        Accumulates the sums of a batch
+
+        Args:
+            pred: predicted values of shape ``[N]`` or ``[N, num_outputs]``
+            target: ground truth values of the same shape
+        """
+        target = target.double().view(-1, self.num_outputs)
+        residual = target - pred.double().view(-1, self.num_outputs)
+
+        self.total += target.size(0)
+        self.sum_target += target.sum(0)
+        self.sum_squared_target += (target ** 2).sum(0)
+        self.sum_residual += residual.sum(0)
+        self.sum_squared_residual += (residual ** 2).sum(0)
+
+    def _target_variance(self) -> torch.Tensor:
+        return self.sum_squared_target - self.sum_target ** 2 / self.total
+
+    def _score(self, numerator: torch.Tensor, denominator: torch.Tensor) -> torch.Tensor:
+        # constant targets score 1 when predicted perfectly and 0 otherwise
+        scores = torch.where(denominator != 0, 1 - numerator / denominator, (numerator == 0).double())
+        if self.multioutput == 'raw_values':
+            return scores.float()
+        if self.multioutput == 'variance_weighted' and bool((denominator != 0).any()):
+            return (torch.sum(scores * denominator) / torch.sum(denominator)).float()
+        return scores.mean().float()
+
+
+class StatefulExplainedVariance(_VarianceScoreMetric):
+    """
+    Computes the explained variance regression score over all batches seen since the last reset.
+
+    Example:
+
+        >>> metric = StatefulExplainedVariance()
+        >>> metric(torch.tensor([2.5, 0.0, 2, 8]), torch.tensor([3, -0.5, 2, 7]))
+        tensor(0.9572)
+
+    """
+
+    def __init__(
+            self,
+            num_outputs: int = 1,
+            multioutput: str = 'uniform_average',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            num_outputs: number of outputs, the size of the last dimension of multioutput data
+            multioutput: how to combine the scores of multiple outputs, one of
+                ``'raw_values'``, ``'uniform_average'`` or ``'variance_weighted'``
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='explained_variance', num_outputs=num_outputs, multioutput=multioutput,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the explained variance.
+        """
+        residual_variance = self.sum_squared_residual - self.sum_residual ** 2 / self.total
+        return self._score(residual_variance, self._target_variance())
+
+
+class StatefulR2Score(_VarianceScoreMetric):
+    """
+    Computes the R^2 (coefficient of determination) regression score over all batches seen since the last reset.
+
+    Example:
+
+        >>> metric = StatefulR2Score()
+        >>> metric(torch.tensor([2.5, 0.0, 2, 8]), torch.tensor([3, -0.5, 2, 7]))
+        tensor(0.9486)
+
+    """
+
+    def __init__(
+            self,
+            num_outputs: int = 1,
+            multioutput: str = 'uniform_average',
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            num_outputs: number of outputs, the size of the last dimension of multioutput data
+            multioutput: how to combine the scores of multiple outputs, one of
+                ``'raw_values'``, ``'uniform_average'`` or ``'variance_weighted'``
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        super().__init__(name='r2_score', num_outputs=num_outputs, multioutput=multioutput,
+                         reduce_group=reduce_group, compute_on_step=compute_on_step)
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the R^2 score.
+        """
+        return self._score(self.sum_squared_residual, self._target_variance())
+
+
+class StatefulMedianAbsoluteError(StatefulMetric):
+    """
+    Approximates the median absolute error over all batches seen since the last reset.
+
+    The median cannot be merged from per batch statistics, so the absolute errors are counted into
+    a histogram with logarithmically spaced bins between ``min_error`` and ``max_error``. The returned
+    median is the geometric center of the bin holding it, which is within a relative error of
+    ``(max_error / min_error) ** (1 / (2 * num_bins))`` of the exact median. Errors below ``min_error``
+    count as 0 and errors above ``max_error`` are counted in the last bin.
+
+    Example:
+
+        >>> metric = StatefulMedianAbsoluteError()
+        >>> metric(torch.tensor([2.5, 0.0, 2, 8]), torch.tensor([3, -0.5, 2, 7]))
+        tensor(0.5008)
+
+    """
+
+    def __init__(
+            self,
+            num_bins: int = 4096,
+            min_error: float = 1e-6,
+            max_error: float = 1e6,
+            reduce_group: Any = None,
+            compute_on_step: bool = True,
+    ):
+        """
+        Args:
+            num_bins: number of logarithmically spaced histogram bins
+            min_error: smallest error distinguished from 0
+            max_error: largest error resolved by the histogram
+            reduce_group: the process group to reduce metric results from DDP
+            compute_on_step: whether ``forward`` should also return the score of the current batch
+        """
+        if not 0 < min_error < max_error:
+            raise ValueError(f'expected 0 < min_error < max_error, got {min_error} and {max_error}')
+        super().__init__(name='median_absolute_error', reduce_group=reduce_group, compute_on_step=compute_on_step)
+        self.num_bins = num_bins
+        self.min_error = min_error
+        self.max_error = max_error
+        self._log_bin_width = math.log(max_error / min_error) / num_bins
+
+        # bin 0 holds the errors below ``min_error``
+        self.add_state('counts', torch.zeros(num_bins + 1, dtype=torch.long))
+
+    def update(self, pred: torch.Tensor, target: torch.Tensor) -> None:
+        """
+        Counts the absolute errors of a batch into the histogram
+
+        Args:
+            pred: predicted values
+            target: ground truth values
+        """
+        error = torch.abs(pred - target).double().flatten()
+        bins = torch.floor(torch.log(error / self.min_error) / self._log_bin_width) + 1
+        bins = torch.where(error < self.min_error, torch.zeros_like(bins), bins.clamp(1, self.num_bins))
+        self.counts += torch.bincount(bins.long(), minlength=self.num_bins + 1)
+
+    def compute(self) -> torch.Tensor:
+        """
+        Return:
+            A Tensor with the median absolute error.
+        """
+        cumulative = torch.cumsum(self.counts, 0)
+        # for an even count, the median is the mean of the two middle errors
+        lower = torch.sum(cumulative < (cumulative[-1] - 1) // 2 + 1)
+        upper = torch.sum(cumulative < cumulative[-1] // 2 + 1)
+        return (self._bin_center(lower) + self._bin_center(upper)) / 2
+
+    def _bin_center(self, index: torch.Tensor) -> torch.Tensor:
+        center = self.min_error * torch.exp((index.float() - 0.5) * self._log_bin_width)
+        return torch.where(index > 0, center, torch.zeros_like(center))
@@ -185,7 +185,8 @@ class LightningDistributedDataParallel(DistributedDataParallel):
             else:
                 output = self.module.validation_step(*inputs, **kwargs)
 
-        if torch.is_grad_enabled():
+        # inside of `no_sync()` the gradients are only accumulated locally
+        if torch.is_grad_enabled() and self.require_backward_grad_sync:
             # We'll return the output object verbatim since it is a freeform
             # object. We need to find any tensors in this object, though,
             # because we need to figure out which parameters were used during
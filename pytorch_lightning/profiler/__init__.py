@@ -49,6 +49,49 @@ The profiler's results will be printed at the completion of a training `fit()`.
     on_train_end            |  5.449e-06            |  5.449e-06
 
 
+Streaming Profiling
+-------------------
+
+The `SimpleProfiler` keeps every recorded duration in memory. For long runs, the `StreamingProfiler` keeps
+fixed-size statistics per action instead and additionally reports the standard deviation, the maximum and
+approximate p50/p90/p99 durations, which makes occasional stalls (e.g. of the dataloader) visible.
+The summaries can also be sent to the trainer's logger periodically.
+
+.. code-block:: python
+
+    profiler = StreamingProfiler(log_every_n_steps=100)
+    trainer = Trainer(..., profiler=profiler)
+
+
+Step Breakdown
+--------------
+
+To see whether training is input bound or compute bound, add the
+:class:`~pytorch_lightning.callbacks.StepTimeMonitor` callback. It wraps the configured profiler in a
+`StepTimelineProfiler`, which splits every training step into data wait, host to device transfer, forward,
+backward, optimizer, logging and hook overhead, and logs the share of each over the last steps.
+
+.. code-block:: python
+
+    trainer = Trainer(..., profiler=profiler, callbacks=[StepTimeMonitor()])
+
+
+Trace Profiling
+---------------
+
+The `TraceProfiler` records every action with its start time, thread and nesting and writes a Chrome trace,
+which shows how data loading, forward, backward and checkpointing overlap on a timeline. Each process writes
+its own file (``trace_rank0.json``, ``trace_rank1.json``, ...) and the files of all ranks can be merged to
+compare them side by side. Open the traces in ``chrome://tracing`` or https://ui.perfetto.dev.
+
+.. code-block:: python
+
+    profiler = TraceProfiler(output_filename='trace.json')
+    trainer = Trainer(..., profiler=profiler)
+
+    TraceProfiler.merge(['trace_rank0.json', 'trace_rank1.json'], 'trace.json')
+
+
 Advanced Profiling
 --------------------
 
@@ -112,11 +155,22 @@ to track and the profiler will record performance for code executed within this
 
 """
 
-from pytorch_lightning.profiler.profilers import SimpleProfiler, AdvancedProfiler, PassThroughProfiler, BaseProfiler
+from pytorch_lightning.profiler.profilers import (
+    SimpleProfiler,
+    AdvancedProfiler,
+    PassThroughProfiler,
+    BaseProfiler,
+    StreamingProfiler,
+    StepTimelineProfiler,
+    TraceProfiler,
+)
 
 __all__ = [
     'BaseProfiler',
     'SimpleProfiler',
     'AdvancedProfiler',
+    'StreamingProfiler',
+    'StepTimelineProfiler',
+    'TraceProfiler',
     'PassThroughProfiler',
 ]
@@ -14,16 +14,22 @@
 
 import cProfile
 import io
+import json
+import math
 import os
 import pstats
+import threading
 import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from contextlib import contextmanager
+from typing import Dict, List, Optional
 
 import numpy as np
+import torch
 
 from pytorch_lightning import _logger as log
+from pytorch_lightning.utilities.distributed import rank_zero_only
 
 
 class BaseProfiler(ABC):
@@ -31,6 +37,12 @@ class BaseProfiler(ABC):
     If you wish to write a custom profiler, you should inhereit from this class.
     """
 
+    #: log the profiler :meth:`metrics` to the trainer's logger every n training steps, ``None`` disables it
+    log_every_n_steps: Optional[int] = None
+
+    #: call :meth:`describe` in every process instead of only in the process with global rank zero
+    describe_all_ranks: bool = False
+
     def __init__(self, output_streams: list = None):
         """
         Params:
@@ -91,6 +103,10 @@ class BaseProfiler(ABC):
     def summary(self) -> str:
         """Create profiler summary in text format."""
 
+    def metrics(self) -> Dict[str, float]:
+        """Summarizes the recorded actions as scalars which can be sent to a logger."""
+        return {}
+
 
 class PassThroughProfiler(BaseProfiler):
     """
@@ -176,6 +192,405 @@ class SimpleProfiler(BaseProfiler):
             self.output_file.close()
 
 
+# time.perf_counter_ns is only available from Python 3.7
+_perf_counter_ns = getattr(time, 'perf_counter_ns', lambda: int(time.perf_counter() * 1e9))
+
+
+class DurationStats(object):
+    """
+    Streaming aggregate of the durations of one action, its memory does not grow with the number of records.
+
+    Keeps count, sum, min, max, the Welford running variance and a histogram with ``buckets_per_octave``
+    logarithmic buckets per power of two, which bounds the relative error of the percentiles to
+    about ``2 ** (1 / buckets_per_octave) - 1``.
+    """
+
+    def __init__(self, buckets_per_octave: int = 16):
+        self.buckets_per_octave = buckets_per_octave
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.histogram = defaultdict(int)
+
+    def add(self, duration: float) -> None:
+        """Records a duration in seconds."""
+        self.count += 1
+        self.total += duration
+        self.min = min(self.min, duration)
+        self.max = max(self.max, duration)
+
+        delta = duration - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (duration - self.mean)
+
+        bucket = math.floor(math.log2(duration) * self.buckets_per_octave) if duration > 0 else -math.inf
+        self.histogram[bucket] += 1
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def percentile(self, q: float) -> float:
+        """Approximates the ``q``-th percentile (``0 <= q <= 100``) of the recorded durations."""
+        if self.count == 0:
+            return math.nan
+        rank = q / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.histogram):
+            seen += self.histogram[bucket]
+            if seen >= rank:
+                break
+        if bucket == -math.inf:
+            return 0.0
+        # geometric center of the bucket, kept within the observed range
+        value = 2 ** ((bucket + 0.5) / self.buckets_per_octave)
+        return min(max(value, self.min), self.max)
+
+
+class StreamingProfiler(BaseProfiler):
+    """
+    This profiler records the duration of actions like the :class:`SimpleProfiler`, but keeps
+    fixed-size streaming statistics per action instead of every duration. Besides the mean and
+    total duration it reports the standard deviation, the maximum and approximate p50/p90/p99
+    tail latencies, so it can stay enabled for long training runs.
+    """
+
+    def __init__(
+            self,
+            output_filename: str = None,
+            log_every_n_steps: Optional[int] = None,
+            buckets_per_octave: int = 16,
+    ):
+        """
+        Args:
+            output_filename: optionally save profile results to file instead of printing
+                to std out when training is finished.
+            log_every_n_steps: if set, the :meth:`metrics` are logged to the trainer's logger
+                every ``log_every_n_steps`` training steps.
+            buckets_per_octave: resolution of the duration histograms used for the percentiles.
+        """
+        self.current_actions = {}
+        self.recorded_stats = defaultdict(lambda: DurationStats(buckets_per_octave))
+        self.log_every_n_steps = log_every_n_steps
+
+        self.output_fname = output_filename
+        self.output_file = open(self.output_fname, 'w') if self.output_fname else None
+
+        streaming_out = [self.output_file.write] if self.output_file else [log.info]
+        super().__init__(output_streams=streaming_out)
+
+    def start(self, action_name: str) -> None:
+        if action_name in self.current_actions:
+            raise ValueError(
+                f"Attempted to start {action_name} which has already started."
+            )
+        self.current_actions[action_name] = _perf_counter_ns()
+
+    def stop(self, action_name: str) -> None:
+        end_time = _perf_counter_ns()
+        if action_name not in self.current_actions:
+            raise ValueError(
+                f"Attempting to stop recording an action ({action_name}) which was never started."
+            )
+        start_time = self.current_actions.pop(action_name)
+        self.recorded_stats[action_name].add((end_time - start_time) / 1e9)
+
+    def summary(self) -> str:
+        output_string = "\n\nProfiler Report\n"
+
+        def log_row(action, *values):
+            return f"{os.linesep}{action:<20s}" + "".join(f"\t|  {v:<12}" for v in values)
+
+        output_string += log_row("Action", "Count", "Mean (s)", "Std (s)", "P50 (s)", "P90 (s)", "P99 (s)",
+                                 "Max (s)", "Total (s)")
+        output_string += f"{os.linesep}{'-' * 150}"
+        for action, stats in self.recorded_stats.items():
+            output_string += log_row(
+                action, stats.count, f"{stats.mean:.5}", f"{stats.std:.5}", f"{stats.percentile(50):.5}",
+                f"{stats.percentile(90):.5}", f"{stats.percentile(99):.5}", f"{stats.max:.5}", f"{stats.total:.5}",
+            )
+        output_string += os.linesep
+        return output_string
+
+    def metrics(self) -> Dict[str, float]:
+        metrics = {}
+        for action, stats in self.recorded_stats.items():
+            metrics[f'profiler/{action}/mean'] = stats.mean
+            metrics[f'profiler/{action}/p50'] = stats.percentile(50)
+            metrics[f'profiler/{action}/p90'] = stats.percentile(90)
+            metrics[f'profiler/{action}/p99'] = stats.percentile(99)
+            metrics[f'profiler/{action}/max'] = stats.max
+        return metrics
+
+    def describe(self):
+        """Logs a profile report after the conclusion of the training run."""
+        super().describe()
+        if self.output_file:
+            self.output_file.flush()
+
+    def __del__(self):
+        """Close profiler's stream."""
+        if self.output_file:
+            self.output_file.close()
+
+
+class StepTimelineProfiler(BaseProfiler):
+    """
+    This profiler splits the wall time of every training step into data wait, host to device
+    transfer, forward, backward, optimizer, logging and hook overhead. Durations are exclusive,
+    time spent in a hook called from the forward only counts as hook overhead. All actions are
+    forwarded to the wrapped ``profiler``, which keeps producing its own report.
+
+    It is installed by the :class:`~pytorch_lightning.callbacks.StepTimeMonitor` callback.
+    """
+
+    #: maps the actions profiled by the trainer to their step category, other actions are hooks
+    ACTION_CATEGORIES = {
+        'get_train_batch': 'data_wait',
+        'transfer_batch_to_device': 'transfer',
+        'model_forward': 'forward',
+        'model_backward': 'backward',
+        'optimizer_step': 'optimizer',
+        'train_step_logging': 'logging',
+        'tbptt_split_batch': 'other',
+    }
+    CATEGORIES = ('data_wait', 'transfer', 'forward', 'backward', 'optimizer', 'logging', 'hooks', 'other')
+
+    def __init__(self, profiler: Optional[BaseProfiler] = None, synchronize: bool = False):
+        """
+        Args:
+            profiler: profiler receiving all actions, e.g. to keep its summary.
+            synchronize: wait for the CUDA device whenever an action starts or stops, so kernels are
+                attributed to the action launching them instead of the next one waiting for them.
+                This slows training down and is meant for investigations only.
+        """
+        self.profiler = profiler or PassThroughProfiler()
+        self.synchronize = synchronize
+        # steps are timed on the training thread, actions of other threads are only forwarded
+        self._thread_id = threading.get_ident()
+        self._stack = []
+        self._durations = dict.fromkeys(self.CATEGORIES, 0.0)
+        self._step_start = time.perf_counter()
+        super().__init__(output_streams=None)
+
+    @property
+    def log_every_n_steps(self) -> Optional[int]:
+        return self.profiler.log_every_n_steps
+
+    @property
+    def describe_all_ranks(self) -> bool:
+        return self.profiler.describe_all_ranks
+
+    def _now(self) -> float:
+        if self.synchronize and torch.cuda.is_available():
+            torch.cuda.synchronize()
+        return time.perf_counter()
+
+    def _category(self, action_name: str) -> str:
+        return self.ACTION_CATEGORIES.get(action_name, 'hooks')
+
+    def start(self, action_name: str) -> None:
+        self.profiler.start(action_name)
+        if threading.get_ident() != self._thread_id:
+            return
+        # frame: action, start time, time spent in nested actions
+        self._stack.append([action_name, self._now(), 0.0])
+
+    def stop(self, action_name: str) -> None:
+        if threading.get_ident() != self._thread_id:
+            self.profiler.stop(action_name)
+            return
+        end_time = self._now()
+        for idx in range(len(self._stack) - 1, -1, -1):
+            if self._stack[idx][0] == action_name:
+                break
+        else:
+            raise ValueError(
+                f"Attempting to stop recording an action ({action_name}) which was never started."
+            )
+        _, start_time, nested_time = self._stack.pop(idx)
+        duration = end_time - start_time
+        self._durations[self._category(action_name)] += max(duration - nested_time, 0.0)
+        if idx > 0:
+            self._stack[idx - 1][2] += duration
+        self.profiler.stop(action_name)
+
+    def end_step(self) -> Dict[str, float]:
+        """
+        Closes the current step and returns the seconds spent per category since the previous step.
+        ``'other'`` includes the time not covered by any action and ``'total'`` is the step wall time.
+        """
+        now = self._now()
+        durations = self._durations
+        # actions still running count to this step up to now
+        for idx in range(len(self._stack) - 1, -1, -1):
+            action_name, start_time, nested_time = self._stack[idx]
+            duration = now - start_time
+            durations[self._category(action_name)] += max(duration - nested_time, 0.0)
+            if idx > 0:
+                self._stack[idx - 1][2] += duration
+        total = now - self._step_start
+        durations['other'] += max(total - sum(durations.values()), 0.0)
+        durations['total'] = total
+        self.reset_step(now)
+        return durations
+
+    def reset_step(self, now: Optional[float] = None) -> None:
+        """Discards the time recorded since the previous step, e.g. the time spent in validation."""
+        now = self._now() if now is None else now
+        self._durations = dict.fromkeys(self.CATEGORIES, 0.0)
+        self._step_start = now
+        for frame in self._stack:
+            frame[1], frame[2] = now, 0.0
+
+    def summary(self) -> str:
+        return self.profiler.summary()
+
+    def metrics(self) -> Dict[str, float]:
+        return self.profiler.metrics()
+
+    def describe(self) -> None:
+        self.profiler.describe()
+
+
+class TraceProfiler(BaseProfiler):
+    """
+    This profiler records every action as an event with its start, duration, thread and nesting
+    depth, and writes them as a `Chrome trace <https://www.chromium.org/developers/how-tos/trace-event-profiling-tool>`_
+    which can be opened in ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`_.
+
+    Events are kept in a ring buffer allocated upfront, once it is full the oldest events are
+    overwritten. Each process writes its own file named after its global rank and uses the rank as
+    process id, timestamps are wall clock based so the files of all ranks can be combined with
+    :meth:`merge`.
+    """
+
+    describe_all_ranks = True
+
+    def __init__(self, output_filename: str = 'trace.json', capacity: int = 1000000):
+        """
+        Args:
+            output_filename: path of the trace, the rank is appended to the file name,
+                e.g. ``trace_rank0.json``.
+            capacity: maximal number of events kept in memory.
+        """
+        if capacity < 1:
+            raise ValueError(f"`capacity` has to be a positive integer, got {capacity}.")
+        self.output_fname = output_filename
+        self.capacity = capacity
+
+        self._names = [None] * capacity
+        self._starts = [0.0] * capacity
+        self._durations = [0.0] * capacity
+        self._thread_ids = [0] * capacity
+        self._depths = [0] * capacity
+        self._num_recorded = 0
+
+        self._lock = threading.Lock()
+        self._thread_names = {}
+        self._current_actions = defaultdict(list)
+        # offset from the monotonic clock to the epoch, aligns the traces of different processes
+        self._clock_offset = time.time() - time.perf_counter()
+
+        super().__init__(output_streams=[log.info])
+
+    @property
+    def num_events(self) -> int:
+        return min(self._num_recorded, self.capacity)
+
+    @property
+    def num_dropped(self) -> int:
+        return max(self._num_recorded - self.capacity, 0)
+
+    @property
+    def trace_filename(self) -> str:
+        root, ext = os.path.splitext(self.output_fname)
+        return f"{root}_rank{rank_zero_only.rank}{ext or '.json'}"
+
+    def start(self, action_name: str) -> None:
+        thread_id = threading.get_ident()
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+        self._current_actions[thread_id].append((action_name, time.perf_counter()))
+
+    def stop(self, action_name: str) -> None:
+        end_time = time.perf_counter()
+        thread_id = threading.get_ident()
+        stack = self._current_actions[thread_id]
+        for depth in range(len(stack) - 1, -1, -1):
+            if stack[depth][0] == action_name:
+                break
+        else:
+            raise ValueError(
+                f"Attempting to stop recording an action ({action_name}) which was never started."
+            )
+        _, start_time = stack.pop(depth)
+
+        with self._lock:
+            idx = self._num_recorded % self.capacity
+            self._num_recorded += 1
+        self._names[idx] = action_name
+        self._starts[idx] = start_time
+        self._durations[idx] = end_time - start_time
+        self._thread_ids[idx] = thread_id
+        self._depths[idx] = depth
+
+    def trace_events(self) -> List[dict]:
+        """Returns the recorded events in the Chrome trace event format, oldest first."""
+        pid = rank_zero_only.rank
+        events = [dict(name='process_name', ph='M', pid=pid, tid=0, args=dict(name=f'rank {pid}'))]
+        events.extend(
+            dict(name='thread_name', ph='M', pid=pid, tid=tid, args=dict(name=name))
+            for tid, name in self._thread_names.items()
+        )
+
+        first = self._num_recorded - self.num_events
+        for i in range(first, self._num_recorded):
+            idx = i % self.capacity
+            events.append(dict(
+                name=self._names[idx],
+                ph='X',
+                ts=(self._starts[idx] + self._clock_offset) * 1e6,
+                dur=self._durations[idx] * 1e6,
+                pid=pid,
+                tid=self._thread_ids[idx],
+                args=dict(depth=self._depths[idx]),
+            ))
+        return events
+
+    def summary(self) -> str:
+        output_string = f"\n\nTrace with {self.num_events} events written to {self.trace_filename}"
+        if self.num_dropped:
+            output_string += f", {self.num_dropped} older events were dropped, consider a larger `capacity`"
+        return output_string + os.linesep
+
+    def describe(self):
+        """Writes the trace of this process and logs where to find it."""
+        dirpath = os.path.dirname(self.trace_filename)
+        if dirpath:
+            os.makedirs(dirpath, exist_ok=True)
+        with open(self.trace_filename, 'w') as fp:
+            json.dump(dict(traceEvents=self.trace_events(), displayTimeUnit='ms'), fp)
+        super().describe()
+
+    @staticmethod
+    def merge(filenames: List[str], output_filename: str) -> None:
+        """Combines the traces of several processes, e.g. all ranks of a DDP run, into one file."""
+        events = []
+        for filename in filenames:
+            with open(filename) as fp:
+                events.extend(json.load(fp)['traceEvents'])
+        with open(output_filename, 'w') as fp:
+            json.dump(dict(traceEvents=events, displayTimeUnit='ms'), fp)
+
+
 class AdvancedProfiler(BaseProfiler):
     """
     This profiler uses Python's cProfiler to record more detailed information about
@@ -208,6 +208,34 @@ Example::
     # default used by the Trainer
     trainer = Trainer(amp_level='O2')
 
+async_checkpoint
+^^^^^^^^^^^^^^^^
+Writes checkpoints on a background thread. The tensors of the checkpoint are copied to CPU memory
+and training continues while the checkpoint is serialized and written to disk. Checkpoints replaced by
+:class:`~pytorch_lightning.callbacks.model_checkpoint.ModelCheckpoint` are only deleted once
+their successor has been written.
+
+.. testcode::
+
+    # default used by the Trainer
+    trainer = Trainer(async_checkpoint=False)
+
+async_logging
+^^^^^^^^^^^^^
+Passes the logged metrics to the loggers on background threads. The metric tensors are stacked and
+copied to the host at once, and each logger gets its own thread so a slow remote logger neither blocks
+training nor the other loggers. When a logger falls behind by too many calls, training waits for it.
+All pending calls are done before training ends.
+
+Note:
+    The loggers are called from a background thread, calls made directly on ``trainer.logger``,
+    e.g. from callbacks, may run at the same time.
+
+.. testcode::
+
+    # default used by the Trainer
+    trainer = Trainer(async_logging=False)
+
 auto_scale_batch_size
 ^^^^^^^^^^^^^^^^^^^^^
 Automatically tries to find the largest batch size that fits into memory,
@@ -224,6 +252,22 @@ before any training.
     # call tune to find the batch size
     trainer.tune(model)
 
+auto_tune_dataloader
+^^^^^^^^^^^^^^^^^^^^
+Benchmarks the train dataloader with different ``num_workers``, ``pin_memory`` and
+``prefetch_batches`` settings before any training, and trains with the fastest one.
+
+.. code-block::
+
+    # default used by the Trainer (no dataloader tuning)
+    trainer = Trainer(auto_tune_dataloader=False)
+
+    # run dataloader tuning, the train dataloader is re-created with the best settings
+    trainer = Trainer(auto_tune_dataloader=True)
+
+    # call tune to find the dataloader settings
+    trainer.tune(model)
+
 auto_select_gpus
 ^^^^^^^^^^^^^^^^
 
@@ -782,6 +826,18 @@ Useful for quickly debugging or trying to overfit on purpose.
     # overfit on 10 of the same batches
     trainer = Trainer(overfit_batches=10)
 
+persistent_workers
+^^^^^^^^^^^^^^^^^^
+Keeps the worker processes of the train, validation and test dataloaders with ``num_workers > 0`` alive
+across epochs and evaluation runs instead of starting them for every pass. The train and the validation
+workers are alive at the same time, so this needs more processes and memory. The workers are shut down
+when ``fit`` or ``test`` ends.
+
+.. testcode::
+
+    # default used by the Trainer
+    trainer = Trainer(persistent_workers=False)
+
 precision
 ^^^^^^^^^
 Full precision (32), half precision (16).
@@ -804,6 +860,20 @@ Example::
     # one day
     trainer = Trainer(precision=8|4|2)
 
+prefetch_batches
+^^^^^^^^^^^^^^^^
+Loads the next batches on a background thread while the current step runs. On GPU the batches are
+moved to the device on a separate CUDA stream, so the host to device copy overlaps with the computation.
+Applies to the training and evaluation loops.
+
+.. testcode::
+
+    # default used by the Trainer (disabled)
+    trainer = Trainer(prefetch_batches=0)
+
+    # keep two batches ready on the device
+    trainer = Trainer(prefetch_batches=2)
+
 process_position
 ^^^^^^^^^^^^^^^^
 Orders the progress bar. Useful when running multiple trainers on the same node.
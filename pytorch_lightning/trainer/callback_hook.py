@@ -26,6 +26,15 @@ class TrainerCallbackHookMixin(ABC):
     callbacks: List[Callback] = []
     get_model: Callable
 
+    def _callback_hooks(self, hook_name: str) -> List[Callable]:
+        """The bound ``hook_name`` methods of the callbacks implementing it, in the order of the callbacks."""
+        base_hook = getattr(Callback, hook_name, None)
+        return [
+            getattr(callback, hook_name)
+            for callback in self.callbacks
+            if hook_name in vars(callback) or getattr(type(callback), hook_name, None) is not base_hook
+        ]
+
     def setup(self, stage: str):
         """Called in the beginning of fit and test"""
         for callback in self.callbacks:
@@ -1,5 +1,6 @@
 import os
 from pytorch_lightning.callbacks import ModelCheckpoint, EarlyStopping, ProgressBarBase, ProgressBar
+from pytorch_lightning.utilities.cloud_io import AsyncCheckpointWriter
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.model_utils import is_overridden
 
@@ -18,10 +19,14 @@ class CallbackConnector:
             process_position,
             default_root_dir,
             weights_save_path,
-            resume_from_checkpoint
+            resume_from_checkpoint,
+            async_checkpoint
     ):
         self.trainer.resume_from_checkpoint = resume_from_checkpoint
 
+        # writes checkpoints in the background when enabled
+        self.trainer.checkpoint_writer = AsyncCheckpointWriter() if async_checkpoint else None
+
         # init folder paths for checkpoint + weights save callbacks
         self.trainer._default_root_dir = default_root_dir or os.getcwd()
         self.trainer._weights_save_path = weights_save_path or self.trainer._default_root_dir
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from pytorch_lightning.core.datamodule import LightningDataModule
+from pytorch_lightning.trainer.supporters import BatchPrefetcher
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from typing import List, Union
 from torch.utils.data import DataLoader
@@ -24,15 +25,37 @@ class DataConnector(object):
     def __init__(self, trainer):
         self.trainer = trainer
 
-    def on_trainer_init(self, check_val_every_n_epoch, reload_dataloaders_every_epoch, prepare_data_per_node):
+    def on_trainer_init(
+            self,
+            check_val_every_n_epoch,
+            reload_dataloaders_every_epoch,
+            prepare_data_per_node,
+            prefetch_batches,
+            persistent_workers
+    ):
         self.trainer.datamodule = None
         self.trainer.prepare_data_per_node = prepare_data_per_node
+        self.trainer.prefetch_batches = prefetch_batches
+        self.trainer.persistent_workers = persistent_workers
 
         self.trainer.check_val_every_n_epoch = check_val_every_n_epoch
         self.trainer.reload_dataloaders_every_epoch = reload_dataloaders_every_epoch
         self.trainer._is_data_prepared = False
 
+    def get_prefetched_dataloader(self, dataloader):
+        """Wraps the dataloader to load and move the next ``trainer.prefetch_batches`` batches in the background."""
+        if self.trainer.prefetch_batches <= 0:
+            return dataloader
+        accelerator = self.trainer.accelerator_backend
+        return BatchPrefetcher(
+            dataloader,
+            depth=self.trainer.prefetch_batches,
+            transfer_fn=accelerator.batch_to_device,
+            device=accelerator.prefetch_device(),
+        )
+
     def get_profiled_train_dataloader(self, train_dataloader):
+        train_dataloader = self.get_prefetched_dataloader(train_dataloader)
         profiled_dl = self.trainer.profiler.profile_iterable(
             enumerate(self._with_is_last(train_dataloader)),
             "get_train_batch"
@@ -14,9 +14,10 @@
 import torch
 from pytorch_lightning.core import memory
 from pytorch_lightning.loggers import TensorBoardLogger, LoggerCollection
-from pytorch_lightning.utilities import flatten_dict
+from pytorch_lightning.loggers.dispatcher import AsyncLoggerDispatcher, PackedMetrics
+from pytorch_lightning.utilities import flatten_dict, rank_zero_warn
 from pytorch_lightning.utilities.model_utils import is_overridden
-from pytorch_lightning.core.step_result import EvalResult, Result
+from pytorch_lightning.core.step_result import EvalResult, Result, EpochResultAccumulator
 from pprint import pprint
 from typing import Iterable
 
@@ -29,12 +30,26 @@ class LoggerConnector:
         self.logged_metrics = {}
         self.progress_bar_metrics = {}
 
-    def on_trainer_init(self, logger, log_save_interval, row_log_interval):
+    @property
+    def logged_metrics(self):
+        # metrics dispatched to the loggers in the background are converted when first read
+        if isinstance(self._logged_metrics, PackedMetrics):
+            return self._logged_metrics.to_scalars()
+        return self._logged_metrics
+
+    @logged_metrics.setter
+    def logged_metrics(self, metrics):
+        self._logged_metrics = metrics
+
+    def on_trainer_init(self, logger, log_save_interval, row_log_interval, async_logging):
         # logging
         self.configure_logger(logger)
         self.trainer.log_save_interval = log_save_interval
         self.trainer.row_log_interval = row_log_interval
 
+        # calls the loggers on background threads when enabled
+        self.trainer.logger_dispatcher = AsyncLoggerDispatcher() if async_logging else None
+
     def configure_logger(self, logger):
         if logger is True:
             # default logger
@@ -69,25 +84,69 @@ class LoggerConnector:
         # add norms
         metrics.update(grad_norm_dic)
 
-        # turn all tensors to scalars
-        scalar_metrics = self.trainer.metrics_to_scalars(metrics)
-
-        if "step" in scalar_metrics and step is None:
-            step = scalar_metrics.pop("step")
+        metrics = dict(metrics)
+        if "step" in metrics and step is None:
+            step = metrics.pop("step")
+            if isinstance(step, torch.Tensor):
+                step = step.item()
 
         elif step is None:
             # added metrics by Lightning for convenience
-            scalar_metrics['epoch'] = self.trainer.current_epoch
+            metrics['epoch'] = self.trainer.current_epoch
             step = step if step is not None else self.trainer.global_step
 
         # log actual metrics
         if self.trainer.is_global_zero and self.trainer.logger is not None:
-            self.trainer.logger.agg_and_log_metrics(scalar_metrics, step=step)
-            self.trainer.logger.save()
+            # stack all tensors, so they are copied to the host at once
+            packed_metrics = PackedMetrics(metrics)
+
+            # the loggers are saved after every call, so metrics logged in separate calls are not aggregated
+            if self.trainer.logger_dispatcher is not None:
+                self.trainer.logger_dispatcher.log_metrics(self.trainer.logger, packed_metrics, step=step)
+                self.logged_metrics = packed_metrics
+            else:
+                self.logged_metrics = packed_metrics.to_scalars()
+                self.trainer.logger.agg_and_log_metrics(self.logged_metrics, step=step)
+                self.trainer.logger.save()
 
             # track the logged metrics
-            self.logged_metrics = scalar_metrics
-            self.trainer.dev_debugger.track_logged_metrics_history(scalar_metrics)
+            if self.trainer.dev_debugger.enabled:
+                self.trainer.dev_debugger.track_logged_metrics_history(packed_metrics.to_scalars())
+
+    def save_loggers(self):
+        """Saves the loggers, in the background when ``Trainer(async_logging=True)``."""
+        if self.trainer.logger_dispatcher is not None:
+            self.trainer.logger_dispatcher.save(self.trainer.logger)
+        else:
+            self.trainer.logger.save()
+
+    def finalize_loggers(self, status: str):
+        """Finalizes the loggers once all their pending calls are done."""
+        if self.trainer.logger_dispatcher is not None:
+            self.trainer.logger_dispatcher.finalize(self.trainer.logger, status)
+        else:
+            self.trainer.logger.finalize(status)
+
+    def wait_for_loggers(self):
+        """Blocks until the pending logger calls of ``Trainer(async_logging=True)`` are done."""
+        if self.trainer.logger_dispatcher is not None:
+            self.trainer.logger_dispatcher.wait()
+
+    def close_loggers(self, raise_errors: bool = True):
+        """Waits for the pending logger calls and stops the logger threads.
+
+        Args:
+            raise_errors: whether to re-raise the error of a failed logger call, otherwise it is only warned about.
+                Used when the trainer already stops because of another error.
+        """
+        if self.trainer.logger_dispatcher is None:
+            return
+        try:
+            self.trainer.logger_dispatcher.close()
+        except Exception as e:
+            if raise_errors:
+                raise
+            rank_zero_warn(f'A logger call failed while the trainer was stopping: {e!r}')
 
     def add_progress_bar_metrics(self, metrics):
         for k, v in metrics.items():
@@ -165,6 +224,10 @@ class LoggerConnector:
                 if len(dataloader_result_metrics) > 0:
                     eval_loop_results.append(dataloader_result_metrics)
 
+            # write the epoch metrics to disk
+            if self.trainer.is_global_zero and self.trainer.logger is not None:
+                self.save_loggers()
+
         # log results of test
         if test_mode and self.trainer.is_global_zero and self.trainer.verbose_test:
             print('-' * 80)
@@ -210,8 +273,11 @@ class LoggerConnector:
         opt_idx_outputs = epoch_output[0]
 
         try:
-            sample_obj = opt_idx_outputs[0][0] if isinstance(opt_idx_outputs[0], list) else opt_idx_outputs[0]
-            is_result_obj = len(epoch_output) > 0 and isinstance(sample_obj, Result)
+            if isinstance(opt_idx_outputs, EpochResultAccumulator):
+                is_result_obj = True
+            else:
+                sample_obj = opt_idx_outputs[0][0] if isinstance(opt_idx_outputs[0], list) else opt_idx_outputs[0]
+                is_result_obj = len(epoch_output) > 0 and isinstance(sample_obj, Result)
         except IndexError as e:
             is_result_obj = False
 
@@ -265,6 +331,13 @@ class LoggerConnector:
         epoch_log_metrics = {}
         epoch_progress_bar_metrics = {}
         for opt_outputs in epoch_output:
+            # the values were already reduced across time and written into columns during the epoch
+            if isinstance(opt_outputs, EpochResultAccumulator):
+                log_metrics, pbar_metrics = opt_outputs.reduce()
+                epoch_log_metrics.update(log_metrics)
+                epoch_progress_bar_metrics.update(pbar_metrics)
+                continue
+
             # reduce across time first
             time_reduced_outputs = []
             for train_step_idx in range(len(opt_outputs)):
@@ -30,7 +30,8 @@ class OptimizerConnector:
 
         Args:
             interval: either 'epoch' or 'step'.
-            monitor_metrics: dict of possible values to monitor
+            monitor_metrics: mapping of possible values to monitor, only read when a
+                ``ReduceLROnPlateau`` scheduler steps
         """
         if not self.trainer.lr_schedulers:
             return
@@ -51,7 +52,9 @@ class OptimizerConnector:
                         monitor_val = self.trainer.logger_connector.callback_metrics.get(monitor_key)
 
                     if monitor_val is None:
-                        avail_metrics = ','.join(list(self.trainer.logger_connector.callback_metrics.keys()))
+                        available = monitor_metrics if monitor_metrics is not None \
+                            else self.trainer.logger_connector.callback_metrics
+                        avail_metrics = ','.join(list(available.keys()))
                         raise MisconfigurationException(
                             f'ReduceLROnPlateau conditioned on metric {monitor_key}'
                             f' which is not available. Available metrics are: {avail_metrics}.'
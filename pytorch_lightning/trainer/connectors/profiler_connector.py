@@ -24,3 +24,13 @@ class ProfilerConnector:
         if profiler is True:
             profiler = SimpleProfiler()
         self.trainer.profiler = profiler or PassThroughProfiler()
+
+    def log_profiler_metrics(self, batch_idx):
+        """Sends the profiler metrics to the logger every ``profiler.log_every_n_steps`` training batches."""
+        log_every_n_steps = self.trainer.profiler.log_every_n_steps
+        if not log_every_n_steps or (batch_idx + 1) % log_every_n_steps != 0:
+            return
+        if self.trainer.is_global_zero and self.trainer.logger is not None:
+            metrics = self.trainer.profiler.metrics()
+            if metrics:
+                self.trainer.logger.log_metrics(metrics, step=self.trainer.global_step)
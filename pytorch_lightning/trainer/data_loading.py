@@ -78,6 +78,7 @@ class TrainerDataLoadingMixin(ABC):
     num_processes: int
     distributed_backend: Optional[str]
     dev_debugger: InternalDebugger
+    train_dataloader_kwargs: dict
 
     def _worker_check(self, dataloader: DataLoader, name: str) -> None:
         on_windows = platform.system() == 'Windows'
@@ -130,13 +131,18 @@ class TrainerDataLoadingMixin(ABC):
         return dataloader
 
     def replace_sampler(self, dataloader, sampler):
+        return self.replace_dataloader_kwargs(dataloader, sampler=sampler)
+
+    def replace_dataloader_kwargs(self, dataloader, **kwargs):
+        """Re-instantiates the dataloader with its current arguments, overriding the ones given in ``kwargs``."""
         skip_keys = ['sampler', 'batch_sampler', 'dataset_kind']
 
         dl_args = {
             k: v for k, v in dataloader.__dict__.items() if not k.startswith('_') and k not in skip_keys
         }
 
-        dl_args['sampler'] = sampler
+        dl_args['sampler'] = dataloader.sampler
+        dl_args.update(kwargs)
         dataloader = type(dataloader)(**dl_args)
         return dataloader
 
@@ -168,6 +174,12 @@ class TrainerDataLoadingMixin(ABC):
         """
         self.train_dataloader = self.request_dataloader(model.train_dataloader)
 
+        # apply the settings found by the dataloader tuner
+        if self.train_dataloader_kwargs and isinstance(self.train_dataloader, DataLoader):
+            self.train_dataloader = self.replace_dataloader_kwargs(
+                self.train_dataloader, **self.train_dataloader_kwargs
+            )
+
         # debugging
         self.dev_debugger.track_load_dataloader_call('train_dataloader', dataloaders=[self.train_dataloader])
 
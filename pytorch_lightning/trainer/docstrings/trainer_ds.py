@@ -106,6 +106,18 @@ init = r"""
 
             amp_level: The optimization level to use (O1, O2, etc...).
 
+            async_checkpoint: If True, checkpoints are serialized and written on a background thread
+                so training does not wait for the storage.
+
+            prefetch_batches: Number of batches loaded and moved to the device on a background thread
+                ahead of the current step. Default: 0 (disabled)
+
+            async_logging: If True, metrics are copied to the host and passed to the loggers on
+                background threads, one per logger, so training does not wait for the loggers.
+
+            persistent_workers: If True, the worker processes of multi-process dataloaders are kept alive
+                across epochs and evaluation runs until ``fit`` or ``test`` ends.
+
             num_sanity_val_steps: Sanity check runs n validation batches before starting the training routine.
                 Set it to `-1` to run all batches in all validation dataloaders. Default: 2
 
@@ -142,6 +154,10 @@ init = r"""
                 Additionally, can be set to either `power` that estimates the batch size through
                 a power search or `binsearch` that estimates the batch size through a binary search.
 
+            auto_tune_dataloader: If set to True, will `initially` benchmark the train dataloader with
+                different ``num_workers``, ``pin_memory`` and ``prefetch_batches`` settings and
+                use the fastest one for training.
+
             prepare_data_per_node: If True, each LOCAL_RANK=0 will call prepare data.
                 Otherwise only NODE_RANK=0, LOCAL_RANK=0 will prepare data
         """
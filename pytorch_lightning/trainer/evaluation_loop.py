@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pytorch_lightning.trainer.supporters import PredictionCollection
+from pytorch_lightning.trainer.supporters import PersistentDataLoaderIterator, PredictionCollection
 from pytorch_lightning.core.step_result import Result, EvalResult
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.model_utils import is_overridden
@@ -25,6 +25,8 @@ class EvaluationLoop(object):
         self.outputs = []
         self.predictions = None
         self.max_batches = None
+        # (testing, dataloader_idx) -> iterator keeping the workers of the dataloader alive between runs
+        self._persistent_dataloaders = {}
 
     def on_trainer_init(self):
         self.trainer.num_val_batches = []
@@ -66,6 +68,34 @@ class EvaluationLoop(object):
 
         return dataloaders, max_batches
 
+    def get_persistent_dataloader(self, dataloader_idx, dataloader, max_batches):
+        """Reuses the worker processes of ``dataloader`` from the previous evaluation run when possible."""
+        key = (self.testing, dataloader_idx)
+        if (
+            not self.trainer.persistent_workers
+            or self.trainer.use_tpu
+            or not PersistentDataLoaderIterator.is_supported(dataloader, max_batches)
+        ):
+            persistent = self._persistent_dataloaders.pop(key, None)
+            if persistent is not None:
+                persistent.close()
+            return dataloader
+
+        persistent = self._persistent_dataloaders.get(key)
+        # reloaded dataloaders and changed batch limits (e.g. the sanity check) need new workers
+        if persistent is None or persistent.dataloader is not dataloader or persistent.num_batches != max_batches:
+            if persistent is not None:
+                persistent.close()
+            persistent = PersistentDataLoaderIterator(dataloader, max_batches)
+            self._persistent_dataloaders[key] = persistent
+        return persistent
+
+    def close_persistent_dataloaders(self):
+        """Shuts down the worker processes kept alive between evaluation runs."""
+        for persistent in self._persistent_dataloaders.values():
+            persistent.close()
+        self._persistent_dataloaders = {}
+
     def should_skip_evaluation(self, dataloaders, max_batches):
         # skip when dataloaders aren't defined
         if dataloaders is None:
@@ -148,6 +178,8 @@ class EvaluationLoop(object):
         is_result_obj = isinstance(output, Result)
         if is_result_obj:
             output.track_batch_size(len(batch))
+            # start reducing all values logged with sync_dist in one go
+            output.sync_pending(wait=False)
 
         # allow only EvalResult when using structured results (from val_step)
         if is_result_obj and not isinstance(output, EvalResult):
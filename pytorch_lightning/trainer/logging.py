@@ -19,6 +19,7 @@ import torch
 
 from pytorch_lightning.core import memory
 from pytorch_lightning.loggers import TensorBoardLogger, LightningLoggerBase, LoggerCollection
+from pytorch_lightning.loggers.dispatcher import PackedMetrics
 from pytorch_lightning.utilities.memory import recursive_detach
 
 
@@ -40,17 +41,8 @@ class TrainerLoggingMixin(ABC):
     logged_metrics: ...
 
     def metrics_to_scalars(self, metrics):
-        new_metrics = {}
-        for k, v in metrics.items():
-            if isinstance(v, torch.Tensor):
-                v = v.item()
-
-            if isinstance(v, dict):
-                v = self.metrics_to_scalars(v)
-
-            new_metrics[k] = v
-
-        return new_metrics
+        # one device to host copy per device and dtype instead of one per tensor
+        return PackedMetrics(metrics).to_scalars()
 
     def process_output(self, output, train=False):
         """Reduces output according to the training mode.
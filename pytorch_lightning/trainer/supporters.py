@@ -12,11 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import queue
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Optional
 
 import torch
 from torch import Tensor
+from torch.utils.data import DataLoader, Sampler
+
+from pytorch_lightning.utilities import rank_zero_warn
+from pytorch_lightning.utilities.apply_func import apply_to_collection, move_data_to_device
+from pytorch_lightning.utilities.data import has_iterable_dataset
 
 
 class TensorRunningAccum(object):
@@ -163,3 +170,205 @@ class PredictionCollection(object):
 
             # Write predictions for current file to disk
             torch.save(outputs, outfile)
+
+
+def _pin_memory(tensor: Tensor) -> Tensor:
+    if tensor.device.type != 'cpu' or tensor.is_pinned():
+        return tensor
+    return tensor.pin_memory()
+
+
+class _PrefetchError(object):
+    """Carries an exception raised by the loader thread over to the consumer."""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+class BatchPrefetcher(object):
+    """Loads the next ``depth`` batches of ``iterable`` on a background thread while the current batch is used.
+
+    When a CUDA ``device`` is given, the batches are pinned and moved to it with ``transfer_fn`` on a side
+    stream, the consuming stream waits for the copy of a batch only when the batch is handed out.
+
+    Args:
+        iterable: the dataloader to prefetch from.
+        depth: the number of batches which are loaded ahead.
+        transfer_fn: called as ``transfer_fn(batch, device)`` on the loader thread to move a batch,
+            defaults to :func:`~pytorch_lightning.utilities.apply_func.move_data_to_device`.
+        device: the device to move the batches to, ``None`` keeps them where the iterable puts them.
+    """
+
+    _DONE = object()
+
+    def __init__(
+            self,
+            iterable: Iterable,
+            depth: int = 1,
+            transfer_fn: Optional[Callable[[Any, torch.device], Any]] = None,
+            device: Optional[torch.device] = None,
+    ):
+        self.iterable = iterable
+        self.depth = max(1, depth)
+        self.transfer_fn = transfer_fn or move_data_to_device
+        self.device = torch.device(device) if device is not None else None
+
+    def __len__(self):
+        return len(self.iterable)
+
+    def __iter__(self):
+        use_cuda = self.device is not None and self.device.type == 'cuda'
+        stream = torch.cuda.Stream(self.device) if use_cuda else None
+        batches = queue.Queue(maxsize=self.depth)
+        stop = threading.Event()
+
+        thread = threading.Thread(target=self._load, args=(batches, stop, stream), daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is self._DONE:
+                    return
+                if isinstance(item, _PrefetchError):
+                    raise item.exception
+
+                batch, copied = item
+                if copied is not None:
+                    current_stream = torch.cuda.current_stream(self.device)
+                    current_stream.wait_event(copied)
+                    # the memory of the batch was allocated on the side stream
+                    apply_to_collection(batch, Tensor, lambda t: t.record_stream(current_stream) if t.is_cuda else t)
+                yield batch
+        finally:
+            # the consumer may stop early, unblock and end the loader thread
+            stop.set()
+            while thread.is_alive():
+                try:
+                    batches.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            thread.join()
+
+    def _load(self, batches: queue.Queue, stop: threading.Event, stream: Optional['torch.cuda.Stream']):
+        def put(item):
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        try:
+            for batch in self.iterable:
+                if stop.is_set():
+                    return
+                copied = None
+                if stream is not None:
+                    # copies from pinned memory are asynchronous to the host
+                    batch = apply_to_collection(batch, Tensor, _pin_memory)
+                    with torch.cuda.device(self.device), torch.cuda.stream(stream):
+                        batch = self.transfer_fn(batch, self.device)
+                        copied = torch.cuda.Event()
+                        copied.record(stream)
+                elif self.device is not None:
+                    batch = self.transfer_fn(batch, self.device)
+                if not put((batch, copied)):
+                    return
+            put(self._DONE)
+        except BaseException as exception:
+            put(_PrefetchError(exception))
+
+
+class _RepeatBatchSampler(Sampler):
+    """Yields the first ``num_batches`` batches of ``batch_sampler`` over and over again."""
+
+    def __init__(self, batch_sampler: Sampler, num_batches: int):
+        self.batch_sampler = batch_sampler
+        self.num_batches = num_batches
+
+    def __len__(self):
+        return self.num_batches
+
+    def __iter__(self):
+        sampler = getattr(self.batch_sampler, 'sampler', None)
+        first_pass = True
+        while True:
+            # the indices of a pass are requested before the trainer starts the epoch it belongs to,
+            # so the (distributed) sampler is moved on to the next epoch here
+            if not first_pass and hasattr(sampler, 'set_epoch') and hasattr(sampler, 'epoch'):
+                sampler.set_epoch(sampler.epoch + 1)
+            first_pass = False
+
+            for batch_idx, batch in enumerate(self.batch_sampler):
+                if batch_idx >= self.num_batches:
+                    break
+                yield batch
+
+
+class PersistentDataLoaderIterator(object):
+    """Iterates ``num_batches`` batches of ``dataloader`` per pass through one long-lived iterator.
+
+    The worker processes of the dataloader are started once and kept alive between passes
+    (e.g. between validation runs or training epochs) instead of being started for every pass.
+    A pass which is left early drops the iterator, the next pass starts new workers.
+    Dataloaders which can not be re-instantiated from their attributes are iterated as they are.
+    """
+
+    def __init__(self, dataloader: DataLoader, num_batches: int):
+        self.dataloader = dataloader
+        self.num_batches = num_batches
+        self._iterator = None
+
+        skip_keys = ['sampler', 'batch_sampler', 'dataset_kind', 'batch_size', 'drop_last']
+        dl_args = {
+            k: v for k, v in dataloader.__dict__.items() if not k.startswith('_') and k not in skip_keys
+        }
+        dl_args['batch_sampler'] = _RepeatBatchSampler(dataloader.batch_sampler, num_batches)
+        # stored in a private attribute, so it is not part of the public ones
+        dl_args['multiprocessing_context'] = dataloader.multiprocessing_context
+        try:
+            self._loader = type(dataloader)(**dl_args)
+        except TypeError:
+            # e.g. subclasses with their own `__init__` signature
+            rank_zero_warn(f'{type(dataloader).__name__} can not be re-instantiated from its attributes,'
+                           ' its worker processes are started for every pass.')
+            self._loader = None
+
+    @staticmethod
+    def is_supported(dataloader, num_batches) -> bool:
+        """Only map style datasets loaded by worker processes benefit from persistent workers."""
+        return (
+            isinstance(dataloader, DataLoader)
+            and dataloader.num_workers > 0
+            and dataloader.batch_sampler is not None
+            and not has_iterable_dataset(dataloader)
+            and 0 < num_batches < float('inf')
+        )
+
+    def __len__(self):
+        return self.num_batches
+
+    def __iter__(self):
+        if self._loader is None:
+            return iter(self.dataloader)
+        return self._iter_persistent()
+
+    def close(self):
+        """Shuts the worker processes down, the next pass starts new ones."""
+        iterator, self._iterator = self._iterator, None
+        if hasattr(iterator, '_shutdown_workers'):
+            iterator._shutdown_workers()
+
+    def _iter_persistent(self):
+        if self._iterator is None:
+            self._iterator = iter(self._loader)
+        completed = False
+        try:
+            for _ in range(self.num_batches):
+                yield next(self._iterator)
+            completed = True
+        finally:
+            if not completed:
+                # the position within the repeated batches is unknown
+                self._iterator = None
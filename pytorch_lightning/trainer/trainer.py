@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import inspect
 import os
 import warnings
+from functools import partial
 from typing import Dict, Iterable, List, Optional, Union
 
 import torch
@@ -25,7 +27,7 @@ from pytorch_lightning.core.lightning import LightningModule
 from pytorch_lightning.core.memory import ModelSummary
 from pytorch_lightning.core.step_result import EvalResult
 from pytorch_lightning.loggers import LightningLoggerBase
-from pytorch_lightning.profiler import BaseProfiler
+from pytorch_lightning.profiler import BaseProfiler, PassThroughProfiler
 from pytorch_lightning.trainer.callback_hook import TrainerCallbackHookMixin
 from pytorch_lightning.trainer.configuration_validator import ConfigValidator
 from pytorch_lightning.trainer.data_loading import TrainerDataLoadingMixin
@@ -126,9 +128,14 @@ class Trainer(
         replace_sampler_ddp: bool = True,
         terminate_on_nan: bool = False,
         auto_scale_batch_size: Union[str, bool] = False,
+        auto_tune_dataloader: bool = False,
         prepare_data_per_node: bool = True,
         amp_backend: str = 'native',
         amp_level: str = 'O2',  # backward compatible, todo: remove in v1.0.0
+        async_checkpoint: bool = False,
+        prefetch_batches: int = 0,
+        async_logging: bool = False,
+        persistent_workers: bool = False,
         val_percent_check: float = None,  # backward compatible, todo: remove in v0.10.0
         test_percent_check: float = None,  # backward compatible, todo: remove in v0.10.0
         train_percent_check: float = None,  # backward compatible, todo: remove in v0.10.0
@@ -159,6 +166,10 @@ class Trainer(
         self.model = None
         self.shown_warnings = set()
 
+        # hook name -> resolved hooks, valid for the model, accelerator and callbacks in `_hook_dispatch_key`
+        self._hook_dispatch = {}
+        self._hook_dispatch_key = None
+
         # init callbacks
         self.callback_connector.on_trainer_init(
             callbacks,
@@ -168,7 +179,8 @@ class Trainer(
             process_position,
             default_root_dir,
             weights_save_path,
-            resume_from_checkpoint
+            resume_from_checkpoint,
+            async_checkpoint
         )
 
         # hook
@@ -181,7 +193,9 @@ class Trainer(
         self.data_connector.on_trainer_init(
             check_val_every_n_epoch,
             reload_dataloaders_every_epoch,
-            prepare_data_per_node
+            prepare_data_per_node,
+            prefetch_batches,
+            persistent_workers
         )
 
         # init training tricks
@@ -213,13 +227,13 @@ class Trainer(
         self.evaluation_loop.on_trainer_init()
 
         # configure tuner
-        self.tuner.on_trainer_init(auto_lr_find, auto_scale_batch_size)
+        self.tuner.on_trainer_init(auto_lr_find, auto_scale_batch_size, auto_tune_dataloader)
 
         # configure profiler
         self.profile_connector.on_trainer_init(profiler)
 
         # init logger flags
-        self.logger_connector.on_trainer_init(logger, log_save_interval, row_log_interval)
+        self.logger_connector.on_trainer_init(logger, log_save_interval, row_log_interval, async_logging)
 
         # init debugging flags
         self.debugging_connector.on_init_start(
@@ -269,6 +283,16 @@ class Trainer(
             )
             model.logger = self.logger  # reset logger binding
 
+        # Run dataloader tuning
+        if self.auto_tune_dataloader:
+            self.tuner.tune_dataloader(
+                model,
+                train_dataloader=train_dataloader,
+                val_dataloaders=val_dataloaders,
+                datamodule=datamodule,
+            )
+            model.logger = self.logger  # reset logger binding
+
         # Run learning rate finder:
         if self.auto_lr_find:
             self.tuner.internal_find_lr(self, model)
@@ -302,8 +326,16 @@ class Trainer(
         # -------------------------
         self.accelerator_backend = self.accelerator_connector.select_accelerator()
         self.accelerator_backend.setup(model)
-        results = self.accelerator_backend.train()
+        try:
+            results = self.accelerator_backend.train()
+        except BaseException:
+            # do not leave logger threads behind, the training error is raised rather than a logger error
+            self.logger_connector.close_loggers(raise_errors=False)
+            raise
+        finally:
+            self.close_persistent_dataloaders()
         self.accelerator_backend.teardown()
+        self.logger_connector.close_loggers()
 
         # -------------------------
         # POST-Training
@@ -320,6 +352,11 @@ class Trainer(
         # used for testing or when we need to know that training succeeded
         return results or 1
 
+    def close_persistent_dataloaders(self):
+        """Shuts down the dataloader workers kept alive by ``persistent_workers``."""
+        self.train_loop.close_persistent_train_dataloader()
+        self.evaluation_loop.close_persistent_dataloaders()
+
     def train(self):
         self.run_sanity_check(self.get_model())
 
@@ -412,8 +449,10 @@ class Trainer(
         for dataloader_idx, dataloader in enumerate(dataloaders):
             # bookkeeping
             dl_outputs = []
-            dataloader = self.accelerator_backend.process_dataloader(dataloader)
             dl_max_batches = self.evaluation_loop.max_batches[dataloader_idx]
+            dataloader = self.evaluation_loop.get_persistent_dataloader(dataloader_idx, dataloader, dl_max_batches)
+            dataloader = self.accelerator_backend.process_dataloader(dataloader)
+            dataloader = self.data_connector.get_prefetched_dataloader(dataloader)
 
             for batch_idx, batch in enumerate(dataloader):
                 if batch is None:
@@ -460,6 +499,10 @@ class Trainer(
         # hook
         self.evaluation_loop.on_evaluation_end()
 
+        # the test results are only complete once the loggers received them
+        if test_mode:
+            self.logger_connector.wait_for_loggers()
+
         return eval_loop_results, eval_results
 
     def run_test(self):
@@ -539,10 +582,17 @@ class Trainer(
         # Attach datamodule to get setup/prepare_data added to model before the call to it below
         self.data_connector.attach_datamodule(model or self.get_model(), datamodule, 'test')
 
-        if model is not None:
-            results = self.__test_given_model(model, test_dataloaders)
-        else:
-            results = self.__test_using_best_weights(ckpt_path, test_dataloaders)
+        try:
+            if model is not None:
+                results = self.__test_given_model(model, test_dataloaders)
+            else:
+                results = self.__test_using_best_weights(ckpt_path, test_dataloaders)
+        except BaseException:
+            self.logger_connector.close_loggers(raise_errors=False)
+            raise
+        finally:
+            self.close_persistent_dataloaders()
+        self.logger_connector.close_loggers()
 
         self.teardown('test')
 
@@ -623,28 +673,80 @@ class Trainer(
         model.setup(stage_name)
 
     def call_hook(self, hook_name, *args, **kwargs):
+        trainer_hook, callback_hooks, module_hook = self._resolve_hook(hook_name)
+
+        # the default profiler does nothing, skip entering its context for every hook
+        if isinstance(self.profiler, PassThroughProfiler):
+            return self._run_hook(trainer_hook, callback_hooks, module_hook, *args, **kwargs)
+
         # always profile hooks
         with self.profiler.profile(hook_name):
-
-            # first call trainer hook
-            if hasattr(self, hook_name):
+            return self._run_hook(trainer_hook, callback_hooks, module_hook, *args, **kwargs)
+
+    @staticmethod
+    def _run_hook(trainer_hook, callback_hooks, module_hook, *args, **kwargs):
+        # first call trainer hook
+        if trainer_hook is not None:
+            trainer_hook(*args, **kwargs)
+
+        # then the callbacks implementing the hook
+        for callback_hook in callback_hooks:
+            callback_hook(*args, **kwargs)
+
+        # next call hook in lightningModule or accelerator
+        output = None
+        if module_hook is not None:
+            output = module_hook(*args, **kwargs)
+        return output
+
+    def _resolve_hook(self, hook_name):
+        """Looks up the callables to run for ``hook_name``.
+
+        The lookup is cached until the model, accelerator or callbacks change, so the hasattr
+        and `is_overridden` checks run once per hook instead of on every batch.
+        """
+        model_ref = self.get_model()
+        key = (model_ref, self.accelerator_backend, tuple(self.callbacks))
+        if key != self._hook_dispatch_key:
+            self._hook_dispatch = {}
+            self._hook_dispatch_key = key
+
+        hooks = self._hook_dispatch.get(hook_name)
+        if hooks is None:
+            hooks = self._hook_dispatch[hook_name] = self._build_hook(hook_name, model_ref)
+        return hooks
+
+    def _build_hook(self, hook_name, model_ref):
+        trainer_hook = None
+        callback_hooks = ()
+        if hasattr(self, hook_name):
+            mixin_hook = getattr(TrainerCallbackHookMixin, hook_name, None)
+            if (
+                mixin_hook is not None
+                and getattr(type(self), hook_name, None) is mixin_hook
+                and hook_name not in ('on_save_checkpoint', 'on_load_checkpoint')
+            ):
+                # the trainer hooks of `TrainerCallbackHookMixin` only loop over all callbacks,
+                # call the hooks of the callbacks implementing it directly instead.
+                # Trainer hooks taking the model pass it on, the others pass the trainer's model
+                if 'model' in inspect.signature(mixin_hook).parameters:
+                    hook_args = (self,)
+                else:
+                    hook_args = (self, model_ref)
+                callback_hooks = tuple(partial(hook, *hook_args) for hook in self._callback_hooks(hook_name))
+            else:
                 trainer_hook = getattr(self, hook_name)
-                trainer_hook(*args, **kwargs)
 
-            # next call hook in lightningModule
-            output = None
-            model_ref = self.get_model()
-            if is_overridden(hook_name, model_ref):
-                hook_fx = getattr(model_ref, hook_name)
-                output = hook_fx(*args, **kwargs)
+        module_hook = None
+        if is_overridden(hook_name, model_ref):
+            module_hook = getattr(model_ref, hook_name)
 
-            # if the PL module doesn't have the hook then call the accelator
-            # used to auto-reduce things for the user with Results obj
-            elif hasattr(self.accelerator_backend, hook_name):
-                accelerator_hook = getattr(self.accelerator_backend, hook_name)
-                output = accelerator_hook(*args, **kwargs)
+        # if the PL module doesn't have the hook then call the accelator
+        # used to auto-reduce things for the user with Results obj
+        elif hasattr(self.accelerator_backend, hook_name):
+            module_hook = getattr(self.accelerator_backend, hook_name)
 
-            return output
+        return trainer_hook, callback_hooks, module_hook
 
 
 # add docstrings
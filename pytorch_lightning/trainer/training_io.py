@@ -145,6 +145,7 @@ class TrainerIOMixin(ABC):
     use_ddp2: bool
     use_horovod: bool
     checkpoint_callback: ...
+    checkpoint_writer: ...
     global_rank: int
     weights_save_path: str
     logger: LightningLoggerBase
@@ -158,6 +159,7 @@ class TrainerIOMixin(ABC):
     use_tpu: bool
     amp_backend: AMPType
     accelerator_backend: Accelerator
+    profiler: ...
 
     def get_model(self):
         is_dp_module = isinstance(self.model, (LightningDistributedDataParallel, LightningDataParallel))
@@ -246,19 +248,32 @@ class TrainerIOMixin(ABC):
     # --------------------
 
     def save_checkpoint(self, filepath, weights_only: bool = False):
-        checkpoint = self.dump_checkpoint(weights_only)
+        with self.profiler.profile('dump_checkpoint'):
+            checkpoint = self.dump_checkpoint(weights_only)
 
         if self.is_global_zero:
+            # hand the write over to the background writer, training continues while it happens
+            if self.checkpoint_writer is not None:
+                return self.checkpoint_writer.save(checkpoint, filepath, save_fn=self._profiled_save_checkpoint)
+
             # do the actual save
-            try:
-                atomic_save(checkpoint, filepath)
-            except AttributeError as err:
-                if LightningModule.CHECKPOINT_HYPER_PARAMS_KEY in checkpoint:
-                    del checkpoint[LightningModule.CHECKPOINT_HYPER_PARAMS_KEY]
-                rank_zero_warn(
-                    'Warning, `module_arguments` dropped from checkpoint.' f' An attribute is not picklable {err}'
-                )
-                atomic_save(checkpoint, filepath)
+            self._profiled_save_checkpoint(checkpoint, filepath)
+
+    def _profiled_save_checkpoint(self, checkpoint: dict, filepath: str):
+        with self.profiler.profile('write_checkpoint'):
+            self._atomic_save_checkpoint(checkpoint, filepath)
+
+    @staticmethod
+    def _atomic_save_checkpoint(checkpoint: dict, filepath: str):
+        try:
+            atomic_save(checkpoint, filepath)
+        except AttributeError as err:
+            if LightningModule.CHECKPOINT_HYPER_PARAMS_KEY in checkpoint:
+                del checkpoint[LightningModule.CHECKPOINT_HYPER_PARAMS_KEY]
+            rank_zero_warn(
+                'Warning, `module_arguments` dropped from checkpoint.' f' An attribute is not picklable {err}'
+            )
+            atomic_save(checkpoint, filepath)
 
     def restore(self, checkpoint_path: str, on_gpu: bool):
         """
@@ -273,6 +288,10 @@ class TrainerIOMixin(ABC):
         # if on_gpu:
         #     checkpoint = torch.load(checkpoint_path)
         # else:
+        # the checkpoint may still be in the writing queue
+        if self.checkpoint_writer is not None:
+            self.checkpoint_writer.wait()
+
         # load on CPU first
         checkpoint = pl_load(checkpoint_path, map_location=lambda storage, loc: storage)
 
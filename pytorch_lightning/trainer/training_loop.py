@@ -13,18 +13,22 @@
 # limitations under the License.
 
 import subprocess
+from typing import Optional
 import numpy as np
 import torch
 import torch.distributed as torch_distrib
+from torch.nn.parallel import DistributedDataParallel
 from pytorch_lightning.utilities.model_utils import is_overridden
-from pytorch_lightning.trainer.supporters import TensorRunningAccum, Accumulator
+from pytorch_lightning.trainer.supporters import TensorRunningAccum, Accumulator, PersistentDataLoaderIterator
 from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning import _logger as log
 from pytorch_lightning.utilities.memory import recursive_detach
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
-from pytorch_lightning.core.step_result import EvalResult, Result
+from pytorch_lightning.core.step_result import EvalResult, Result, EpochResultAccumulator
 from pytorch_lightning.utilities.parsing import AttributeDict
-from copy import copy, deepcopy
+from contextlib import contextmanager
+from copy import copy
+from collections import ChainMap
 from pytorch_lightning.trainer.states import TrainerState
 from pytorch_lightning.utilities import parsing, AMPType
 from pytorch_lightning.core.lightning import LightningModule
@@ -40,6 +44,10 @@ class TrainLoop:
         self.checkpoint_accumulator = None
         self.accumulated_loss = None
         self._teardown_already_run = False
+        self._persistent_train_dataloader = None
+        self._optimizer_params = None
+        self._active_opt_idx = None
+        self._param_transitions = {}
         self.running_loss = TensorRunningAccum(window_length=20)
 
     def on_trainer_init(self, max_epochs, min_epochs, max_steps, min_steps, num_sanity_val_steps):
@@ -157,12 +165,70 @@ class TrainLoop:
         if self.trainer.is_function_implemented('on_pretrain_routine_end'):
             ref_model.on_pretrain_routine_end()
 
+        # split the trainable parameters between the optimizers once instead of on every batch
+        self.init_optimizer_params()
+
+    def init_optimizer_params(self):
+        """
+        Records the trainable parameters of each optimizer in a multiple-optimizer setup.
+        Parameters which do not require grad when training starts stay frozen for all optimizers.
+        """
+        self._optimizer_params = None
+        self._active_opt_idx = None
+        self._param_transitions = {}
+        if len(self.trainer.optimizers) <= 1:
+            return
+
+        trainable = {id(param): param for param in self.trainer.get_model().parameters() if param.requires_grad}
+        optimizer_params = [trainable]
+        for optimizer in self.trainer.optimizers:
+            params = {}
+            for group in optimizer.param_groups:
+                for param in group['params']:
+                    if id(param) in trainable:
+                        params[id(param)] = param
+            optimizer_params.append(params)
+        # index 0 holds all trainable parameters, optimizer ``i`` is at index ``i + 1``
+        self._optimizer_params = optimizer_params
+
+    def toggle_optimizer_params(self, opt_idx: Optional[int]):
+        """
+        Makes sure only the parameters of the given optimizer require grad, or all trainable
+        parameters if ``opt_idx`` is ``None``. Only the parameters which differ from the previously
+        active optimizer are toggled.
+        """
+        if self._optimizer_params is None:
+            self.init_optimizer_params()
+            if self._optimizer_params is None:
+                return
+        if opt_idx == self._active_opt_idx:
+            return
+
+        transition = (self._active_opt_idx, opt_idx)
+        if transition not in self._param_transitions:
+            previous = self._optimizer_params[0 if self._active_opt_idx is None else self._active_opt_idx + 1]
+            current = self._optimizer_params[0 if opt_idx is None else opt_idx + 1]
+            freeze = [param for key, param in previous.items() if key not in current]
+            unfreeze = [param for key, param in current.items() if key not in previous]
+            self._param_transitions[transition] = (freeze, unfreeze)
+
+        freeze, unfreeze = self._param_transitions[transition]
+        for param in freeze:
+            param.requires_grad = False
+        for param in unfreeze:
+            param.requires_grad = True
+        self._active_opt_idx = opt_idx
+
     def on_train_end(self):
         if self._teardown_already_run:
             return
 
         self._teardown_already_run = True
 
+        # unfreeze the parameters of the other optimizers
+        if self._optimizer_params is not None:
+            self.toggle_optimizer_params(None)
+
         # Save latest checkpoint
         log.info('Saving latest checkpoint..')
         self.check_checkpoint_callback(should_check_val=False)
@@ -170,12 +236,16 @@ class TrainLoop:
         # hook
         self.trainer.call_hook('on_train_end')
 
+        # make sure all checkpoints are written
+        if self.trainer.checkpoint_writer is not None:
+            self.trainer.checkpoint_writer.wait()
+
         # kill loggers
         if self.trainer.logger is not None:
-            self.trainer.logger.finalize("success")
+            self.trainer.logger_connector.finalize_loggers("success")
 
         # summarize profile results
-        if self.trainer.global_rank == 0:
+        if self.trainer.global_rank == 0 or self.trainer.profiler.describe_all_ranks:
             self.trainer.profiler.describe()
 
         if self.trainer.global_rank == 0:
@@ -250,8 +320,19 @@ class TrainLoop:
             self.trainer.reset_val_dataloader(model)
 
     def track_epoch_end_reduce_metrics(self, epoch_output, epoch_end_outputs):
+        # results only reduced automatically are written into columns instead of keeping every step
+        auto_reduce = epoch_end_outputs and not is_overridden('training_epoch_end', model=self.trainer.get_model())
+
         # track the outputs to reduce at the end of the epoch
         for opt_idx, opt_outputs in enumerate(epoch_end_outputs):
+            if auto_reduce and isinstance(opt_outputs[0], Result):
+                if not isinstance(epoch_output[opt_idx], EpochResultAccumulator):
+                    num_batches = self.trainer.num_training_batches
+                    capacity = num_batches if num_batches != float('inf') else 64
+                    epoch_output[opt_idx] = EpochResultAccumulator(capacity)
+                epoch_output[opt_idx].append(opt_outputs)
+                continue
+
             # with 1 step (no tbptt) don't use a sequence at epoch end
             if isinstance(opt_outputs, list) and len(opt_outputs) == 1 and not isinstance(opt_outputs[0], Result):
                 opt_outputs = opt_outputs[0]
@@ -308,6 +389,8 @@ class TrainLoop:
             # track batch size for weighted average
             if is_result_obj:
                 training_step_output.track_batch_size(len(split_batch))
+                # start reducing all values logged with sync_dist in one go
+                training_step_output.sync_pending(wait=False)
 
             # don't allow EvalResult in the training_step
             if isinstance(training_step_output, EvalResult):
@@ -423,8 +506,11 @@ class TrainLoop:
         # get model
         model = self.trainer.get_model()
 
+        # keep the dataloader workers alive across epochs
+        train_dataloader = self.get_persistent_train_dataloader()
+
         # modify dataloader if needed (ddp, etc...)
-        train_dataloader = self.trainer.accelerator_backend.process_dataloader(self.trainer.train_dataloader)
+        train_dataloader = self.trainer.accelerator_backend.process_dataloader(train_dataloader)
 
         # track epoch output
         epoch_output = [[] for _ in range(self.num_optimizers)]
@@ -466,19 +552,21 @@ class TrainLoop:
             if should_check_val:
                 self.trainer.run_evaluation(test_mode=False)
 
-            # -----------------------------------------
-            # SAVE LOGGERS (ie: Tensorboard, etc...)
-            # -----------------------------------------
-            self.save_loggers_on_train_batch_end(batch_idx)
+            with self.trainer.profiler.profile('train_step_logging'):
+                # -----------------------------------------
+                # SAVE LOGGERS (ie: Tensorboard, etc...)
+                # -----------------------------------------
+                self.save_loggers_on_train_batch_end(batch_idx)
 
-            # -----------------------------------------
-            # SAVE METRICS TO LOGGERS
-            # -----------------------------------------
-            self.trainer.logger_connector.save_train_loop_metrics_to_loggers(batch_idx, batch_output)
+                # -----------------------------------------
+                # SAVE METRICS TO LOGGERS
+                # -----------------------------------------
+                self.trainer.logger_connector.save_train_loop_metrics_to_loggers(batch_idx, batch_output)
+                self.trainer.profile_connector.log_profiler_metrics(batch_idx)
 
             # update LR schedulers
-            monitor_metrics = deepcopy(self.trainer.logger_connector.callback_metrics)
-            monitor_metrics.update(batch_output.batch_log_metrics)
+            # lazy view, the step metrics shadow the callback metrics without copying either dict
+            monitor_metrics = ChainMap(batch_output.batch_log_metrics, self.trainer.logger_connector.callback_metrics)
             self.update_train_loop_lr_schedulers(monitor_metrics=monitor_metrics)
 
             # progress global step according to grads progress
@@ -508,6 +596,30 @@ class TrainLoop:
         # epoch end hook
         self.run_on_epoch_end_hook()
 
+    def get_persistent_train_dataloader(self):
+        """Reuses the worker processes of the train dataloader from the previous epoch when possible."""
+        dataloader = self.trainer.train_dataloader
+        num_batches = self.trainer.num_training_batches
+        if (
+            not self.trainer.persistent_workers
+            or self.trainer.use_tpu
+            or not PersistentDataLoaderIterator.is_supported(dataloader, num_batches)
+        ):
+            self.close_persistent_train_dataloader()
+            return dataloader
+
+        persistent = self._persistent_train_dataloader
+        if persistent is None or persistent.dataloader is not dataloader or persistent.num_batches != num_batches:
+            self.close_persistent_train_dataloader()
+            persistent = self._persistent_train_dataloader = PersistentDataLoaderIterator(dataloader, num_batches)
+        return persistent
+
+    def close_persistent_train_dataloader(self):
+        """Shuts down the worker processes kept alive between epochs."""
+        if self._persistent_train_dataloader is not None:
+            self._persistent_train_dataloader.close()
+            self._persistent_train_dataloader = None
+
     def run_training_batch(self, batch, batch_idx, dataloader_idx):
         # track grad norms
         grad_norm_dic = {}
@@ -549,22 +661,25 @@ class TrainLoop:
                 # make sure only the gradients of the current optimizer's parameters are calculated
                 # in the training step to prevent dangling gradients in multiple-optimizer setup.
                 if len(self.trainer.optimizers) > 1:
-                    for param in self.trainer.get_model().parameters():
-                        param.requires_grad = False
-                    for group in optimizer.param_groups:
-                        for param in group['params']:
-                            param.requires_grad = True
+                    self.toggle_optimizer_params(opt_idx)
+
+                # gradients are only applied every `accumulate_grad_batches` batches
+                accumulation_done = (self.trainer.batch_idx + 1) % self.trainer.accumulate_grad_batches == 0
+                is_final_batch = (self.trainer.batch_idx + 1) == self.trainer.num_training_batches
+                should_step = accumulation_done or is_final_batch
 
                 # -------------------
                 # calculate loss (train step + train step end)
                 # -------------------
-                opt_closure_result = self.training_step_and_backward(
-                    split_batch,
-                    batch_idx,
-                    opt_idx,
-                    optimizer,
-                    self.trainer.hiddens
-                )
+                # skip the DDP gradient all-reduce on batches which only accumulate gradients
+                with self.block_ddp_sync_behaviour(should_block=not should_step):
+                    opt_closure_result = self.training_step_and_backward(
+                        split_batch,
+                        batch_idx,
+                        opt_idx,
+                        optimizer,
+                        self.trainer.hiddens
+                    )
 
                 # log metrics
                 self.log_training_step_metrics(opt_closure_result, batch_callback_metrics, batch_log_metrics)
@@ -587,9 +702,7 @@ class TrainLoop:
                 # BACKWARD PASS
                 # ------------------------------
                 # gradient update with accumulated gradients
-                accumulation_done = (self.trainer.batch_idx + 1) % self.trainer.accumulate_grad_batches == 0
-                is_final_batch = (self.trainer.batch_idx + 1) == self.trainer.num_training_batches
-                if accumulation_done or is_final_batch:
+                if should_step:
                     # hook
                     grad_norm_dic = self.on_before_backward(batch_idx, optimizer)
 
@@ -632,6 +745,18 @@ class TrainLoop:
         )
         return result
 
+    @contextmanager
+    def block_ddp_sync_behaviour(self, should_block):
+        """
+        Disables the gradient synchronization of `DistributedDataParallel` while ``should_block`` is set,
+        the gradients are accumulated locally and reduced by the next backward pass outside of this context.
+        """
+        if should_block and isinstance(self.trainer.model, DistributedDataParallel):
+            with self.trainer.model.no_sync():
+                yield
+        else:
+            yield
+
     def training_step_and_backward(self, split_batch, batch_idx, opt_idx, optimizer, hiddens):
         """
         wrap the forward step in a closure so second order methods work
@@ -704,7 +829,7 @@ class TrainLoop:
         should_save_log = (batch_idx + 1) % self.trainer.log_save_interval == 0 or self.trainer.should_stop
         if should_save_log or self.trainer.fast_dev_run:
             if self.trainer.is_global_zero and self.trainer.logger is not None:
-                self.trainer.logger.save()
+                self.trainer.logger_connector.save_loggers()
 
     def process_train_step_outputs(self, all_train_step_outputs, early_stopping_accumulator, checkpoint_accumulator):
         """
@@ -62,17 +62,26 @@ class TrainerTrainingTricksMixin(ABC):
 
     def detect_nan_tensors(self, loss: Tensor) -> None:
         model = self.get_model()
+        named_parameters = list(model.named_parameters())
 
+        # reduce the loss and all weights into one flag on the device, so the check syncs with the host only once
+        finite = [torch.isfinite(loss).all()]
+        finite.extend(torch.isfinite(param).all().to(loss.device) for _, param in named_parameters)
+        finite = torch.stack(finite)
+        if finite.all():
+            return
+
+        # only on failure, find out which tensor is not finite
+        finite = finite.tolist()
         # check if loss is nan
-        if not torch.isfinite(loss).all():
+        if not finite[0]:
             raise ValueError(
                 'The loss returned in `training_step` is nan or inf.'
             )
         # check if a network weight is nan
-        for name, param in model.named_parameters():
-            if not torch.isfinite(param).all():
-                self.print_nan_gradients()
-                raise ValueError(
-                    f'Detected nan and/or inf values in `{name}`.'
-                    ' Check your forward pass for numerically unstable operations.'
-                )
+        name = next(name for (name, _), is_finite in zip(named_parameters, finite[1:]) if not is_finite)
+        self.print_nan_gradients()
+        raise ValueError(
+            f'Detected nan and/or inf values in `{name}`.'
+            ' Check your forward pass for numerically unstable operations.'
+        )
@@ -0,0 +1,277 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+import multiprocessing
+import os
+import time
+from typing import Optional, Sequence, List
+
+from torch.utils.data import DataLoader
+
+from pytorch_lightning import _logger as log
+from pytorch_lightning.callbacks.base import Callback
+from pytorch_lightning.core.lightning import LightningModule
+from pytorch_lightning.loggers.base import DummyLogger
+from pytorch_lightning.utilities import rank_zero_warn
+from pytorch_lightning.utilities.memory import garbage_collection_cuda
+
+
+def tune_dataloader(trainer,
+                    model: LightningModule,
+                    num_batches: int = 200,
+                    num_warmup_batches: int = 10,
+                    num_workers: Optional[Sequence[int]] = None,
+                    pin_memory: Optional[Sequence[bool]] = None,
+                    prefetch_batches: Optional[Sequence[int]] = None,
+                    min_improvement: float = 0.05,
+                    **fit_kwargs):
+    r"""
+    Benchmarks the train dataloader with different ``num_workers``, ``pin_memory`` and
+    ``Trainer(prefetch_batches)`` settings and keeps the fastest one.
+
+    The settings are searched one after the other: first the number of workers, then memory pinning
+    with the best number of workers and last the background prefetching. Each trial trains for
+    ``num_warmup_batches + num_batches`` steps and measures the batches per second and the fraction of
+    the step time spent waiting for the next batch. The model is restored afterwards and the train
+    dataloader is re-instantiated with the best settings whenever the trainer loads it.
+
+    Args:
+        trainer: The Trainer
+        model: Model to fit.
+
+        num_batches: number of batches timed in each trial
+
+        num_warmup_batches: number of batches run before timing, so worker start up is not measured
+
+        num_workers: candidate values for ``DataLoader(num_workers)``. Defaults to 0 and the powers
+            of two up to the number of cpus.
+
+        pin_memory: candidate values for ``DataLoader(pin_memory)``. Defaults to ``[False, True]``
+            when training on GPU, otherwise memory is not pinned.
+
+        prefetch_batches: candidate values for ``Trainer(prefetch_batches)``. Defaults to ``[0, 2]``.
+
+        min_improvement: relative speed up a setting needs over a cheaper one to be picked, e.g.
+            more workers are only used if they are at least 5% faster.
+
+        **fit_kwargs: remaining arguments to be passed to .fit(), e.g., dataloader
+            or datamodule.
+    """
+    if num_workers is None:
+        num_cpus = multiprocessing.cpu_count()
+        num_workers = [0] + [2 ** i for i in range(num_cpus.bit_length()) if 2 ** i <= num_cpus]
+        if num_cpus not in num_workers:
+            num_workers.append(num_cpus)
+    if pin_memory is None:
+        pin_memory = [False, True] if trainer.on_gpu else [False]
+    if prefetch_batches is None:
+        prefetch_batches = [0, 2]
+
+    # Arguments we adjust during the dataloader tuning, save for restoring
+    __tune_dataloader_dump_params(trainer)
+
+    # Set to values that are required by the algorithm
+    __tune_dataloader_reset_params(trainer, model, num_batches + num_warmup_batches)
+
+    # Save initial model, that is loaded after the dataloader is tuned
+    save_path = os.path.join(trainer.default_root_dir, 'dataloader_tune_temp.ckpt')
+    trainer.save_checkpoint(str(save_path))
+
+    if trainer.progress_bar_callback:
+        trainer.progress_bar_callback.disable()
+
+    tuner = _DataLoaderTuner(min_improvement)
+    best = dict(num_workers=num_workers[0], pin_memory=pin_memory[0], prefetch_batches=prefetch_batches[0])
+    for name, candidates in (('num_workers', num_workers),
+                             ('pin_memory', pin_memory),
+                             ('prefetch_batches', prefetch_batches)):
+        measured = []
+        for value in candidates:
+            config = dict(best, **{name: value})
+            result = _run_trial(trainer, model, tuner, config, num_warmup_batches, **fit_kwargs)
+            if result is None:
+                break
+            measured.append(result)
+        if not measured:
+            best = None
+            break
+        best = dict(tuner.pick(measured)['config'])
+
+    # Restore initial state of model
+    trainer.restore(str(save_path), on_gpu=trainer.on_gpu)
+    os.remove(save_path)
+
+    # Finish by resetting variables so trainer is ready to fit model
+    __tune_dataloader_restore_params(trainer)
+    if trainer.progress_bar_callback:
+        trainer.progress_bar_callback.enable()
+
+    if best is not None:
+        log.info(f'Finished dataloader tuning, will continue with full run using {best}')
+        trainer.prefetch_batches = best.pop('prefetch_batches')
+        trainer.train_dataloader_kwargs = best
+
+    return tuner
+
+
+def _run_trial(trainer, model, tuner, config, num_warmup_batches, **fit_kwargs):
+    """ Trains a few steps with the given dataloader settings and records the throughput. """
+    for result in tuner.results:
+        if result['config'] == config:
+            return result
+
+    garbage_collection_cuda()
+    trainer.prefetch_batches = config['prefetch_batches']
+    trainer.train_dataloader_kwargs = {k: v for k, v in config.items() if k != 'prefetch_batches'}
+    trainer.global_step = 0  # reset after each try
+
+    callback = _ThroughputCallback(num_warmup_batches)
+    trainer.callbacks = [callback]
+    trainer.fit(model, **fit_kwargs)
+
+    if not isinstance(trainer.train_dataloader, DataLoader):
+        rank_zero_warn('Dataloader tuning requires the train dataloader to be a `torch.utils.data.DataLoader`,'
+                       ' skipping it.')
+        return None
+    if callback.num_batches == 0:
+        rank_zero_warn('The train dataloader is too short to be timed, try reducing `num_warmup_batches`.')
+        return None
+    return tuner.add(config, callback.batches_per_sec, callback.data_fraction)
+
+
+class _DataLoaderTuner(object):
+    """ Holds the measurements of all dataloader tuning trials.
+
+    Args:
+        min_improvement: relative speed up a setting needs over a cheaper one to be picked
+
+    Attributes:
+        results: list of dicts holding the ``config``, the ``batches_per_sec`` and the ``data_fraction``
+            (fraction of the step time spent waiting for the next batch) of each trial
+    """
+
+    def __init__(self, min_improvement: float = 0.05):
+        self.min_improvement = min_improvement
+        self.results = []
+
+    def add(self, config: dict, batches_per_sec: float, data_fraction: float) -> dict:
+        result = dict(config=config, batches_per_sec=batches_per_sec, data_fraction=data_fraction)
+        self.results.append(result)
+        log.info(f'Dataloader tuning: {config} ran at {batches_per_sec:.2f} batches/sec,'
+                 f' {data_fraction:.1%} of the step time spent waiting for data')
+        return result
+
+    def pick(self, results: List[dict]) -> dict:
+        """ Picks the first of the given results which is not beaten by a later one
+        by more than ``min_improvement``. Results are expected to go from cheap to expensive settings. """
+        best = results[0]
+        for result in results[1:]:
+            if result['batches_per_sec'] > best['batches_per_sec'] * (1 + self.min_improvement):
+                best = result
+        return best
+
+    def suggestion(self) -> Optional[dict]:
+        """ Returns the fastest measured dataloader settings. """
+        if not self.results:
+            return None
+        return dict(max(self.results, key=lambda r: r['batches_per_sec'])['config'])
+
+
+class _ThroughputCallback(Callback):
+    """ Measures the step time and the time spent waiting for the next batch, after a few warmup batches. """
+
+    def __init__(self, num_warmup_batches: int = 0):
+        self.num_warmup_batches = num_warmup_batches
+        self.num_batches = 0
+        self.step_time = 0.0
+        self.wait_time = 0.0
+        self._seen_batches = 0
+        self._batch_start = None
+        self._batch_end = None
+
+    @property
+    def batches_per_sec(self) -> float:
+        return self.num_batches / self.step_time if self.step_time > 0 else 0.0
+
+    @property
+    def data_fraction(self) -> float:
+        return self.wait_time / self.step_time if self.step_time > 0 else 0.0
+
+    def on_train_epoch_start(self, trainer, pl_module):
+        # the time between two epochs is spent in epoch end hooks and starting the workers
+        self._batch_end = None
+
+    def on_train_batch_start(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+        self._batch_start = time.perf_counter()
+
+    def on_train_batch_end(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+        now = time.perf_counter()
+        if self._batch_end is not None and self._seen_batches >= self.num_warmup_batches:
+            self.num_batches += 1
+            self.step_time += now - self._batch_end
+            self.wait_time += self._batch_start - self._batch_end
+        self._batch_end = now
+        self._seen_batches += 1
+
+
+def __tune_dataloader_dump_params(trainer):
+    trainer.__dumped_params = {
+        'auto_lr_find': trainer.auto_lr_find,
+        'auto_scale_batch_size': trainer.auto_scale_batch_size,
+        'auto_tune_dataloader': trainer.auto_tune_dataloader,
+        'max_steps': trainer.max_steps,
+        'weights_summary': trainer.weights_summary,
+        'logger': trainer.logger,
+        'callbacks': trainer.callbacks,
+        'checkpoint_callback': trainer.checkpoint_callback,
+        'early_stop_callback': trainer.early_stop_callback,
+        'limit_train_batches': trainer.limit_train_batches,
+        'limit_val_batches': trainer.limit_val_batches,
+        'prefetch_batches': trainer.prefetch_batches,
+        'train_dataloader_kwargs': trainer.train_dataloader_kwargs,
+        'model': trainer.model,
+    }
+
+
+def __tune_dataloader_reset_params(trainer, model, steps_per_trial):
+    trainer.auto_lr_find = False  # avoid lr find being called multiple times
+    trainer.auto_scale_batch_size = None
+    trainer.auto_tune_dataloader = False  # prevent recursion
+    trainer.max_steps = steps_per_trial
+    trainer.weights_summary = None  # not needed before full run
+    trainer.logger = DummyLogger()
+    trainer.callbacks = []  # not needed before full run
+    trainer.checkpoint_callback = False  # required for saving
+    trainer.early_stop_callback = None
+    trainer.limit_train_batches = 1.0
+    trainer.limit_val_batches = 0  # validation would be timed as waiting for data
+    trainer.optimizers, trainer.schedulers = [], []  # required for saving
+    trainer.model = model  # required for saving
+
+
+def __tune_dataloader_restore_params(trainer):
+    trainer.auto_lr_find = trainer.__dumped_params['auto_lr_find']
+    trainer.auto_scale_batch_size = trainer.__dumped_params['auto_scale_batch_size']
+    trainer.auto_tune_dataloader = trainer.__dumped_params['auto_tune_dataloader']
+    trainer.max_steps = trainer.__dumped_params['max_steps']
+    trainer.weights_summary = trainer.__dumped_params['weights_summary']
+    trainer.logger = trainer.__dumped_params['logger']
+    trainer.callbacks = trainer.__dumped_params['callbacks']
+    trainer.checkpoint_callback = trainer.__dumped_params['checkpoint_callback']
+    trainer.early_stop_callback = trainer.__dumped_params['early_stop_callback']
+    trainer.limit_train_batches = trainer.__dumped_params['limit_train_batches']
+    trainer.limit_val_batches = trainer.__dumped_params['limit_val_batches']
+    trainer.prefetch_batches = trainer.__dumped_params['prefetch_batches']
+    trainer.train_dataloader_kwargs = trainer.__dumped_params['train_dataloader_kwargs']
+    trainer.model = trainer.__dumped_params['model']
+    del trainer.__dumped_params
@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from pytorch_lightning.tuner.batch_size_scaling import scale_batch_size
+from pytorch_lightning.tuner.dataloader_tuning import tune_dataloader
 from pytorch_lightning.tuner.auto_gpu_select import pick_multiple_gpus
 from pytorch_lightning.tuner.lr_finder import _run_lr_finder_internally, lr_find
 from pytorch_lightning.core.lightning import LightningModule
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Sequence
 from torch.utils.data import DataLoader
 
 
@@ -24,9 +25,11 @@ class Tuner:
     def __init__(self, trainer):
         self.trainer = trainer
 
-    def on_trainer_init(self, auto_lr_find, auto_scale_batch_size):
+    def on_trainer_init(self, auto_lr_find, auto_scale_batch_size, auto_tune_dataloader):
         self.trainer.auto_lr_find = auto_lr_find
         self.trainer.auto_scale_batch_size = auto_scale_batch_size
+        self.trainer.auto_tune_dataloader = auto_tune_dataloader
+        self.trainer.train_dataloader_kwargs = {}
 
     def scale_batch_size(self,
                          model,
@@ -40,6 +43,27 @@ class Tuner:
             self.trainer, model, mode, steps_per_trial, init_val, max_trials, batch_arg_name, **fit_kwargs
         )
 
+    def tune_dataloader(self,
+                        model,
+                        num_batches: int = 200,
+                        num_warmup_batches: int = 10,
+                        num_workers: Optional[Sequence[int]] = None,
+                        pin_memory: Optional[Sequence[bool]] = None,
+                        prefetch_batches: Optional[Sequence[int]] = None,
+                        min_improvement: float = 0.05,
+                        **fit_kwargs):
+        return tune_dataloader(
+            self.trainer,
+            model,
+            num_batches,
+            num_warmup_batches,
+            num_workers,
+            pin_memory,
+            prefetch_batches,
+            min_improvement,
+            **fit_kwargs
+        )
+
     def lr_find(
             self,
             model: LightningModule,
@@ -13,8 +13,13 @@
 # limitations under the License.
 
 import io
+import os
+import shutil
+import threading
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from distutils.version import LooseVersion
-from typing import Union
+from typing import Any, Callable, List, Optional, Union
 from pathlib import Path
 from urllib.parse import urlparse
 import torch
@@ -58,5 +63,199 @@ def atomic_save(checkpoint, filepath: str):
         torch.save(checkpoint, bytesbuffer, _use_new_zipfile_serialization=False)
     else:
         torch.save(checkpoint, bytesbuffer)
-    with fsspec.open(filepath, "wb") as f:
-        f.write(bytesbuffer.getvalue())
+    filepath = str(filepath)
+    if "://" in filepath:
+        with fsspec.open(filepath, "wb") as f:
+            f.write(bytesbuffer.getvalue())
+        return
+
+    # on local storage write next to the target and rename, so readers never see a partial file
+    tmp_path = f"{filepath}.part"
+    with open(tmp_path, "wb") as f:
+        f.write(bytesbuffer.getbuffer())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+
+
+def link_or_copy(src: pathlike, dst: pathlike):
+    """Makes the checkpoint file ``src`` also available at ``dst`` without serializing it again.
+
+    Local files are hard linked where the filesystem supports it and copied otherwise, this is safe
+    because checkpoints are replaced and never modified in place. Remote files are copied.
+
+    Args:
+        src: path of an existing checkpoint.
+        dst: path at which the checkpoint should be available as well.
+    """
+    src, dst = str(src), str(dst)
+    if "://" in src or "://" in dst:
+        src_fs, dst_fs = get_filesystem(src), get_filesystem(dst)
+        if src_fs.protocol == dst_fs.protocol:
+            src_fs.copy(src, dst)
+        else:
+            with fsspec.open(src, "rb") as fsrc, fsspec.open(dst, "wb") as fdst:
+                shutil.copyfileobj(fsrc, fdst)
+        return
+
+    tmp_path = f"{dst}.part"
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+def _storage(tensor: torch.Tensor):
+    """Returns the storage of the tensor and the dtype it holds, untyped storages are shared across dtypes."""
+    if hasattr(tensor, "untyped_storage"):
+        return tensor.untyped_storage(), torch.uint8
+    return tensor.storage(), tensor.dtype
+
+
+def _snapshot_tensor(tensor: torch.Tensor, pin_memory: bool, memo: dict) -> torch.Tensor:
+    tensor = tensor.detach()
+    if tensor.layout != torch.strided or tensor.is_quantized:
+        return tensor.to("cpu", copy=True)
+
+    # tensors sharing a storage, e.g. tied weights, share the copied storage, so they are written once
+    storage, storage_dtype = _storage(tensor)
+    key = (storage.data_ptr(), tensor.device, storage_dtype)
+    copied = memo.get(key)
+    if copied is None:
+        source = torch.empty(0, dtype=storage_dtype, device=tensor.device).set_(storage)
+        if tensor.device.type == "cpu":
+            copied = source.clone()
+        else:
+            copied = torch.empty(source.shape, dtype=storage_dtype, pin_memory=pin_memory)
+            copied.copy_(source, non_blocking=pin_memory)
+        copied = _storage(copied)[0]
+        memo[key] = copied
+    return torch.empty(0, dtype=tensor.dtype).set_(copied, tensor.storage_offset(), tensor.size(), tensor.stride())
+
+
+def _snapshot_to_cpu(data: Any, pin_memory: bool = False, memo: Optional[dict] = None) -> Any:
+    """Copies all tensors of a (nested) checkpoint to CPU memory so training can keep updating them."""
+    if memo is None:
+        memo = {}
+    if isinstance(data, torch.Tensor):
+        return _snapshot_tensor(data, pin_memory, memo)
+    if isinstance(data, Mapping):
+        snapshot = type(data)((k, _snapshot_to_cpu(v, pin_memory, memo)) for k, v in data.items())
+        # keep the state dict versions used by `load_state_dict`
+        if hasattr(data, "_metadata"):
+            snapshot._metadata = data._metadata
+        return snapshot
+    if isinstance(data, (list, tuple)) and not hasattr(data, "_fields"):
+        return type(data)(_snapshot_to_cpu(v, pin_memory, memo) for v in data)
+    return data
+
+
+class AsyncCheckpointWriter(object):
+    """Serializes and writes checkpoints on a background thread.
+
+    :meth:`save` takes a CPU snapshot of all tensors in the checkpoint (through pinned memory when
+    the tensors live on GPU) and returns immediately, while the serialization and the write happen in
+    the background. At most ``max_pending`` snapshots are held in memory, further saves block until
+    an earlier write has finished.
+
+    Args:
+        max_pending: maximal number of checkpoints queued or being written at the same time.
+
+    Example:
+        >>> import tempfile
+        >>> writer = AsyncCheckpointWriter()
+        >>> path = os.path.join(tempfile.mkdtemp(), 'weights.ckpt')
+        >>> future = writer.save({'weight': torch.ones(2)}, path)
+        >>> writer.wait()
+        >>> torch.load(path)
+        {'weight': tensor([1., 1.])}
+    """
+
+    def __init__(self, max_pending: int = 1):
+        if max_pending < 1:
+            raise ValueError(f"`max_pending` has to be a positive integer, got {max_pending}.")
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._futures: List[Future] = []
+
+    def save(self, checkpoint: Any, filepath: str, save_fn: Optional[Callable] = None) -> Future:
+        """Snapshots the checkpoint and schedules writing it to ``filepath``.
+
+        Args:
+            checkpoint: the object to save, anything ``torch.save`` accepts.
+            filepath: the path to which the checkpoint will be saved.
+            save_fn: function called as ``save_fn(checkpoint, filepath)`` on the writer thread.
+                Defaults to :func:`atomic_save`.
+
+        Return:
+            future which is done once the checkpoint is written.
+        """
+        self._slots.acquire()
+        try:
+            snapshot = _snapshot_to_cpu(checkpoint, pin_memory=torch.cuda.is_available())
+            ready = None
+            if torch.cuda.is_available() and torch.cuda.is_initialized():
+                # the device to host copies are asynchronous, the writer has to wait for them
+                ready = torch.cuda.Event()
+                ready.record()
+            future = self.submit(self._write, snapshot, filepath, save_fn or atomic_save, ready)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Runs ``fn(*args)`` on the writer thread once all previously scheduled writes are done.
+
+        Return:
+            future holding the result of ``fn``.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint_writer")
+        future = self._executor.submit(fn, *args)
+        self._futures = [f for f in self._futures if not f.done()] + [future]
+        return future
+
+    @staticmethod
+    def _write(checkpoint: Any, filepath: str, save_fn: Callable, ready: Optional[Any]) -> str:
+        if ready is not None:
+            ready.synchronize()
+        save_fn(checkpoint, filepath)
+        return filepath
+
+    @property
+    def pending(self) -> int:
+        """Number of checkpoints which are not written yet."""
+        return sum(not f.done() for f in self._futures)
+
+    def wait(self) -> None:
+        """Blocks until all scheduled checkpoints are written and re-raises the first write error."""
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def close(self) -> None:
+        """Waits for all pending writes and stops the writer thread."""
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # threads and locks cannot be pickled, a new writer thread is started on the next save
+        state["_slots"] = None
+        state["_executor"] = None
+        state["_futures"] = []
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._slots = threading.BoundedSemaphore(self.max_pending)
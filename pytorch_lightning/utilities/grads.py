@@ -0,0 +1,64 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Gradient norms computed on device without synchronizing with the host per tensor
+"""
+from typing import Optional, Sequence
+
+import torch
+
+_FOREACH_NORM_AVAILABLE = hasattr(torch, '_foreach_norm')
+
+
+def tensor_norms(
+        tensors: Sequence[torch.Tensor],
+        norm_type: float = 2.0,
+        device: Optional[torch.device] = None,
+) -> torch.Tensor:
+    """Computes the p-norm of each tensor and stacks them into one tensor.
+
+    All norms stay on the device, so reading them costs one transfer instead of one per tensor.
+
+    Args:
+        tensors: the tensors to compute norms of, e.g. the gradients of a model.
+        norm_type: the type of the used p-norm. Can be ``float('inf')`` for infinity norm.
+        device: device of the returned tensor, defaults to the device of the first tensor.
+
+    Return:
+        1d tensor holding the norm of each tensor, in the same order.
+    """
+    if len(tensors) == 0:
+        return torch.empty(0, device=device)
+    device = device or tensors[0].device
+
+    single_device = all(t.device == device for t in tensors)
+    if _FOREACH_NORM_AVAILABLE and single_device:
+        norms = torch._foreach_norm(list(tensors), norm_type)
+    else:
+        norms = [torch.norm(t, norm_type).to(device) for t in tensors]
+    # gradients may mix precisions, the norms are compared in a common dtype
+    return torch.stack([n.float() for n in norms])
+
+
+def total_norm(norms: torch.Tensor, norm_type: float = 2.0) -> torch.Tensor:
+    """Combines per tensor norms into the norm of all tensors viewed as a single vector.
+
+    Args:
+        norms: 1d tensor of norms as returned by :func:`tensor_norms`.
+        norm_type: the type of the used p-norm. Can be ``float('inf')`` for infinity norm.
+    """
+    if norms.numel() == 0:
+        return torch.zeros((), device=norms.device)
+    return torch.norm(norms, norm_type)
@@ -3,6 +3,7 @@ import pickle
 import platform
 import re
 from pathlib import Path
+from unittest import mock
 
 import cloudpickle
 import pytest
@@ -205,3 +206,119 @@ def test_ckpt_metric_names_results(tmpdir):
     assert len(ckpts) == 1
     val = re.sub("[^0-9.]", "", ckpts[0])
     assert len(val) > 3
+
+
+@pytest.mark.parametrize("save_top_k", [-1, 2])
+def test_model_checkpoint_async_checkpoint(tmpdir, save_top_k):
+    """Test that writing checkpoints in the background leaves the same files as writing them in place."""
+    saved_files = []
+    for async_checkpoint in (False, True):
+        seed_everything(100)
+        model = EvalModelTemplate()
+        dirpath = tmpdir.mkdir(f"async_{async_checkpoint}")
+        model_checkpoint = ModelCheckpoint(filepath=dirpath, save_top_k=save_top_k, save_last=True)
+        trainer = Trainer(
+            default_root_dir=tmpdir,
+            early_stop_callback=False,
+            checkpoint_callback=model_checkpoint,
+            max_epochs=4,
+            async_checkpoint=async_checkpoint,
+        )
+        trainer.fit(model)
+        assert trainer.checkpoint_writer is None or trainer.checkpoint_writer.pending == 0
+        saved_files.append(sorted(os.listdir(dirpath)))
+
+        ckpt = torch.load(os.path.join(dirpath, ModelCheckpoint.CHECKPOINT_NAME_LAST))
+        assert ckpt["epoch"] == 4
+
+    assert saved_files[0] == saved_files[1]
+    assert not any(f.endswith(".part") for f in saved_files[1])
+
+
+def test_model_checkpoint_deletes_after_durable_write(tmpdir):
+    """Test that a replaced top-k checkpoint is only removed once its successor is written."""
+    from threading import Event
+
+    from pytorch_lightning.utilities.cloud_io import AsyncCheckpointWriter, atomic_save
+
+    writer = AsyncCheckpointWriter()
+    gate = Event()
+
+    def slow_save(checkpoint, filepath):
+        gate.wait()
+        atomic_save(checkpoint, filepath)
+
+    model_checkpoint = ModelCheckpoint(filepath=tmpdir, save_top_k=1, mode="min")
+    model_checkpoint.save_function = lambda filepath, _: writer.save({"w": torch.ones(1)}, filepath, slow_save)
+    trainer = Trainer(default_root_dir=tmpdir)
+
+    old_path = str(tmpdir / "old.ckpt")
+    atomic_save({}, old_path)
+    model_checkpoint.best_k_models = {old_path: torch.tensor(1.0)}
+    model_checkpoint.kth_best_model_path = old_path
+
+    new_path = str(tmpdir / "new.ckpt")
+    model_checkpoint._do_check_save(new_path, torch.tensor(0.5), 0, trainer, None)
+    assert model_checkpoint.best_model_path == new_path
+    model_checkpoint._flush_pending_deletes()
+    # the new checkpoint is not written yet so the old one has to stay
+    assert os.path.isfile(old_path)
+    assert not os.path.isfile(new_path)
+
+    gate.set()
+    model_checkpoint.on_train_end(trainer, None)
+    assert not os.path.isfile(old_path)
+    assert torch.load(new_path)["w"].eq(1).all()
+    writer.close()
+
+
+def test_async_checkpoint_keeps_shared_tensors_shared(tmpdir):
+    """Test that tied weights and views are snapshotted once and stay shared in the written checkpoint."""
+    from pytorch_lightning.utilities.cloud_io import AsyncCheckpointWriter
+
+    weight = torch.randn(16, 16)
+    checkpoint = {"state_dict": {"encoder": weight, "decoder": weight, "row": weight[3]}}
+
+    writer = AsyncCheckpointWriter()
+    async_path = str(tmpdir / "async.ckpt")
+    writer.save(checkpoint, async_path).result()
+    writer.close()
+    # modifying the source after the snapshot must not leak into the written file
+    weight.zero_()
+
+    sync_path = str(tmpdir / "sync.ckpt")
+    torch.save(checkpoint, sync_path)
+    # the shared storage is written once, a duplicated copy would add the full weight to the file
+    assert os.path.getsize(async_path) < os.path.getsize(sync_path) + weight.numel() * weight.element_size()
+
+    state_dict = torch.load(async_path)["state_dict"]
+    assert state_dict["encoder"].abs().sum() > 0
+    assert state_dict["encoder"].data_ptr() == state_dict["decoder"].data_ptr()
+    assert state_dict["row"].untyped_storage().data_ptr() == state_dict["encoder"].untyped_storage().data_ptr()
+    assert torch.equal(state_dict["row"], state_dict["encoder"][3])
+
+
+@pytest.mark.parametrize("async_checkpoint", [False, True])
+@pytest.mark.parametrize("save_top_k", [-1, 1])
+def test_model_checkpoint_save_last_serializes_once(tmpdir, save_top_k, async_checkpoint):
+    """Test that `last.ckpt` shares the serialization of the monitored checkpoint saved in the same epoch."""
+    model = EvalModelTemplate()
+    num_epochs = 3
+    model_checkpoint = ModelCheckpoint(filepath=tmpdir, save_top_k=save_top_k, save_last=True, mode="max")
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        early_stop_callback=False,
+        checkpoint_callback=model_checkpoint,
+        max_epochs=num_epochs,
+        async_checkpoint=async_checkpoint,
+    )
+    with mock.patch.object(trainer, "dump_checkpoint", wraps=trainer.dump_checkpoint) as dump_checkpoint:
+        trainer.fit(model)
+    # `mode="max"` on the loss keeps the first epoch, later epochs only save `last.ckpt`
+    assert dump_checkpoint.call_count == num_epochs
+
+    path_last = str(tmpdir / ModelCheckpoint.CHECKPOINT_NAME_LAST)
+    path_last_epoch = model_checkpoint.format_checkpoint_name(num_epochs - 1, {})
+    if save_top_k == -1:
+        assert os.path.samefile(path_last, path_last_epoch)
+    assert torch.load(path_last)["epoch"] == num_epochs
@@ -0,0 +1,92 @@
+import time
+
+import pytest
+from torch.utils.data import DataLoader
+from torch.utils.data._utils.collate import default_collate
+
+from pytorch_lightning import Trainer
+from pytorch_lightning.callbacks import StepTimeMonitor
+from pytorch_lightning.profiler import SimpleProfiler, StepTimelineProfiler
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from tests.base import EvalModelTemplate
+import tests.base.develop_utils as tutils
+
+
+def test_step_time_monitor(tmpdir):
+    """ Test that every step is broken down and the configured profiler is kept. """
+    tutils.reset_seed()
+
+    model = EvalModelTemplate()
+    profiler = SimpleProfiler()
+    step_time_monitor = StepTimeMonitor(window=5, logging_interval=2)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=10,
+        limit_val_batches=2,
+        profiler=profiler,
+        callbacks=[step_time_monitor],
+    )
+    result = trainer.fit(model)
+    assert result
+
+    assert len(step_time_monitor.steps) == 5
+    breakdown = step_time_monitor.breakdown()
+    assert set(breakdown) == set(StepTimelineProfiler.CATEGORIES)
+    assert sum(breakdown.values()) == pytest.approx(100)
+    assert breakdown['forward'] > 0
+    assert breakdown['backward'] > 0
+
+    # the wrapped profiler received all actions and is restored after training
+    assert trainer.profiler is profiler
+    assert 'train_step_logging' in profiler.recorded_durations
+    assert 'get_train_batch' in profiler.recorded_durations
+
+
+def _slow_collate(batch):
+    time.sleep(0.05)
+    return default_collate(batch)
+
+
+def test_step_time_monitor_input_bound(tmpdir):
+    """ Test that steps waiting for a slow dataloader are flagged. """
+    tutils.reset_seed()
+
+    class SlowDataModel(EvalModelTemplate):
+
+        def train_dataloader(self):
+            loader = super().train_dataloader()
+            return DataLoader(loader.dataset, batch_size=loader.batch_size, collate_fn=_slow_collate)
+
+    model = SlowDataModel()
+    step_time_monitor = StepTimeMonitor(window=5, logging_interval=5)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=10,
+        limit_val_batches=0,
+        callbacks=[step_time_monitor],
+    )
+    with pytest.warns(UserWarning, match='Training is input bound'):
+        trainer.fit(model)
+
+    assert step_time_monitor.num_input_bound_steps >= 5
+    assert step_time_monitor.input_bound_fraction() > 0.5
+    assert step_time_monitor.breakdown()['data_wait'] > 50
+
+
+def test_step_time_monitor_no_logger(tmpdir):
+    tutils.reset_seed()
+
+    model = EvalModelTemplate()
+
+    step_time_monitor = StepTimeMonitor()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        callbacks=[step_time_monitor],
+        logger=False
+    )
+
+    with pytest.raises(MisconfigurationException, match='Trainer that has no logger'):
+        trainer.fit(model)
@@ -1,4 +1,5 @@
 import sys
+from copy import copy
 from pathlib import Path
 
 import pytest
@@ -6,7 +7,7 @@ import torch
 import torch.distributed as dist
 import torch.multiprocessing as mp
 from pytorch_lightning import Trainer, seed_everything
-from pytorch_lightning.core.step_result import Result, TrainResult, EvalResult
+from pytorch_lightning.core.step_result import Result, TrainResult, EvalResult, EpochResultAccumulator
 import tests.base.develop_utils as tutils
 
 from tests.base import EvalModelTemplate
@@ -43,6 +44,45 @@ def test_result_reduce_ddp(result_cls):
     mp.spawn(_ddp_test_fn, args=(worldsize, result_cls), nprocs=worldsize)
 
 
+def _ddp_test_deferred_sync(rank, worldsize):
+    _setup_ddp(rank, worldsize)
+
+    res = Result()
+    res.log("mean", torch.tensor(float(rank)), sync_dist=True)
+    res.log("sum", torch.tensor([1.0, 2.0]), on_step=True, sync_dist=True, sync_dist_op="sum")
+    res.log("count", torch.tensor(rank + 1), sync_dist=True, sync_dist_op="sum")
+    res.log("local", torch.tensor(float(rank)))
+    res.sync_pending(wait=False)
+
+    expected_mean = sum(range(worldsize)) / worldsize
+    assert res["mean"].item() == expected_mean
+    assert torch.equal(res["step_sum"], torch.tensor([1.0, 2.0]) * worldsize)
+    assert torch.equal(res["epoch_sum"], torch.tensor([1.0, 2.0]) * worldsize)
+    assert res["count"].item() == sum(range(1, worldsize + 1))
+    assert res["local"].item() == rank
+
+    # meta values are materialized as well
+    assert res._meta_values["mean"].item() == expected_mean
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+def test_result_deferred_sync_ddp():
+    """Make sure values logged with sync_dist are reduced together once read"""
+    tutils.reset_seed()
+    tutils.set_random_master_port()
+
+    worldsize = 2
+    mp.spawn(_ddp_test_deferred_sync, args=(worldsize,), nprocs=worldsize)
+
+
+def test_result_sync_dist_without_ddp():
+    res = TrainResult()
+    res.log("loss", torch.tensor(2.0), sync_dist=True)
+    res.sync_pending(wait=False)
+    assert res["loss"] == 2.0
+    assert copy(res)["loss"] == 2.0
+
+
 @pytest.mark.parametrize(
     "test_option,do_train,gpus",
     [
@@ -244,3 +284,102 @@ def test_result_retrieve_last_logged_item():
     assert result['epoch_a'] == 5.
     assert result['step_a'] == 5.
     assert result['a'] == 5.
+
+
+def test_result_metric_views_cached():
+    """Make sure keys logged with the same options share their meta and the cached views follow changes"""
+    result = TrainResult()
+    result.log('loss', torch.tensor(0), prog_bar=True, on_step=True, on_epoch=True)
+    step_meta = result['meta']['step_loss']
+    assert 'value' not in step_meta
+    assert result.batch_log_metrics == {'step_loss': torch.tensor(0)}
+
+    result.log('loss', torch.tensor(1), prog_bar=True, on_step=True, on_epoch=True)
+    assert result['meta']['step_loss'] is step_meta
+    assert result._meta_values['step_loss'] == torch.tensor(1)
+    assert result.batch_log_metrics == {'step_loss': torch.tensor(1)}
+    assert result.batch_pbar_metrics == {'step_loss': torch.tensor(1)}
+    assert result.epoch_log_metrics == {'epoch_loss': torch.tensor(1)}
+    assert result.epoch_pbar_metrics == {'epoch_loss': torch.tensor(1)}
+
+    # the result of the next step shares the interned meta, but not the logged values
+    other = TrainResult()
+    other.log('loss', torch.tensor(2), prog_bar=True, on_step=True, on_epoch=True)
+    assert other['meta']['step_loss'] is step_meta
+    assert other['meta']['epoch_loss'] is result['meta']['epoch_loss']
+    assert other['meta'] is not result['meta']
+    assert result._meta_values['step_loss'] == torch.tensor(1)
+    assert other._meta_values['step_loss'] == torch.tensor(2)
+
+    result.log('loss', torch.tensor(3), prog_bar=False, on_step=True, on_epoch=True)
+    assert result['meta']['step_loss'] is not step_meta
+    assert step_meta['prog_bar']
+    assert result.batch_pbar_metrics == {}
+    assert set(other.batch_pbar_metrics) == {'step_loss'}
+
+    # unhashable reduce functions are not interned
+    class UnhashableMean:
+        __hash__ = None
+
+        def __call__(self, x):
+            return x.mean()
+
+    reduce_fx = UnhashableMean()
+    other.log('unhashable', torch.tensor(1.), reduce_fx=reduce_fx)
+    assert other['meta']['unhashable']['reduce_fx'] is reduce_fx
+
+    result.log('acc', torch.tensor(2), logger=False, prog_bar=True)
+    assert set(result.batch_pbar_metrics) == {'acc'}
+    assert set(result.batch_log_metrics) == {'step_loss'}
+
+    result.rename_keys({'acc': 'val_acc'})
+    assert set(result.batch_pbar_metrics) == {'val_acc'}
+
+
+def _make_step_results(step, num_splits):
+    results = []
+    for split in range(num_splits):
+        loss = torch.tensor(float(step + split), requires_grad=True) * 1
+        result = TrainResult(minimize=loss)
+        result.log('train_loss', loss, prog_bar=True, on_step=False, on_epoch=True)
+        result.log('max_acc', torch.tensor(float(step * split)), on_step=False, on_epoch=True,
+                   reduce_fx=torch.max, tbptt_reduce_fx=torch.max)
+        result.log('step_only', loss, on_step=True, on_epoch=False)
+        result.track_batch_size(step + 1)
+        results.append(result)
+    return results
+
+
+@pytest.mark.parametrize("num_splits", [1, 3])
+def test_epoch_result_accumulator(num_splits):
+    """Make sure the columnar accumulation reduces like gathering the results of every step"""
+    num_steps = 10
+
+    accumulator = EpochResultAccumulator(capacity=4)
+    for step in range(num_steps):
+        accumulator.append(_make_step_results(step, num_splits))
+    log_metrics, pbar_metrics = accumulator.reduce()
+
+    time_reduced = [Result.reduce_across_time(_make_step_results(step, num_splits)) for step in range(num_steps)]
+    expected = Result.reduce_on_epoch_end(time_reduced)
+
+    assert accumulator.num_steps == num_steps
+    assert set(log_metrics) == {'train_loss', 'max_acc'}
+    assert set(pbar_metrics) == {'train_loss'}
+    for key in log_metrics:
+        assert torch.allclose(log_metrics[key], expected.epoch_log_metrics[key])
+    assert torch.allclose(pbar_metrics['train_loss'], expected.epoch_pbar_metrics['train_loss'])
+
+
+def test_epoch_result_accumulator_mixed_shapes():
+    """Make sure values which do not fit the column of their key are still reduced"""
+    accumulator = EpochResultAccumulator()
+    for step in range(3):
+        result = TrainResult()
+        result.log('value', torch.ones(step + 1), on_step=False, on_epoch=True,
+                   reduce_fx=torch.sum, tbptt_reduce_fx=lambda x: x)
+        result.track_batch_size(1)
+        accumulator.append([result])
+
+    log_metrics, _ = accumulator.reduce()
+    assert log_metrics['value'] == 6
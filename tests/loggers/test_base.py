@@ -1,11 +1,16 @@
 import pickle
+import threading
+import time
 from typing import Optional
 from unittest.mock import MagicMock
 
 import numpy as np
+import pytest
+import torch
 
 from pytorch_lightning import Trainer
 from pytorch_lightning.loggers import LightningLoggerBase, LoggerCollection
+from pytorch_lightning.loggers.dispatcher import AsyncLoggerDispatcher, PackedMetrics
 from pytorch_lightning.utilities import rank_zero_only
 from tests.base import EvalModelTemplate
 
@@ -140,6 +145,167 @@ def test_multiple_loggers_pickle(tmpdir):
     assert logger2.metrics_logged != {}
 
 
+@pytest.mark.parametrize('async_logging', [False, True])
+def test_logged_calls_not_aggregated(tmpdir, async_logging):
+    """Verify that metrics logged in separate calls at the same step reach the logger separately."""
+
+    class HistoryLogger(CustomLogger):
+        def __init__(self):
+            super().__init__()
+            self.history = []
+
+        @rank_zero_only
+        def log_metrics(self, metrics, step):
+            self.history.append((step, metrics))
+
+    logger = HistoryLogger()
+    trainer = Trainer(default_root_dir=tmpdir, logger=logger, async_logging=async_logging)
+    trainer.logger_connector.log_metrics({'a': 1.}, {}, step=0)
+    trainer.logger_connector.log_metrics({'a': 3.}, {}, step=0)
+    if async_logging:
+        trainer.logger_dispatcher.close()
+    assert logger.history == [(0, {'a': 1.}), (0, {'a': 3.})]
+
+
+def test_async_logging(tmpdir):
+    """Verify that metrics reach all loggers on background threads and are flushed before training ends."""
+
+    class ThreadLogger(CustomLogger):
+        def __init__(self, delay=0.0):
+            super().__init__()
+            self.delay = delay
+            self.history = []
+            self.threads = set()
+
+        @rank_zero_only
+        def log_metrics(self, metrics, step):
+            time.sleep(self.delay)
+            self.threads.add(threading.current_thread())
+            self.history.append((step, metrics))
+
+        @rank_zero_only
+        def finalize(self, status):
+            self.threads.add(threading.current_thread())
+            self.finalized_status = (status, len(self.history))
+
+    model = EvalModelTemplate()
+    fast_logger = ThreadLogger()
+    slow_logger = ThreadLogger(delay=0.01)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=10,
+        limit_val_batches=2,
+        row_log_interval=1,
+        logger=[fast_logger, slow_logger],
+        async_logging=True,
+    )
+    result = trainer.fit(model)
+    assert result == 1
+
+    assert trainer.logger_dispatcher.pending == 0
+    for logger in (fast_logger, slow_logger):
+        assert threading.main_thread() not in logger.threads
+        assert logger.finalized_status == ('success', len(logger.history))
+        assert all(isinstance(v, (int, float)) for _, metrics in logger.history for v in metrics.values())
+    assert fast_logger.history == slow_logger.history
+    assert not any(isinstance(v, torch.Tensor) for v in trainer.logged_metrics.values())
+
+
+def test_async_logger_dispatcher_backpressure():
+    """Verify that the dispatcher blocks once a logger has `max_pending` calls queued."""
+    release = threading.Event()
+
+    class BlockingLogger(CustomLogger):
+        @rank_zero_only
+        def log_metrics(self, metrics, step):
+            release.wait(10)
+            self.metrics_logged = metrics
+
+    logger = BlockingLogger()
+    dispatcher = AsyncLoggerDispatcher(max_pending=2)
+    dispatcher.log_metrics(logger, PackedMetrics({'a': torch.tensor(1.)}), step=0)
+    dispatcher.log_metrics(logger, PackedMetrics({'a': torch.tensor(2.)}), step=1)
+    assert dispatcher.pending == 2
+
+    blocked = threading.Thread(
+        target=dispatcher.log_metrics, args=(logger, PackedMetrics({'a': torch.tensor(3)}), 2)
+    )
+    blocked.start()
+    blocked.join(timeout=0.1)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join()
+    dispatcher.close()
+    # every call is saved, so the last step reached the logger
+    assert logger.metrics_logged == {'a': 3}
+
+
+def test_async_logger_dispatcher_raises_on_next_call():
+    """Verify that a failed logger call is raised by the next call to the dispatcher."""
+
+    class FailingLogger(CustomLogger):
+        @rank_zero_only
+        def log_metrics(self, metrics, step):
+            raise RuntimeError('logger failed')
+
+    logger = FailingLogger()
+    dispatcher = AsyncLoggerDispatcher()
+    dispatcher.log_metrics(logger, PackedMetrics({'a': torch.tensor(1.)}), step=0)
+    while dispatcher.pending:
+        time.sleep(0.01)
+
+    with pytest.raises(RuntimeError, match='logger failed'):
+        dispatcher.save(logger)
+    # the error is raised once
+    dispatcher.close()
+
+
+def _dispatcher_threads():
+    return [t for t in threading.enumerate() if t.name.startswith('logger_dispatcher')]
+
+
+def test_async_logging_test_and_failing_fit(tmpdir):
+    """Verify that trainer.test and a failing fit wait for the loggers and stop their threads."""
+
+    class SlowLogger(CustomLogger):
+        def __init__(self):
+            super().__init__()
+            self.num_calls = 0
+
+        @rank_zero_only
+        def log_metrics(self, metrics, step):
+            time.sleep(0.01)
+            self.num_calls += 1
+
+    model = EvalModelTemplate()
+    logger = SlowLogger()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=2,
+        limit_test_batches=2,
+        logger=logger,
+        async_logging=True,
+    )
+    trainer.test(model)
+    assert trainer.logger_dispatcher.pending == 0
+    assert logger.num_calls > 0
+    assert not _dispatcher_threads()
+
+    class FailingModel(EvalModelTemplate):
+        def training_step(self, batch, batch_idx, optimizer_idx=None):
+            self.logger.agg_and_log_metrics({'a': 1.}, step=batch_idx)
+            raise ValueError('training failed')
+
+    with pytest.raises(ValueError, match='training failed'):
+        trainer.fit(FailingModel())
+    assert trainer.logger_dispatcher.pending == 0
+    assert not _dispatcher_threads()
+
+
 def test_adding_step_key(tmpdir):
     logged_step = 0
 
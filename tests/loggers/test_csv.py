@@ -1,3 +1,4 @@
+import csv
 from argparse import Namespace
 
 import pytest
@@ -95,3 +96,62 @@ def test_file_logger_log_hyperparams(tmpdir):
     path_yaml = os.path.join(logger.log_dir, ExperimentWriter.NAME_HPARAMS_FILE)
     params = load_hparams_from_yaml(path_yaml)
     assert all([n in params for n in hparams])
+
+
+def test_file_logger_streaming_append(tmpdir):
+    """Verify that saving only appends new rows and rewrites the header when new metrics show up"""
+    logger = CSVLogger(tmpdir, flush_logs_every_n_steps=1)
+    path_csv = os.path.join(logger.log_dir, ExperimentWriter.NAME_METRICS_FILE)
+
+    logger.log_metrics({'a': 1.0}, step=0)
+    logger.save()
+    logger.log_metrics({'a': 2.0}, step=1)
+    logger.save()
+    # nothing is kept in memory once written
+    assert logger.experiment.metrics == []
+    with open(path_csv, 'r') as fp:
+        rows = list(csv.DictReader(fp))
+    assert [r['a'] for r in rows] == ['1.0', '2.0']
+
+    # a new column extends the header of the rows already written
+    logger.log_metrics({'a': 3.0, 'b': 4.0}, step=2)
+    logger.save()
+    with open(path_csv, 'r') as fp:
+        rows = list(csv.DictReader(fp))
+    assert len(rows) == 3
+    assert [r['b'] for r in rows] == ['', '', '4.0']
+    assert [r['step'] for r in rows] == ['0', '1', '2']
+
+    # rows logged after the file was closed are appended
+    logger.finalize('success')
+    logger.log_metrics({'b': 5.0}, step=3)
+    logger.finalize('success')
+    with open(path_csv, 'r') as fp:
+        rows = list(csv.DictReader(fp))
+    assert [r['b'] for r in rows] == ['', '', '4.0', '5.0']
+
+
+def test_file_logger_flush_interval(tmpdir):
+    """Verify that rows are written to disk once the flush interval passed and when the logger is finalized"""
+    logger = CSVLogger(tmpdir, flush_logs_every_n_steps=3)
+    path_csv = os.path.join(logger.log_dir, ExperimentWriter.NAME_METRICS_FILE)
+
+    def written_steps():
+        with open(path_csv, 'r') as fp:
+            return [r['step'] for r in csv.DictReader(fp)]
+
+    for step in range(6):
+        logger.log_metrics({'a': float(step)}, step=step)
+        logger.save()
+        if step == 0:
+            # the first rows are written right away
+            assert written_steps() == ['0']
+        if step == 2:
+            assert written_steps() == ['0']
+            assert len(logger.experiment.metrics) == 2
+    assert written_steps() == ['0', '1', '2', '3']
+    assert [m['step'] for m in logger.experiment.metrics] == [4, 5]
+
+    logger.finalize('success')
+    assert written_steps() == ['0', '1', '2', '3', '4', '5']
+    assert logger.experiment.metrics == []
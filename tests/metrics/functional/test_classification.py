@@ -8,7 +8,10 @@ from sklearn.metrics import (
     recall_score as sk_recall,
     f1_score as sk_f1_score,
     fbeta_score as sk_fbeta_score,
+    hamming_loss as sk_hamming_loss,
     confusion_matrix as sk_confusion_matrix,
+    multilabel_confusion_matrix as sk_multilabel_confusion_matrix,
+    roc_auc_score as sk_roc_auc_score,
 )
 
 from pytorch_lightning import seed_everything
@@ -19,6 +22,7 @@ from pytorch_lightning.metrics.functional.classification import (
     stat_scores,
     stat_scores_multiple_classes,
     accuracy,
+    classification_scores,
     confusion_matrix,
     precision,
     recall,
@@ -28,10 +32,14 @@ from pytorch_lightning.metrics.functional.classification import (
     dice_score,
     average_precision,
     auroc,
+    multiclass_auroc,
+    multiclass_precision_recall_curve,
+    multiclass_roc,
     precision_recall_curve,
     roc,
     auc,
     iou,
+    _confusion_matrix_update,
 )
 
 
@@ -291,6 +299,50 @@ def test_auroc(pred, target, expected):
     assert score == expected
 
 
+@pytest.mark.parametrize('sample_weight', [None, 'random'])
+@pytest.mark.parametrize('ties', [False, True])
+def test_multiclass_curves_against_per_class(sample_weight, ties):
+    """The curves of all classes computed at once equal the curves computed for each class."""
+    seed_everything(0)
+    num_classes = 5
+    pred = torch.rand(100, num_classes)
+    if ties:
+        pred = torch.round(pred * 4) / 4
+    target = torch.randint(num_classes, (100,))
+    target[:num_classes] = torch.arange(num_classes)
+    if sample_weight == 'random':
+        sample_weight = torch.rand(100)
+
+    for multiclass_curve, binary_curve in [(multiclass_roc, roc),
+                                           (multiclass_precision_recall_curve, precision_recall_curve)]:
+        curves = multiclass_curve(pred, target, sample_weight=sample_weight, num_classes=num_classes)
+        assert len(curves) == num_classes
+        for c, curve in enumerate(curves):
+            expected = binary_curve(pred[:, c], target, sample_weight=sample_weight, pos_label=c)
+            for value, expected_value in zip(curve, expected):
+                assert value.shape == expected_value.shape
+                assert torch.allclose(value, expected_value)
+
+
+@pytest.mark.parametrize('average', ['macro', 'weighted', 'micro'])
+@pytest.mark.parametrize('sample_weight', [None, 'random'])
+def test_multiclass_auroc_against_sklearn(average, sample_weight):
+    seed_everything(0)
+    num_classes = 5
+    pred = torch.round(torch.rand(200, num_classes) * 10) / 10
+    target = torch.randint(num_classes, (200,))
+    if sample_weight == 'random':
+        sample_weight = torch.rand(200)
+
+    sk_score = sk_roc_auc_score(to_onehot(target, num_classes).numpy(), pred.numpy(), average=average,
+                                sample_weight=None if sample_weight is None else sample_weight.numpy())
+    pl_score = multiclass_auroc(pred, target, sample_weight=sample_weight, num_classes=num_classes, average=average)
+    assert torch.allclose(pl_score, torch.tensor(sk_score, dtype=torch.float))
+
+    class_scores = multiclass_auroc(pred, target, sample_weight=sample_weight, num_classes=num_classes, average='none')
+    assert class_scores.shape == (num_classes,)
+
+
 @pytest.mark.parametrize(['x', 'y', 'expected'], [
     pytest.param([0, 1], [0, 1], 0.5),
     pytest.param([1, 0], [0, 1], 0.5),
@@ -346,5 +398,66 @@ def test_iou(half_ones, reduction, remove_bg, expected):
     assert torch.allclose(iou_val, expected, atol=1e-9)
 
 
+@pytest.mark.parametrize('reduction', ['elementwise_mean', 'sum', 'none'])
+def test_classification_scores(reduction):
+    """ All scores derived from one confusion matrix equal the scores of the separate functions """
+    seed_everything(0)
+    num_classes = 6
+    pred = torch.rand(4, num_classes, 16, 16)
+    target = torch.randint(num_classes, (4, 16, 16))
+
+    scores = classification_scores(pred, target, num_classes=num_classes, beta=0.5, reduction=reduction)
+    labels = pred.argmax(1)
+    assert torch.allclose(scores['accuracy'], accuracy(labels, target, num_classes=num_classes, reduction=reduction))
+    assert torch.allclose(scores['precision'], precision(labels, target, num_classes=num_classes, reduction=reduction))
+    assert torch.allclose(scores['recall'], recall(labels, target, num_classes=num_classes, reduction=reduction))
+    assert torch.allclose(scores['fbeta'], fbeta_score(labels, target, beta=0.5, num_classes=num_classes,
+                                                       reduction=reduction))
+    assert torch.allclose(scores['iou'], iou(labels, target, num_classes=num_classes, reduction=reduction))
+    assert torch.allclose(scores['dice'], dice_score(pred, target, bg=True, reduction=reduction))
+
+
+def test_classification_scores_ignore_index():
+    pred = torch.tensor([0, 1, 2, 2, 1])
+    target = torch.tensor([0, 1, 2, 255, 255])
+
+    scores = classification_scores(pred, target, num_classes=3, ignore_index=255)
+    assert scores['accuracy'] == 1
+    assert torch.equal(confusion_matrix(pred, target, num_classes=3, ignore_index=255), torch.eye(3))
+
+
+def test_confusion_matrix_multilabel():
+    seed_everything(0)
+    pred = torch.rand(50, 4)
+    target = torch.randint(2, (50, 4))
+
+    confmat = _confusion_matrix_update(pred, target, num_classes=4, multilabel=True)
+    expected = sk_multilabel_confusion_matrix(target.numpy(), (pred >= 0.5).long().numpy())
+    assert torch.equal(confmat, torch.tensor(expected))
+
+    scores = classification_scores(pred, target, multilabel=True, reduction='none')
+    assert torch.allclose(scores['precision'], torch.tensor(sk_precision(target.numpy(), (pred >= 0.5).numpy(),
+                                                                         average=None), dtype=torch.float))
+    per_label_accuracy = [sk_accuracy(target[:, i].numpy(), (pred[:, i] >= 0.5).numpy()) for i in range(4)]
+    assert torch.allclose(scores['accuracy'], torch.tensor(per_label_accuracy, dtype=torch.float))
+
+    scores = classification_scores(pred, target, multilabel=True)
+    expected = 1 - sk_hamming_loss(target.numpy(), (pred >= 0.5).long().numpy())
+    assert torch.allclose(scores['accuracy'], torch.tensor(expected, dtype=torch.float))
+
+
+def test_dice_score_per_class():
+    """ The vectorized dice score equals the score computed class by class """
+    seed_everything(0)
+    pred = torch.rand(8, 5, 10, 10)
+    target = torch.randint(4, (8, 10, 10))
+
+    expected = []
+    for i in range(1, 5):
+        tp, fp, tn, fn, sup = stat_scores(pred, target, class_index=i)
+        expected.append(2 * tp.float() / (2 * tp + fp + fn) if sup > 0 else torch.tensor(0.))
+    assert torch.allclose(dice_score(pred, target, reduction='none'), torch.stack(expected))
+
+
 # example data taken from
 # https://github.com/scikit-learn/scikit-learn/blob/master/sklearn/metrics/tests/test_ranking.py
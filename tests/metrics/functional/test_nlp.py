@@ -2,7 +2,8 @@ import pytest
 import torch
 from nltk.translate.bleu_score import SmoothingFunction, corpus_bleu, sentence_bleu
 
-from pytorch_lightning.metrics.functional.nlp import bleu_score
+from pytorch_lightning.metrics.functional import nlp
+from pytorch_lightning.metrics.functional.nlp import _bleu_chunks, _bleu_score_update, _tokens_to_ids, bleu_score
 
 # example taken from
 # https://www.nltk.org/api/nltk.translate.html?highlight=bleu%20score#nltk.translate.bleu_score.sentence_bleu
@@ -64,3 +65,54 @@ def test_no_4_gram():
     hyps = [["My", "full", "pytorch-lightning"]]
     refs = [[["My", "full", "pytorch-lightning", "test"], ["Completely", "Different"]]]
     assert bleu_score(hyps, refs) == torch.tensor(0.0)
+
+
+def test_bleu_score_update_token_ids():
+    translate = torch.tensor([[0, 1, 0, 1, 2], [3, 3, 3, 0, 0]])
+    translate_lengths = torch.tensor([5, 3])
+    references = torch.tensor([[[0, 1, 2, 0, 0], [1, 0, 1, 0, 1]], [[3, 4, 0, 0, 0], [0, 0, 0, 0, 0]]])
+    reference_lengths = torch.tensor([[3, 5], [2, 0]])
+
+    numerator, denominator, trans_len, ref_len = _bleu_score_update(
+        translate, translate_lengths, references, reference_lengths, n_gram=2
+    )
+    # unigrams: 0 clipped to 2, 1 clipped to 2, 2 once and 3 clipped to 1, bigrams: (0, 1) twice, (1, 0) and (1, 2)
+    assert torch.equal(numerator, torch.tensor([6, 4]))
+    assert torch.equal(denominator, torch.tensor([8, 6]))
+    assert trans_len == 8
+    # the empty reference of the second sentence is skipped
+    assert ref_len == 7
+
+
+def test_bleu_score_nltk_corpus_random():
+    torch.manual_seed(0)
+    hypotheses, references = [], []
+    for _ in range(20):
+        hypotheses.append(torch.randint(5, (torch.randint(4, 15, ()).item(),)).tolist())
+        references.append([torch.randint(5, (torch.randint(4, 15, ()).item(),)).tolist() for _ in range(3)])
+
+    nltk_output = corpus_bleu(references, hypotheses)
+    pl_output = bleu_score(hypotheses, references)
+    assert torch.allclose(pl_output, torch.tensor(nltk_output))
+
+
+def test_bleu_score_chunks_long_sentence(monkeypatch):
+    """Make sure one long sentence does not pad the token tensors of all short ones"""
+    torch.manual_seed(0)
+    hypotheses = [torch.randint(5, (6,)).tolist() for _ in range(200)]
+    references = [[torch.randint(5, (6,)).tolist(), torch.randint(5, (7,)).tolist()] for _ in range(200)]
+    hypotheses.insert(100, torch.randint(5, (2000,)).tolist())
+    references.insert(100, [torch.randint(5, (2100,)).tolist()])
+
+    chunks = list(_bleu_chunks(hypotheses, references, max_numel=1000))
+    assert sorted(i for chunk in chunks for i in chunk) == list(range(201))
+    assert [100] in chunks
+    for chunk in chunks:
+        if chunk != [100]:
+            translate, _, refs, _ = _tokens_to_ids([hypotheses[i] for i in chunk], [references[i] for i in chunk])
+            assert translate.numel() + refs.numel() <= 1000
+
+    nltk_output = corpus_bleu(references, hypotheses)
+    assert torch.allclose(bleu_score(hypotheses, references), torch.tensor(nltk_output))
+    monkeypatch.setattr(nlp, '_BLEU_CHUNK_NUMEL', 1000)
+    assert torch.allclose(bleu_score(hypotheses, references), torch.tensor(nltk_output))
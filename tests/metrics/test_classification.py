@@ -2,11 +2,26 @@
 #   The actual metric implementation is tested in functional/test_classification.py
 #   Especially reduction and reducing across processes won't be tested here!
 
+from functools import partial
+
 import pytest
 import torch
+from sklearn.metrics import (
+    average_precision_score as sk_average_precision,
+    balanced_accuracy_score as sk_balanced_accuracy,
+    cohen_kappa_score as sk_cohen_kappa,
+    dcg_score as sk_dcg,
+    hamming_loss as sk_hamming,
+    hinge_loss as sk_hinge,
+    roc_auc_score as sk_roc_auc,
+)
 
 from pytorch_lightning.metrics.classification import (
     Accuracy,
+    BinnedAUROC,
+    BinnedAveragePrecision,
+    BinnedPrecisionRecallCurve,
+    BinnedROC,
     ConfusionMatrix,
     PrecisionRecallCurve,
     Precision,
@@ -16,10 +31,32 @@ from pytorch_lightning.metrics.classification import (
     FBeta,
     F1,
     ROC,
+    MulticlassAUROC,
     MulticlassROC,
     MulticlassPrecisionRecallCurve,
     DiceCoefficient,
     IoU,
+    StatefulAccuracy,
+    StatefulBalancedAccuracy,
+    StatefulClassificationScores,
+    StatefulCohenKappaScore,
+    StatefulConfusionMatrix,
+    StatefulDCG,
+    StatefulF1,
+    StatefulFBeta,
+    StatefulHamming,
+    StatefulHinge,
+    StatefulPrecision,
+    StatefulRecall,
+)
+from pytorch_lightning.metrics.functional.classification import (
+    accuracy,
+    classification_scores,
+    confusion_matrix,
+    f1_score,
+    fbeta_score,
+    precision,
+    recall,
 )
 
 
@@ -108,6 +145,21 @@ def test_auroc(pos_label):
     assert isinstance(area, torch.Tensor)
 
 
+@pytest.mark.parametrize('average', ['macro', 'weighted', 'micro', 'none'])
+def test_multiclass_auroc(average):
+    multi_auroc = MulticlassAUROC(num_classes=3, average=average)
+    assert multi_auroc.name == 'multiclass_auroc'
+
+    pred = torch.tensor([[0.7, 0.2, 0.1],
+                         [0.2, 0.7, 0.1],
+                         [0.1, 0.2, 0.7],
+                         [0.3, 0.3, 0.4]])
+    target = torch.tensor([0, 1, 2, 0])
+    area = multi_auroc(pred=pred, target=target, sample_weight=[0.1, 0.2, 0.3, 0.4])
+    assert isinstance(area, torch.Tensor)
+    assert area.shape == ((3,) if average == 'none' else ())
+
+
 @pytest.mark.parametrize(['beta', 'num_classes'], [
     pytest.param(0., 1),
     pytest.param(0.5, 1),
@@ -220,3 +272,214 @@ def test_iou(remove_bg):
                 torch.randint(0, 1, (10, 25, 25)))
 
     assert isinstance(score, torch.Tensor)
+
+
+@pytest.mark.parametrize(['metric_class', 'metric_fn', 'metric_kwargs'], [
+    pytest.param(StatefulAccuracy, accuracy, {}),
+    pytest.param(StatefulPrecision, precision, {}),
+    pytest.param(StatefulRecall, recall, {}),
+    pytest.param(StatefulFBeta, fbeta_score, {'beta': 0.5}),
+    pytest.param(StatefulF1, f1_score, {}),
+])
+@pytest.mark.parametrize('reduction', ['elementwise_mean', 'sum', 'none'])
+def test_stateful_stat_scores_metrics(random, metric_class, metric_fn, metric_kwargs, reduction):
+    """ Test that accumulating over batches gives the same result as computing on all data at once """
+    num_classes = 5
+    preds = torch.randint(num_classes, (4, 32))
+    targets = torch.randint(num_classes, (4, 32))
+
+    metric = metric_class(num_classes=num_classes, reduction=reduction, **metric_kwargs)
+    for pred, target in zip(preds, targets):
+        batch_value = metric(pred, target)
+        expected = metric_fn(pred, target, num_classes=num_classes, reduction=reduction, **metric_kwargs)
+        assert torch.allclose(batch_value, expected, equal_nan=True)
+
+    expected = metric_fn(preds.flatten(), targets.flatten(), num_classes=num_classes,
+                         reduction=reduction, **metric_kwargs)
+    assert torch.allclose(metric.compute(), expected, equal_nan=True)
+
+    metric.reset()
+    assert metric.tps.sum() == 0
+    assert metric.sups.shape == (num_classes,)
+
+
+def test_stateful_accuracy_probabilities(random):
+    probs = torch.rand(16, 3)
+    target = torch.randint(3, (16,))
+
+    metric = StatefulAccuracy(num_classes=3)
+    assert metric.name == 'accuracy'
+    assert torch.allclose(metric(probs, target), accuracy(probs.argmax(1), target, num_classes=3))
+
+
+def test_stateful_confusion_matrix(random):
+    num_classes = 4
+    preds = torch.randint(num_classes, (3, 20))
+    targets = torch.randint(num_classes, (3, 20))
+
+    metric = StatefulConfusionMatrix(num_classes=num_classes)
+    assert metric.name == 'confusion_matrix'
+    for pred, target in zip(preds, targets):
+        metric(pred, target)
+
+    cm = metric.compute()
+    assert torch.equal(cm, confusion_matrix(preds.flatten(), targets.flatten(), num_classes=num_classes))
+
+    metric.normalize = True
+    assert torch.allclose(metric.compute().sum(-1), torch.ones(num_classes))
+
+
+@pytest.mark.parametrize('multilabel', [False, True])
+def test_stateful_classification_scores(random, multilabel):
+    num_classes = 4
+    if multilabel:
+        preds = torch.rand(3, 20, num_classes)
+        targets = torch.randint(2, (3, 20, num_classes))
+    else:
+        preds = torch.randint(num_classes, (3, 20))
+        targets = torch.randint(num_classes, (3, 20))
+
+    metric = StatefulClassificationScores(num_classes=num_classes, multilabel=multilabel)
+    assert metric.name == 'classification_scores'
+    for pred, target in zip(preds, targets):
+        metric(pred, target)
+
+    expected = classification_scores(preds.flatten(0, 1), targets.flatten(0, 1), num_classes=num_classes,
+                                     multilabel=multilabel)
+    scores = metric.compute()
+    assert scores.keys() == expected.keys()
+    for name, score in scores.items():
+        assert torch.allclose(score, expected[name]), name
+
+
+@pytest.mark.parametrize(['metric_class', 'sk_fn'], [
+    pytest.param(BinnedAUROC, sk_roc_auc),
+    pytest.param(BinnedAveragePrecision, sk_average_precision),
+])
+@pytest.mark.parametrize('weighted', [False, True])
+def test_binned_scores_exact_on_thresholds(random, metric_class, sk_fn, weighted):
+    """ Binned scores are exact when all predictions fall on a threshold """
+    thresholds = torch.arange(11) / 10
+    preds = thresholds[torch.randint(11, (4, 50))]
+    targets = torch.randint(2, (4, 50))
+    weights = torch.rand(4, 50) if weighted else [None] * 4
+
+    metric = metric_class(thresholds=thresholds)
+    for pred, target, weight in zip(preds, targets, weights):
+        metric(pred, target, sample_weight=weight)
+
+    expected = sk_fn(targets.flatten().numpy(), preds.flatten().numpy(),
+                     sample_weight=weights.flatten().numpy() if weighted else None)
+    assert torch.allclose(metric.compute(), torch.tensor(expected, dtype=torch.float))
+
+
+def test_binned_curves(random):
+    pred = torch.rand(100)
+    target = torch.randint(2, (100,))
+
+    roc = BinnedROC(thresholds=20)
+    assert roc.name == 'roc'
+    assert roc(pred, target) is None
+    fpr, tpr, thresholds = roc.compute()
+    assert fpr.shape == tpr.shape == thresholds.shape == (21,)
+    assert fpr[0] == tpr[0] == 0 and fpr[-1] == tpr[-1] == 1
+    assert torch.all(thresholds[1:] < thresholds[:-1])
+
+    pr_curve = BinnedPrecisionRecallCurve(thresholds=20)
+    assert pr_curve.name == 'precision_recall_curve'
+    pr_curve(pred, target)
+    precision, recall, thresholds = pr_curve.compute()
+    assert precision.shape == recall.shape == (21,)
+    assert thresholds.shape == (20,)
+    assert precision[-1] == 1 and recall[-1] == 0
+
+    # the counts at each threshold sum up to the number of samples
+    tps, fps, tns, fns = pr_curve._stat_scores()
+    assert torch.all(tps + fps + tns + fns == 100)
+    assert tps[0] == target.sum() and fps[0] == (1 - target).sum()
+
+    pr_curve.reset()
+    assert pr_curve.positives.sum() == 0
+    assert pr_curve.positives.shape == (21,)
+
+
+def test_binned_auroc_single_class_batch(random):
+    """ A batch holding only one class does not raise nor drop the accumulated histograms """
+    preds = torch.rand(3, 20)
+    targets = torch.randint(2, (3, 20))
+    targets[1] = 1
+
+    metric = BinnedAUROC(thresholds=20)
+    for pred, target in zip(preds, targets):
+        assert metric(pred, target) is None
+    expected = BinnedAUROC(thresholds=20)
+    expected.update(preds.flatten(), targets.flatten())
+    assert torch.allclose(metric.compute(), expected.compute())
+
+    # computing the single class batch on its own is still an error, but keeps the states
+    metric = BinnedAUROC(thresholds=20, compute_on_step=True)
+    metric(preds[0], targets[0])
+    with pytest.raises(ValueError):
+        metric(preds[1], targets[1])
+    metric(preds[2], targets[2])
+    assert metric.positives.sum() + metric.negatives.sum() == 40
+
+
+@pytest.mark.parametrize('thresholds', [1, [0.5], [0.5, 0.2], [0.1, 0.1, 0.5]])
+def test_binned_invalid_thresholds(thresholds):
+    with pytest.raises(ValueError):
+        BinnedROC(thresholds=thresholds)
+
+
+@pytest.mark.parametrize(['metric', 'sk_fn'], [
+    pytest.param(StatefulBalancedAccuracy(num_classes=5), sk_balanced_accuracy),
+    pytest.param(StatefulBalancedAccuracy(num_classes=5, adjusted=True), partial(sk_balanced_accuracy, adjusted=True)),
+    pytest.param(StatefulCohenKappaScore(num_classes=5), sk_cohen_kappa),
+    pytest.param(StatefulCohenKappaScore(num_classes=5, weights='linear'), partial(sk_cohen_kappa, weights='linear')),
+    pytest.param(StatefulCohenKappaScore(num_classes=5, weights='quadratic'),
+                 partial(sk_cohen_kappa, weights='quadratic')),
+    pytest.param(StatefulHamming(), sk_hamming),
+])
+def test_stateful_label_metrics_against_sklearn(random, metric, sk_fn):
+    """ Test that the scores accumulated over batches equal the sklearn score of all data """
+    preds = torch.randint(5, (4, 50))
+    targets = torch.randint(5, (4, 50))
+    for pred, target in zip(preds, targets):
+        metric(pred, target)
+
+    expected = sk_fn(targets.flatten().numpy(), preds.flatten().numpy())
+    assert torch.allclose(metric.compute(), torch.tensor(expected, dtype=torch.float))
+
+
+@pytest.mark.parametrize('multiclass', [False, True])
+def test_stateful_hinge(random, multiclass):
+    if multiclass:
+        decisions = torch.randn(4, 50, 5)
+        targets = torch.randint(5, (4, 50))
+    else:
+        decisions = torch.randn(4, 50)
+        targets = torch.randint(2, (4, 50))
+
+    metric = StatefulHinge()
+    for decision, target in zip(decisions, targets):
+        metric(decision, target)
+
+    expected = sk_hinge(targets.flatten().numpy(), decisions.flatten(0, 1).numpy(),
+                        labels=list(range(5)) if multiclass else None)
+    assert torch.allclose(metric.compute(), torch.tensor(expected, dtype=torch.float))
+
+
+@pytest.mark.parametrize('k', [None, 3])
+@pytest.mark.parametrize('ignore_ties', [False, True])
+def test_stateful_dcg(random, k, ignore_ties):
+    # without ties the order of tied scores would be arbitrary
+    scores = torch.rand(4, 10, 7) if ignore_ties else torch.randint(4, (4, 10, 7)).float()
+    relevance = torch.randint(5, (4, 10, 7))
+
+    metric = StatefulDCG(k=k, ignore_ties=ignore_ties)
+    assert metric.name == 'dcg_score'
+    for score, rel in zip(scores, relevance):
+        metric(score, rel)
+
+    expected = sk_dcg(relevance.flatten(0, 1).numpy(), scores.flatten(0, 1).numpy(), k=k, ignore_ties=ignore_ties)
+    assert torch.allclose(metric.compute(), torch.tensor(expected, dtype=torch.float))
@@ -15,6 +15,9 @@ from pytorch_lightning.metrics.converters import (
     _numpy_metric_conversion,
     _tensor_metric_conversion,
     sync_ddp_if_available,
+    sync_ddp_states_if_available,
+    sync_collection_if_available,
+    DDPSyncCoordinator,
     gather_all_tensors_if_available,
     tensor_metric,
     numpy_metric
@@ -186,6 +189,74 @@ def test_gather_all_tensors_ddp():
     mp.spawn(_ddp_test_gather_all_tensors, args=(worldsize, ), nprocs=worldsize)
 
 
+def _ddp_test_sync_coordinator(rank, worldsize):
+    _setup_ddp(rank, worldsize)
+
+    coordinator = DDPSyncCoordinator()
+    summed = coordinator.enqueue(torch.tensor([1., 2.]))
+    averaged = coordinator.enqueue(torch.tensor(float(rank)), reduce_op='mean')
+    counted = coordinator.enqueue(torch.tensor([rank]), reduce_op='sum')
+    number = coordinator.enqueue(1, reduce_op='max')
+    assert not summed.done
+
+    coordinator.flush()
+    assert torch.equal(summed.wait(), torch.tensor([1., 2.]) * worldsize)
+    assert averaged.done
+    assert averaged.wait().item() == sum(range(worldsize)) / worldsize
+    assert torch.equal(counted.wait(), torch.tensor([sum(range(worldsize))]))
+    assert number.wait().item() == 1.
+
+    collection = sync_collection_if_available({'a': torch.tensor([1.]), 'b': [torch.tensor([2])]})
+    assert torch.equal(collection['a'], torch.tensor([1.]) * worldsize)
+    assert torch.equal(collection['b'][0], torch.tensor([2]) * worldsize)
+
+
+@pytest.mark.skipif(sys.platform == "win32" , reason="DDP not available on windows")
+def test_sync_coordinator_ddp():
+    """Make sure queued tensors are reduced in buckets with DDP"""
+    tutils.reset_seed()
+    tutils.set_random_master_port()
+
+    worldsize = 2
+    mp.spawn(_ddp_test_sync_coordinator, args=(worldsize, ), nprocs=worldsize)
+
+
+def _ddp_test_sync_states(rank, worldsize):
+    _setup_ddp(rank, worldsize)
+
+    states = {
+        'count': torch.tensor([rank, 1]),
+        'total': torch.tensor([float(rank)]),
+        'maximum': torch.tensor(float(rank)),
+        'other_total': torch.ones(2, 2),
+    }
+    reductions = {'count': 'sum', 'total': 'sum', 'maximum': 'max', 'other_total': 'sum'}
+    synced = sync_ddp_states_if_available(states, reductions)
+
+    assert list(synced) == list(states)
+    assert torch.equal(synced['count'], torch.tensor([sum(range(worldsize)), worldsize]))
+    assert torch.equal(synced['total'], torch.tensor([float(sum(range(worldsize)))]))
+    assert torch.equal(synced['maximum'], torch.tensor(float(worldsize - 1)))
+    assert torch.equal(synced['other_total'], torch.full((2, 2), float(worldsize)))
+
+
+@pytest.mark.skipif(sys.platform == "win32" , reason="DDP not available on windows")
+def test_sync_states_ddp():
+    """Make sure bucketed state syncing works with DDP"""
+    tutils.reset_seed()
+    tutils.set_random_master_port()
+
+    worldsize = 2
+    mp.spawn(_ddp_test_sync_states, args=(worldsize, ), nprocs=worldsize)
+
+
+def test_sync_states_simple():
+    """Make sure bucketed state syncing is a no-op without DDP"""
+    states = {'total': torch.tensor([1.])}
+    synced = sync_ddp_states_if_available(states, {'total': 'sum'})
+    assert torch.equal(synced['total'], states['total'])
+
+
 def _test_tensor_metric(is_ddp: bool):
     @tensor_metric()
     def tensor_test_metric(*args, **kwargs):
@@ -1,11 +1,17 @@
 import os
+import sys
+
 import numpy as np
 import pytest
 import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
 
 import tests.base.develop_utils as tutils
 from tests.base import EvalModelTemplate
-from pytorch_lightning.metrics.metric import Metric, TensorMetric, NumpyMetric, TensorCollectionMetric
+from pytorch_lightning.metrics.metric import (
+    Metric, TensorMetric, NumpyMetric, TensorCollectionMetric, StatefulMetric
+)
 from pytorch_lightning import Trainer
 
 
@@ -39,6 +45,23 @@ class DummyTensorCollectionMetric(TensorCollectionMetric):
         return 1., 2., 3., 4.
 
 
+class DummyStatefulMetric(StatefulMetric):
+    def __init__(self, compute_on_step=True):
+        super().__init__('dummy', compute_on_step=compute_on_step)
+        self.add_state('total', torch.tensor(0.))
+        self.add_state('count', torch.tensor(0))
+        self.add_state('maximum', torch.tensor(float('-inf')), reduce_op='max')
+
+    def update(self, x):
+        assert isinstance(x, torch.Tensor)
+        self.total += x.sum()
+        self.count += x.numel()
+        self.maximum = torch.max(self.maximum, x.max())
+
+    def compute(self):
+        return self.total / self.count, self.maximum
+
+
 @pytest.mark.parametrize('metric', [DummyTensorCollectionMetric()])
 def test_collection_metric(metric: Metric):
     """ Test that metric.device, metric.dtype works for metric collection """
@@ -186,3 +209,119 @@ def test_saving_pickable(tmpdir, metric: Metric):
 
     # Check metric value is the same
     assert results_before_save == results_after_load
+
+
+def test_stateful_metric():
+    """ Test that stateful metrics accumulate across batches and can be reset """
+    metric = DummyStatefulMetric()
+
+    mean, maximum = metric(torch.tensor([1., 2., 3.]))
+    assert mean == 2. and maximum == 3.
+    # the value returned by forward only depends on the current batch
+    mean, maximum = metric(np.array([0., 1.]))
+    assert mean == 0.5 and maximum == 1.
+
+    mean, maximum = metric.compute()
+    assert mean == 7. / 5 and maximum == 3.
+    assert metric.count.dtype == torch.long
+
+    # states are part of the state dict, so they are checkpointed
+    assert set(metric.state_dict()) == {'total', 'count', 'maximum'}
+
+    # sync is a no-op outside of DDP
+    metric.sync()
+    assert metric.compute()[0] == 7. / 5
+
+    metric.reset()
+    assert metric.total == 0. and metric.count == 0 and metric.maximum == float('-inf')
+
+    metric = DummyStatefulMetric(compute_on_step=False)
+    assert metric(torch.tensor([1., 2., 3.])) is None
+    assert metric.compute()[0] == 2.
+
+
+def test_stateful_metric_failing_batch():
+    """ Test that a batch raising in forward does not wipe the accumulated states """
+    metric = DummyStatefulMetric()
+    metric(torch.tensor([1., 2., 3.]))
+
+    # the update fails after it changed the batch states
+    with pytest.raises(RuntimeError):
+        metric(torch.tensor([]))
+    assert metric.total == 6. and metric.count == 3 and metric.maximum == 3.
+
+    metric(torch.tensor([4.]))
+    mean, maximum = metric.compute()
+    assert mean == 2.5 and maximum == 4.
+
+
+def test_stateful_metric_sync_keeps_local_states():
+    """ Test that syncing does not replace the local states, so later batches are added to them """
+    metric = DummyStatefulMetric()
+    metric(torch.tensor([1., 2.]))
+    metric.sync()
+    assert metric.compute()[0] == 1.5
+
+    # a direct update drops the synced states, the next sync reduces the new local ones
+    metric.update(torch.tensor([6.]))
+    metric.sync()
+    assert metric.compute()[0] == 3.
+    assert metric.total == 9. and metric.count == 3
+
+
+def _ddp_test_stateful_metric_sync(rank, worldsize, compute_on_step):
+    os.environ['MASTER_ADDR'] = 'localhost'
+    dist.init_process_group('gloo', rank=rank, world_size=worldsize)
+
+    metric = DummyStatefulMetric(compute_on_step=compute_on_step)
+    metric(torch.tensor([float(rank + 1)]))
+    metric.sync()
+    # rank 0 saw [1.], rank 1 saw [2.]
+    assert metric.compute() == (1.5, 2.)
+    assert metric.total == rank + 1 and metric.count == 1
+
+    metric(torch.tensor([10. * (rank + 1)]))
+    metric.sync()
+    # rank 0 saw [1., 10.], rank 1 saw [2., 20.]
+    assert metric.compute() == (33. / 4, 20.)
+    assert metric.total == 11. * (rank + 1) and metric.count == 2
+    # computing again without another update uses the same synced states
+    metric.sync()
+    assert metric.compute() == (33. / 4, 20.)
+
+    # the local states are what is checkpointed
+    assert metric.state_dict()['count'] == 2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+@pytest.mark.parametrize('compute_on_step', [True, False])
+def test_stateful_metric_sync_ddp(compute_on_step):
+    """ Test that interleaving updates and syncs counts every batch exactly once across processes """
+    tutils.reset_seed()
+    tutils.set_random_master_port()
+
+    worldsize = 2
+    mp.spawn(_ddp_test_stateful_metric_sync, args=(worldsize, compute_on_step), nprocs=worldsize)
+
+
+def test_stateful_metric_device_dtype():
+    """ Test that states are moved and casted together with the metric """
+    metric = DummyStatefulMetric()
+    metric.double()
+    assert metric.total.dtype == torch.float64
+    assert metric.count.dtype == torch.long
+
+    metric(torch.tensor([1., 2.]))
+    metric.reset()
+    assert metric.total.dtype == torch.float64
+
+    if torch.cuda.is_available():
+        metric.cuda(0)
+        metric(torch.tensor([1., 2.]))
+        assert metric.total.device == torch.device('cuda', index=0)
+
+
+def test_stateful_metric_invalid_reduction():
+    metric = DummyStatefulMetric()
+    with pytest.raises(ValueError):
+        metric.add_state('other', torch.tensor(0.), reduce_op='mean')
@@ -1,7 +1,7 @@
 import pytest
 import torch
 
-from pytorch_lightning.metrics.nlp import BLEUScore
+from pytorch_lightning.metrics.nlp import BLEUScore, StatefulBLEUScore
 
 # example taken from
 # https://www.nltk.org/api/nltk.translate.html?highlight=bleu%20score#nltk.translate.bleu_score.corpus_bleu
@@ -27,3 +27,28 @@ def test_bleu(smooth, n_gram):
 
     pl_output = bleu(HYPOTHESES, LIST_OF_REFERENCES)
     assert isinstance(pl_output, torch.Tensor)
+
+
+def test_stateful_bleu():
+    vocab = {}
+    max_len = max(len(s) for s in HYPOTHESES + [r for refs in LIST_OF_REFERENCES for r in refs])
+
+    def to_ids(sentence):
+        return [vocab.setdefault(token, len(vocab)) for token in sentence]
+
+    def pad(ids):
+        return ids + [-1] * (max_len - len(ids))
+
+    translate = torch.tensor([pad(to_ids(hyp)) for hyp in HYPOTHESES])
+    references = torch.tensor([[pad(to_ids(r)) for r in refs] + [pad([])] * (3 - len(refs))
+                               for refs in LIST_OF_REFERENCES])
+
+    expected = BLEUScore()(HYPOTHESES, LIST_OF_REFERENCES)
+
+    metric = StatefulBLEUScore(pad_index=-1)
+    for i in range(len(HYPOTHESES)):
+        metric.update(translate[i:i + 1], references[i:i + 1])
+    assert torch.allclose(metric.compute(), expected)
+
+    metric.reset()
+    assert torch.allclose(metric(translate, references), expected)
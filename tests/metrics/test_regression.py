@@ -2,10 +2,23 @@
 #   The actual metric implementation is tested in functional/test_regression.py
 #   Especially reduction and reducing across processes won't be tested here!
 
+import pytest
 import torch
+from sklearn.metrics import (
+    explained_variance_score as sk_explained_variance,
+    mean_gamma_deviance as sk_mean_gamma_deviance,
+    mean_poisson_deviance as sk_mean_poisson_deviance,
+    mean_squared_log_error as sk_mean_squared_log_error,
+    median_absolute_error as sk_median_absolute_error,
+    r2_score as sk_r2_score,
+)
 
+from pytorch_lightning.metrics.functional.regression import mae, mse, psnr, rmse, rmsle
 from pytorch_lightning.metrics.regression import (
-    MAE, MSE, RMSE, RMSLE, PSNR, SSIM
+    MAE, MSE, RMSE, RMSLE, PSNR, SSIM,
+    StatefulExplainedVariance, StatefulMAE, StatefulMeanGammaDeviance, StatefulMeanPoissonDeviance,
+    StatefulMeanSquaredLogError, StatefulMedianAbsoluteError, StatefulMSE, StatefulPSNR, StatefulR2Score,
+    StatefulRMSE, StatefulRMSLE
 )
 
 
@@ -67,3 +80,90 @@ def test_ssim():
     target = pred * 0.75
     score = ssim(pred, target)
     assert isinstance(score, torch.Tensor)
+
+
+@pytest.mark.parametrize(['metric_class', 'metric_fn'], [
+    pytest.param(StatefulMSE, mse),
+    pytest.param(StatefulRMSE, rmse),
+    pytest.param(StatefulMAE, mae),
+    pytest.param(StatefulRMSLE, rmsle),
+    pytest.param(StatefulPSNR, psnr),
+])
+@pytest.mark.parametrize('reduction', ['elementwise_mean', 'sum'])
+def test_stateful_regression_metrics(metric_class, metric_fn, reduction):
+    """ Test that accumulating over batches gives the same result as computing on all data at once """
+    torch.manual_seed(0)
+    preds = torch.rand(4, 8, 3)
+    targets = torch.rand(4, 8, 3)
+
+    metric = metric_class(reduction=reduction)
+    for pred, target in zip(preds, targets):
+        assert torch.allclose(metric(pred, target), metric_fn(pred, target, reduction=reduction))
+
+    assert torch.allclose(metric.compute(), metric_fn(preds, targets, reduction=reduction))
+
+    metric.reset()
+    assert metric.total == 0
+
+
+def test_stateful_regression_unsupported_reduction():
+    with pytest.raises(ValueError):
+        StatefulMSE(reduction='none')
+
+
+@pytest.mark.parametrize(['metric_class', 'sk_fn', 'positive'], [
+    pytest.param(StatefulExplainedVariance, sk_explained_variance, False),
+    pytest.param(StatefulR2Score, sk_r2_score, False),
+    pytest.param(StatefulMeanSquaredLogError, sk_mean_squared_log_error, True),
+    pytest.param(StatefulMeanPoissonDeviance, sk_mean_poisson_deviance, True),
+    pytest.param(StatefulMeanGammaDeviance, sk_mean_gamma_deviance, True),
+])
+def test_stateful_regression_against_sklearn(metric_class, sk_fn, positive):
+    """ Test that the scores accumulated over batches equal the sklearn score of all data """
+    torch.manual_seed(0)
+    preds = torch.rand(4, 25) + 0.1
+    targets = torch.rand(4, 25) + (0.1 if positive else -0.5)
+
+    metric = metric_class()
+    for pred, target in zip(preds, targets):
+        metric(pred, target)
+
+    expected = sk_fn(targets.flatten().numpy(), preds.flatten().numpy())
+    assert torch.allclose(metric.compute(), torch.tensor(expected, dtype=torch.float), atol=1e-6)
+
+
+@pytest.mark.parametrize('metric_class', [StatefulExplainedVariance, StatefulR2Score])
+@pytest.mark.parametrize('multioutput', ['raw_values', 'uniform_average', 'variance_weighted'])
+def test_stateful_variance_scores_multioutput(metric_class, multioutput):
+    torch.manual_seed(0)
+    preds = torch.rand(4, 25, 3)
+    targets = torch.rand(4, 25, 3) * torch.tensor([1., 2., 3.])
+
+    metric = metric_class(num_outputs=3, multioutput=multioutput)
+    for pred, target in zip(preds, targets):
+        metric(pred, target)
+
+    sk_fn = sk_r2_score if metric_class is StatefulR2Score else sk_explained_variance
+    expected = sk_fn(targets.flatten(0, 1).numpy(), preds.flatten(0, 1).numpy(), multioutput=multioutput)
+    assert torch.allclose(metric.compute(), torch.tensor(expected, dtype=torch.float), atol=1e-6)
+
+    with pytest.raises(ValueError):
+        metric_class(multioutput='mean')
+
+
+def test_stateful_median_absolute_error():
+    torch.manual_seed(0)
+    preds = torch.randn(4, 51)
+    targets = torch.randn(4, 51)
+
+    metric = StatefulMedianAbsoluteError(num_bins=4096, min_error=1e-6, max_error=1e6)
+    for pred, target in zip(preds, targets):
+        metric(pred, target)
+
+    # the histogram resolves the median up to half a bin
+    expected = sk_median_absolute_error(targets.flatten().numpy(), preds.flatten().numpy())
+    tolerance = (1e12 ** (1 / 4096)) ** 0.5 - 1
+    assert abs(metric.compute().item() / expected - 1) <= tolerance
+
+    metric.reset()
+    assert metric(torch.zeros(3), torch.zeros(3)) == 0
@@ -1,5 +1,6 @@
 import os
 import platform
+from contextlib import contextmanager
 from distutils.version import LooseVersion
 
 import pytest
@@ -7,7 +8,7 @@ import torch
 
 import tests.base.develop_pipelines as tpipes
 import tests.base.develop_utils as tutils
-from pytorch_lightning import Trainer
+from pytorch_lightning import Trainer, seed_everything
 from pytorch_lightning.callbacks import EarlyStopping
 from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning.core.step_result import TrainResult
@@ -132,6 +133,70 @@ def test_multi_cpu_model_ddp(tmpdir):
     tpipes.run_model_test(trainer_options, model, on_gpu=False)
 
 
+class AccumulationSyncModel(EvalModelTemplate):
+
+    # set to run with the gradients all-reduced by every backward pass
+    sync_every_batch = False
+
+    def on_after_backward(self):
+        # the gradients are only all-reduced on the batches which step the optimizer
+        trainer = self.trainer
+        should_step = (trainer.batch_idx + 1) % trainer.accumulate_grad_batches == 0 \
+            or (trainer.batch_idx + 1) == trainer.num_training_batches
+        assert trainer.model.require_backward_grad_sync == (should_step or self.sync_every_batch)
+
+    def configure_optimizers(self):
+        # the parameters follow the gradients linearly, so both runs end up with the same weights
+        return torch.optim.SGD(self.parameters(), lr=0.1)
+
+
+@contextmanager
+def _never_block_ddp_sync(should_block):
+    yield
+
+
+def _fit_ddp_cpu_accumulating(tmpdir, sync_every_batch):
+    tutils.set_random_master_port()
+    seed_everything(1234)
+    model = AccumulationSyncModel(drop_prob=0.)
+    model.sync_every_batch = sync_every_batch
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        progress_bar_refresh_rate=0,
+        max_epochs=1,
+        limit_train_batches=7,
+        limit_val_batches=1,
+        accumulate_grad_batches=3,
+        num_processes=2,
+        distributed_backend='ddp_cpu',
+    )
+    if sync_every_batch:
+        # the train loop is sent to the spawned processes, so they use this instead of `no_sync()`
+        trainer.train_loop.block_ddp_sync_behaviour = _never_block_ddp_sync
+    assert trainer.fit(model) == 1
+    return model
+
+
+@pytest.mark.skipif(platform.system() == "Windows",
+                    reason="Distributed training is not supported on Windows")
+@pytest.mark.skipif((platform.system() == "Darwin" and
+                     LooseVersion(torch.__version__) < LooseVersion("1.3.0")),
+                    reason="Distributed training is not supported on MacOS before Torch 1.3.0")
+def test_multi_cpu_model_ddp_accumulate_grad_batches(tmpdir):
+    """Make sure skipping the DDP gradient sync while accumulating trains the same weights as syncing every batch."""
+    seed_everything(1234)
+    initial_state = {k: v.clone() for k, v in AccumulationSyncModel(drop_prob=0.).state_dict().items()}
+
+    no_sync_model = _fit_ddp_cpu_accumulating(tmpdir / 'no_sync', sync_every_batch=False)
+    sync_model = _fit_ddp_cpu_accumulating(tmpdir / 'sync', sync_every_batch=True)
+
+    # the weights trained by the spawned processes were loaded back
+    assert any(not torch.equal(initial_state[name], param) for name, param in no_sync_model.named_parameters())
+    for (name, no_sync_param), sync_param in zip(no_sync_model.named_parameters(), sync_model.parameters()):
+        assert torch.allclose(no_sync_param, sync_param, atol=1e-6), name
+
+
 def test_lbfgs_cpu_model(tmpdir):
     """Test each of the trainer options."""
     trainer_options = dict(
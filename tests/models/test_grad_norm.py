@@ -2,6 +2,7 @@ import os
 
 import numpy as np
 import pytest
+import torch
 
 from pytorch_lightning import Trainer
 from tests.base import EvalModelTemplate
@@ -73,3 +74,21 @@ def test_grad_tracking(tmpdir, norm_type, rtol=5e-3):
         log, mod = [log[k] for k in common], [mod[k] for k in common]
 
         assert np.allclose(log, mod, rtol=rtol)
+
+
+def test_grad_norm_grouped_by_module():
+    reset_seed()
+
+    model = EvalModelTemplate()
+    x = torch.rand(2, model.in_features)
+    model(x).sum().backward()
+
+    per_param = model.grad_norm(2)
+    grouped = model.grad_norm(2, group_depth=1)
+
+    modules = {name.split('.')[0] for name, p in model.named_parameters() if p.grad is not None}
+    assert set(grouped) == {f'grad_2.0_norm_{m}' for m in modules} | {'grad_2.0_norm_total'}
+    assert np.isclose(grouped['grad_2.0_norm_total'], per_param['grad_2.0_norm_total'], rtol=5e-3)
+    for module in modules:
+        members = [v for k, v in per_param.items() if k.startswith(f'grad_2.0_norm_{module}.')]
+        assert np.isclose(grouped[f'grad_2.0_norm_{module}'], np.linalg.norm(members), rtol=5e-3)
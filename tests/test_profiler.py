@@ -1,11 +1,20 @@
+import json
 import os
+import threading
 import time
 from pathlib import Path
 
 import numpy as np
 import pytest
 
-from pytorch_lightning.profiler import AdvancedProfiler, SimpleProfiler
+from pytorch_lightning.profiler import (
+    AdvancedProfiler,
+    SimpleProfiler,
+    StreamingProfiler,
+    StepTimelineProfiler,
+    TraceProfiler,
+)
+from pytorch_lightning.profiler.profilers import DurationStats
 
 PROFILER_OVERHEAD_MAX_TOLERANCE = 0.0005
 
@@ -184,3 +193,182 @@ def test_advanced_profiler_value_errors(advanced_profiler):
 
     advanced_profiler.start(action)
     advanced_profiler.stop(action)
+
+
+@pytest.fixture
+def streaming_profiler():
+    profiler = StreamingProfiler()
+    return profiler
+
+
+@pytest.mark.parametrize(["action", "expected"], [
+    pytest.param("a", [3, 1]),
+    pytest.param("b", [2]),
+    pytest.param("c", [1])
+])
+def test_streaming_profiler_durations(streaming_profiler, action, expected):
+    """Ensure the aggregated durations are reasonably accurate."""
+
+    for duration in expected:
+        with streaming_profiler.profile(action):
+            time.sleep(duration)
+
+    stats = streaming_profiler.recorded_stats[action]
+    assert stats.count == len(expected)
+    np.testing.assert_allclose(stats.total, np.sum(expected), rtol=0.2)
+    np.testing.assert_allclose(stats.mean, np.mean(expected), rtol=0.2)
+    np.testing.assert_allclose(stats.max, np.max(expected), rtol=0.2)
+
+
+def test_duration_stats():
+    """Ensure the streaming statistics match the exact ones."""
+    durations = np.random.RandomState(0).lognormal(-5, 1, size=10000)
+    stats = DurationStats()
+    for duration in durations:
+        stats.add(duration)
+
+    assert len(stats.histogram) < 300
+    np.testing.assert_allclose(stats.total, durations.sum())
+    np.testing.assert_allclose(stats.mean, durations.mean())
+    np.testing.assert_allclose(stats.std, durations.std(ddof=1))
+    assert stats.min == durations.min() and stats.max == durations.max()
+    for q in (50, 90, 99):
+        np.testing.assert_allclose(stats.percentile(q), np.percentile(durations, q), rtol=0.05)
+
+
+def test_streaming_profiler_describe(caplog, streaming_profiler):
+    """Ensure the profiler won't fail when reporting the summary."""
+    with streaming_profiler.profile("test"):
+        pass
+    streaming_profiler.describe()
+
+    assert "Profiler Report" in caplog.text
+    assert set(streaming_profiler.metrics()) == {
+        f"profiler/test/{name}" for name in ("mean", "p50", "p90", "p99", "max")
+    }
+
+
+def test_streaming_profiler_value_errors(streaming_profiler):
+    """Ensure errors are raised where expected."""
+
+    action = "test"
+    with pytest.raises(ValueError):
+        streaming_profiler.stop(action)
+
+    streaming_profiler.start(action)
+
+    with pytest.raises(ValueError):
+        streaming_profiler.start(action)
+
+    streaming_profiler.stop(action)
+
+
+def test_step_timeline_profiler_exclusive_durations(simple_profiler):
+    """Ensure nested actions are only counted once and all actions reach the wrapped profiler."""
+    profiler = StepTimelineProfiler(simple_profiler)
+    profiler.reset_step()
+
+    with profiler.profile("model_forward"):
+        time.sleep(0.2)
+        with profiler.profile("training_step_end"):
+            time.sleep(0.1)
+    with profiler.profile("model_backward"):
+        time.sleep(0.1)
+    time.sleep(0.1)
+
+    step = profiler.end_step()
+    np.testing.assert_allclose(
+        [step["forward"], step["hooks"], step["backward"], step["other"], step["total"]],
+        [0.2, 0.1, 0.1, 0.1, 0.5],
+        rtol=0.2
+    )
+    assert step["data_wait"] == 0
+    assert sum(step[category] for category in StepTimelineProfiler.CATEGORIES) == pytest.approx(step["total"])
+    assert set(simple_profiler.recorded_durations) == {"model_forward", "training_step_end", "model_backward"}
+
+    # the next step starts empty
+    step = profiler.end_step()
+    assert step["forward"] == 0
+
+
+def test_step_timeline_profiler_splits_running_actions():
+    """Ensure an action running over the end of a step is split between both steps."""
+    profiler = StepTimelineProfiler()
+    profiler.reset_step()
+
+    profiler.start("get_train_batch")
+    time.sleep(0.1)
+    first = profiler.end_step()
+    time.sleep(0.1)
+    profiler.stop("get_train_batch")
+    second = profiler.end_step()
+
+    np.testing.assert_allclose([first["data_wait"], second["data_wait"]], [0.1, 0.1], rtol=0.2)
+
+    with pytest.raises(ValueError):
+        profiler.stop("get_train_batch")
+
+
+@pytest.fixture
+def trace_profiler(tmpdir):
+    profiler = TraceProfiler(output_filename=os.path.join(tmpdir, "trace.json"))
+    return profiler
+
+
+def test_trace_profiler_events(trace_profiler):
+    """Ensure every action becomes a complete event with its thread and nesting depth."""
+    with trace_profiler.profile("a"):
+        time.sleep(0.1)
+        with trace_profiler.profile("b"):
+            time.sleep(0.1)
+
+    thread = threading.Thread(target=_profile_action, args=(trace_profiler, "c"), name="other")
+    thread.start()
+    thread.join()
+
+    events = {e["name"]: e for e in trace_profiler.trace_events() if e["ph"] == "X"}
+    assert set(events) == {"a", "b", "c"}
+    assert events["a"]["args"]["depth"] == 0
+    assert events["b"]["args"]["depth"] == 1
+    np.testing.assert_allclose([events["a"]["dur"], events["b"]["dur"]], [2e5, 1e5], rtol=0.2)
+    assert events["a"]["ts"] <= events["b"]["ts"] <= events["a"]["ts"] + events["a"]["dur"]
+    assert events["a"]["tid"] == events["b"]["tid"] != events["c"]["tid"]
+
+    thread_names = [e["args"]["name"] for e in trace_profiler.trace_events() if e["name"] == "thread_name"]
+    assert "other" in thread_names
+
+
+def _profile_action(profiler, action):
+    with profiler.profile(action):
+        pass
+
+
+def test_trace_profiler_ring_buffer(tmpdir):
+    """Ensure the oldest events are dropped once the buffer is full."""
+    profiler = TraceProfiler(output_filename=os.path.join(tmpdir, "trace.json"), capacity=3)
+    for action in ["a", "b", "c", "d", "e"]:
+        with profiler.profile(action):
+            pass
+
+    assert profiler.num_events == 3
+    assert profiler.num_dropped == 2
+    assert [e["name"] for e in profiler.trace_events() if e["ph"] == "X"] == ["c", "d", "e"]
+
+
+def test_trace_profiler_describe(tmpdir, trace_profiler):
+    """Ensure the trace is written per rank and traces can be merged."""
+    for _ in trace_profiler.profile_iterable(_sleep_generator([0.01, 0.01]), "get_train_batch"):
+        pass
+    trace_profiler.describe()
+
+    trace_file = os.path.join(tmpdir, "trace_rank0.json")
+    assert trace_profiler.trace_filename == trace_file
+    with open(trace_file) as fp:
+        trace = json.load(fp)
+    assert len([e for e in trace["traceEvents"] if e["name"] == "get_train_batch"]) == 3
+
+    merged_file = os.path.join(tmpdir, "merged.json")
+    TraceProfiler.merge([trace_file, trace_file], merged_file)
+    with open(merged_file) as fp:
+        merged = json.load(fp)
+    assert len(merged["traceEvents"]) == 2 * len(trace["traceEvents"])
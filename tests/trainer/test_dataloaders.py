@@ -11,6 +11,7 @@ from torch.utils.data.distributed import DistributedSampler
 
 import tests.base.develop_pipelines as tpipes
 from pytorch_lightning import Trainer, Callback
+from pytorch_lightning.trainer.supporters import BatchPrefetcher, PersistentDataLoaderIterator
 from pytorch_lightning.utilities.data import has_iterable_dataset, has_len
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.base import EvalModelTemplate
@@ -1108,3 +1109,130 @@ def test_dataloaders_load_every_epoch(tmpdir):
     ]
     for call, expected in zip(calls, expected_sequence):
         assert call['name'] == expected
+
+
+@pytest.mark.parametrize('device', [
+    pytest.param(None),
+    pytest.param('cuda:0', marks=pytest.mark.skipif(not torch.cuda.is_available(), reason="test requires GPU machine")),
+])
+def test_batch_prefetcher(device):
+    """Test that the prefetcher yields all batches in order and can be left early."""
+    batches = [torch.full((2, 3), i) for i in range(10)]
+
+    prefetched = list(BatchPrefetcher(batches, depth=3, device=device))
+    assert len(prefetched) == len(batches)
+    for batch, expected in zip(prefetched, batches):
+        assert torch.equal(batch.cpu(), expected)
+        if device is not None:
+            assert batch.device == torch.device(device)
+
+    iterator = iter(BatchPrefetcher(batches, depth=2))
+    assert torch.equal(next(iterator), batches[0])
+    iterator.close()
+
+
+def test_batch_prefetcher_error():
+    """Test that errors of the dataloader are raised to the consumer."""
+
+    def failing_loader():
+        yield torch.zeros(1)
+        raise RuntimeError('loading failed')
+
+    iterator = iter(BatchPrefetcher(failing_loader()))
+    next(iterator)
+    with pytest.raises(RuntimeError, match='loading failed'):
+        next(iterator)
+
+
+def test_fit_with_prefetch_batches(tmpdir):
+    """Test that training and evaluation run with prefetched batches."""
+    model = EvalModelTemplate()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=5,
+        limit_val_batches=3,
+        prefetch_batches=2,
+    )
+    assert trainer.fit(model) == 1
+    assert trainer.global_step == 5
+
+
+def test_persistent_dataloader_iterator():
+    """Test that the workers are reused across passes and that each pass yields the same limited batches."""
+    dataloader = DataLoader(list(range(10)), batch_size=2, num_workers=2)
+    assert PersistentDataLoaderIterator.is_supported(dataloader, 3)
+    assert not PersistentDataLoaderIterator.is_supported(DataLoader(list(range(10))), 3)
+
+    persistent = PersistentDataLoaderIterator(dataloader, num_batches=3)
+    assert len(persistent) == 3
+    first_pass = [batch.tolist() for batch in persistent]
+    iterator = persistent._iterator
+    second_pass = [batch.tolist() for batch in persistent]
+    assert first_pass == second_pass == [[0, 1], [2, 3], [4, 5]]
+    assert persistent._iterator is iterator
+
+    # leaving a pass early starts over with new workers
+    for _ in persistent:
+        break
+    assert persistent._iterator is None
+    assert [batch.tolist() for batch in persistent] == first_pass
+
+    workers = persistent._iterator._workers
+    persistent.close()
+    assert persistent._iterator is None
+    assert not any(worker.is_alive() for worker in workers)
+
+
+def test_persistent_dataloader_iterator_rebuild():
+    """Test that the multiprocessing context is kept and that loaders which can't be rebuilt are used as they are."""
+    dataloader = DataLoader(list(range(10)), batch_size=2, num_workers=1, multiprocessing_context='spawn')
+    persistent = PersistentDataLoaderIterator(dataloader, num_batches=2)
+    assert persistent._loader.multiprocessing_context is dataloader.multiprocessing_context
+
+    class CustomDataLoader(DataLoader):
+        def __init__(self, data):
+            super().__init__(data, batch_size=2, num_workers=1)
+
+    dataloader = CustomDataLoader(list(range(10)))
+    with pytest.warns(UserWarning, match='can not be re-instantiated'):
+        persistent = PersistentDataLoaderIterator(dataloader, num_batches=2)
+    assert persistent._loader is None
+    assert [batch.tolist() for batch in persistent][:2] == [[0, 1], [2, 3]]
+    persistent.close()
+
+
+@pytest.mark.parametrize('persistent_workers', [False, True])
+def test_fit_with_persistent_dataloader_workers(tmpdir, persistent_workers):
+    """Test that training and repeated validation runs work with persistent workers, which are shut down after fit."""
+    model = EvalModelTemplate()
+    train_dataloader = model.train_dataloader()
+    train_dataloader = DataLoader(train_dataloader.dataset, batch_size=train_dataloader.batch_size, num_workers=1)
+    val_dataloader = model.val_dataloader()
+    val_dataloader = DataLoader(val_dataloader.dataset, batch_size=val_dataloader.batch_size, num_workers=1)
+
+    class PersistentCheck(Callback):
+        def on_validation_end(self, trainer, pl_module):
+            if trainer.running_sanity_check:
+                return
+            persistent_train = trainer.train_loop._persistent_train_dataloader
+            persistent_val = trainer.evaluation_loop._persistent_dataloaders.get((False, 0))
+            if persistent_workers:
+                assert persistent_train.dataloader is train_dataloader
+                assert persistent_val.num_batches == 2
+            else:
+                assert persistent_train is None and persistent_val is None
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=2,
+        limit_train_batches=4,
+        limit_val_batches=2,
+        val_check_interval=0.5,
+        persistent_workers=persistent_workers,
+        callbacks=[PersistentCheck()],
+    )
+    assert trainer.fit(model, train_dataloader=train_dataloader, val_dataloaders=val_dataloader) == 1
+    assert trainer.global_step == 8
+    assert trainer.train_loop._persistent_train_dataloader is None
+    assert trainer.evaluation_loop._persistent_dataloaders == {}
@@ -255,3 +255,49 @@ def test_configure_optimizers_with_frequency(tmpdir):
     )
     result = trainer.fit(model)
     assert result
+
+
+def test_multiple_optimizers_toggle_params(tmpdir):
+    """
+    Test that each optimizer only trains its own parameters and parameters frozen by the user stay frozen.
+    """
+    class TestModel(EvalModelTemplate):
+
+        def __init__(self):
+            super().__init__()
+            self.c_d1_bn.weight.requires_grad = False
+            self.seen_requires_grad = set()
+
+        def training_step(self, batch, batch_idx, optimizer_idx=None):
+            self.seen_requires_grad.add((
+                optimizer_idx,
+                self.c_d1.weight.requires_grad,
+                self.c_d2.weight.requires_grad,
+                self.c_d1_bn.weight.requires_grad,
+            ))
+            return super().training_step(batch, batch_idx, optimizer_idx)
+
+        def configure_optimizers(self):
+            optimizer1 = torch.optim.Adam(self.c_d1.parameters(), lr=self.learning_rate)
+            optimizer2 = torch.optim.Adam(
+                list(self.c_d2.parameters()) + list(self.c_d1_bn.parameters()), lr=self.learning_rate
+            )
+            return optimizer1, optimizer2
+
+    model = TestModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=4,
+        limit_val_batches=1,
+        weights_summary=None,
+    )
+    result = trainer.fit(model)
+    assert result == 1
+
+    assert model.seen_requires_grad == {(0, True, False, False), (1, False, True, False)}
+
+    # all parameters but the frozen one are trainable again after training
+    assert model.c_d1.weight.requires_grad
+    assert model.c_d2.weight.requires_grad
+    assert not model.c_d1_bn.weight.requires_grad
@@ -1126,3 +1126,41 @@ def test_trainer_setup_call(tmpdir):
     trainer.test(ckpt_path=None)
     assert trainer.stage == 'test'
     assert trainer.get_model().stage == 'test'
+
+
+def test_call_hook_dispatch(tmpdir):
+    """Test that hooks are resolved once and re-resolved when the callbacks change."""
+
+    class HookCounter(Callback):
+
+        def __init__(self):
+            self.count = 0
+
+        def on_train_batch_start(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+            self.count += 1
+
+    model = EvalModelTemplate()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=3,
+        limit_val_batches=1,
+        progress_bar_refresh_rate=0,
+        checkpoint_callback=False,
+    )
+    trainer.fit(model)
+
+    # no callback implements the hook, the trainer hook is skipped
+    trainer_hook, callback_hooks, module_hook = trainer._resolve_hook('on_train_batch_start')
+    assert trainer_hook is None
+    assert callback_hooks == ()
+    assert trainer._resolve_hook('on_train_batch_start') is trainer._hook_dispatch['on_train_batch_start']
+
+    # only the callbacks implementing the hook are called
+    counter = HookCounter()
+    trainer.callbacks.append(counter)
+    trainer_hook, callback_hooks, _ = trainer._resolve_hook('on_train_batch_start')
+    assert trainer_hook is None
+    assert [hook.func for hook in callback_hooks] == [counter.on_train_batch_start]
+    trainer.call_hook('on_train_batch_start', None, 0, 0)
+    assert counter.count == 1
@@ -1,3 +1,4 @@
+import math
 from copy import deepcopy
 import pytest
 import torch
@@ -318,3 +319,85 @@ def test_auto_scale_batch_size_with_amp(tmpdir):
     assert trainer.amp_backend == AMPType.NATIVE
     assert trainer.scaler is not None
     assert batch_size_after != batch_size_before
+
+
+def test_tune_dataloader(tmpdir):
+    """ Test that the dataloader tuner measures every candidate and keeps the model and trainer unchanged. """
+    tutils.reset_seed()
+
+    model = EvalModelTemplate()
+    before_state_dict = deepcopy(model.state_dict())
+
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1)
+    tuner = trainer.tuner.tune_dataloader(
+        model, num_batches=5, num_warmup_batches=2, num_workers=[0, 1], prefetch_batches=[0, 1]
+    )
+
+    # workers are searched first, then memory pinning (not on CPU) and prefetching with the best workers
+    configs = [result['config'] for result in tuner.results]
+    assert configs[:2] == [
+        dict(num_workers=0, pin_memory=False, prefetch_batches=0),
+        dict(num_workers=1, pin_memory=False, prefetch_batches=0),
+    ]
+    best_workers = configs[2]['num_workers']
+    assert configs[2:] == [dict(num_workers=best_workers, pin_memory=False, prefetch_batches=1)]
+    assert all(result['batches_per_sec'] > 0 for result in tuner.results)
+    assert all(0 <= result['data_fraction'] <= 1 for result in tuner.results)
+
+    assert trainer.max_steps is None
+    assert trainer.limit_val_batches == 1.0
+    assert trainer.auto_tune_dataloader is False
+    assert set(trainer.train_dataloader_kwargs) == {'num_workers', 'pin_memory'}
+    assert trainer.prefetch_batches in (0, 1)
+
+    after_state_dict = model.state_dict()
+    for key in before_state_dict.keys():
+        assert torch.all(torch.eq(before_state_dict[key], after_state_dict[key])), \
+            'Model was not reset correctly after tuning the dataloader'
+
+    # the next fit re-creates the train dataloader with the tuned settings
+    trainer.fit(model)
+    assert trainer.train_dataloader.num_workers == trainer.train_dataloader_kwargs['num_workers']
+
+
+@pytest.mark.parametrize('value', [math.nan, math.inf])
+def test_nan_params_detection_single_sync(tmpdir, value):
+    """ Test that the check of all weights at once still names the parameter which is not finite """
+
+    class CurrentModel(EvalModelTemplate):
+        test_batch_nan = 3
+
+        def on_after_backward(self):
+            if self.global_step == self.test_batch_nan:
+                # only a single element of a later parameter is not finite
+                with torch.no_grad():
+                    self.c_d2.weight[1, 2] = value
+
+    model = CurrentModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_steps=(model.test_batch_nan + 1),
+        terminate_on_nan=True,
+    )
+
+    with pytest.raises(ValueError, match=r'.*Detected nan and/or inf values in `c_d2.weight`.*'):
+        trainer.fit(model)
+    assert trainer.global_step == model.test_batch_nan
+
+
+def test_detect_nan_tensors(tmpdir):
+    """ Test that the loss is reported before the weights and the first non-finite parameter is named """
+    model = EvalModelTemplate()
+    trainer = Trainer(default_root_dir=tmpdir)
+    trainer.model = model
+
+    # all finite
+    trainer.detect_nan_tensors(torch.tensor(1.))
+
+    with torch.no_grad():
+        model.c_d2.bias[0] = math.inf
+        model.c_d1.bias[0] = math.nan
+    with pytest.raises(ValueError, match=r'.*The loss returned in `training_step` is nan or inf.*'):
+        trainer.detect_nan_tensors(torch.tensor(math.nan))
+    with pytest.raises(ValueError, match=r'.*Detected nan and/or inf values in `c_d1.bias`.*'):
+        trainer.detect_nan_tensors(torch.tensor(1.))
@@ -0,0 +1,22 @@
+import pytest
+import torch
+
+from pytorch_lightning.utilities.grads import tensor_norms, total_norm
+
+
+@pytest.mark.parametrize("norm_type", [1., 2., 3.5, float('inf')])
+def test_tensor_norms(norm_type):
+    tensors = [torch.randn(3, 4), torch.randn(7), torch.randn(2, 2, 2)]
+
+    norms = tensor_norms(tensors, norm_type)
+    expected = torch.stack([t.norm(norm_type) for t in tensors])
+    assert torch.allclose(norms, expected)
+
+    flat = torch.cat([t.flatten() for t in tensors])
+    assert torch.allclose(total_norm(norms, norm_type), flat.norm(norm_type))
+
+
+def test_tensor_norms_empty():
+    norms = tensor_norms([], 2.)
+    assert norms.numel() == 0
+    assert total_norm(norms, 2.) == 0